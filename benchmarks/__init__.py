@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Hamming SEC-DED performans ölçümleri
+
+Depo kök dizininden çalıştırılır:
+    python -m benchmarks.codec_bench
+"""
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Codec verim ve gecikme ölçümleri
+
+Her kod yapısı (Hamming, Hsiao), genişlik, motor, işlem ve girdi türü (temiz,
+tek hatalı, çift hatalı) için saniyedeki kelime sayısı ile çağrı başına p50/p99
+gecikme ölçülür.
+Sonuçlar, koşular arasında fark alınabilsin diye düz anahtarlı JSON olarak
+yazılır:
+
+    "<kip>/<işlem>/<kod>/<motor>/<genişlik>/<girdi>": {
+        "words_per_sec": ..., "p50_ns": ..., "p99_ns": ..., ...
+    }
+
+Derlenmiş (hamming_codegen) tekil yollar '<motor>-compiled' adıyla ölçülür;
+bit dilimli (hamming_bitslice) toplu yol 'encode_bitslice'/'decode_bitslice'
+işlemleridir.
+
+Tekil (scalar) ölçümlerde her örnek birkaç ardışık çağrının ortalamasıdır
+(zamanlayıcı yükünü dağıtmak için); toplu (batch) ölçümlerde her örnek tek
+bir toplu çağrıdır ve gecikme o çağrının süresidir.
+
+Her ölçüm --runs kez tekrarlanır; raporlanan verim tekrarların medyanıdır ve
+tekrarların medyandan en büyük göreli sapması 'spread' olarak kaydedilir.
+Kayıtlı bir temel çizgiye (baseline) göre karşılaştırmada eşik, tolerans
+artı temel çizginin ve güncel koşunun saçılımıdır; medyan verimi bu eşikten
+fazla düşen ölçümler gerileme olarak raporlanır ve çıkış kodu 1 olur.
+
+Verim makineye bağlı olduğundan temel çizgi depoya konmaz. CI aynı koşucuda
+önce hedef dalı, sonra değişikliği ölçer:
+    git checkout main && python -m benchmarks.codec_bench --quick --save-baseline baseline.json
+    git checkout - && python -m benchmarks.codec_bench --quick --baseline baseline.json
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.codec_bench --output run.json
+    python -m benchmarks.codec_bench --save-baseline baseline.json
+    python -m benchmarks.codec_bench --baseline baseline.json --tolerance 0.15
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+from hamming_codec import CODES, ENGINES, get_codec
+from hamming_batch import int_to_limbs, limb_count
+from hamming_bitslice import BitsliceBatch
+
+# Varsayılan ölçüm genişlikleri
+DEFAULT_WIDTHS = (8, 16, 32, 64)
+
+# Girdi türleri: kelime başına enjekte edilen hata sayısı
+INPUT_KINDS = (('clean', 0), ('single', 1), ('double', 2))
+
+# Tekil ölçümde örnek başına çağrı ve toplu ölçümde parti boyutu
+SCALAR_INNER = 16
+SCALAR_INPUTS = 4096
+BATCH_SIZE = 1 << 16
+
+# Varsayılan gerileme toleransı (saçılıma eklenen göreli verim düşüşü)
+DEFAULT_TOLERANCE = 0.10
+
+# Ölçüm başına varsayılan tekrar (medyan alınır)
+DEFAULT_RUNS = 5
+
+def make_inputs(codec, count, seed):
+    """
+    Ölçüm girdilerini üretir
+    
+    Returns:
+        dict: {'data': veri listesi, 'clean'/'single'/'double': kodlanmış kelime listeleri}
+    """
+    rng = random.Random(seed)
+    data = [rng.getrandbits(codec.data_bits) for _ in range(count)]
+    encoded = [codec.encode(value) for value in data]
+    inputs = {'data': data}
+    for kind, errors in INPUT_KINDS:
+        words = []
+        for codeword in encoded:
+            for position in rng.sample(range(codec.total_bits), errors):
+                codeword ^= 1 << position
+            words.append(codeword)
+        inputs[kind] = words
+    return inputs
+
+def as_batch(values, bits):
+    """Python tam sayı listesini encode_batch/decode_batch düzenine çevirir"""
+    limbs = limb_count(bits)
+    if limbs == 1:
+        return np.array(values, dtype=np.uint64)
+    return np.array([int_to_limbs(value, limbs) for value in values], dtype=np.uint64)
+
+def summarize(samples, words_per_sample):
+    """
+    Örnek sürelerinden (ns) verim ve gecikme yüzdeliklerini hesaplar
+    
+    Args:
+        samples (list): Örnek başına geçen süre (ns)
+        words_per_sample (int): Örnek başına işlenen kelime
+    
+    Returns:
+        dict: words_per_sec, p50_ns, p99_ns, samples
+    """
+    times = np.array(samples, dtype=np.float64)
+    return {
+        'words_per_sec': round(words_per_sample * len(times) / (times.sum() / 1e9), 1),
+        'p50_ns': round(float(np.percentile(times, 50)), 1),
+        'p99_ns': round(float(np.percentile(times, 99)), 1),
+        'samples': len(times)
+    }
+
+def bench_scalar(function, values, repeat):
+    """
+    Tekil çağrıları ölçer: her örnek SCALAR_INNER ardışık çağrının ortalamasıdır
+    
+    Returns:
+        dict: summarize() sonucu (gecikme çağrı başına)
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    count = len(values)
+    for r in range(repeat):
+        start = (r * SCALAR_INNER) % (count - SCALAR_INNER + 1)
+        group = values[start:start + SCALAR_INNER]
+        t0 = clock()
+        for value in group:
+            function(value)
+        samples.append((clock() - t0) / SCALAR_INNER)
+    return summarize(samples, 1)
+
+def bench_batch(function, words, repeat):
+    """
+    Toplu çağrıları ölçer: her örnek tek bir toplu çağrıdır
+    
+    Returns:
+        dict: summarize() sonucu (gecikme toplu çağrı başına)
+    """
+    clock = time.perf_counter_ns
+    function(words)
+    samples = []
+    for _ in range(repeat):
+        t0 = clock()
+        function(words)
+        samples.append(clock() - t0)
+    result = summarize(samples, len(words))
+    result['batch_size'] = len(words)
+    return result
+
+def repeated(runs, bench, *args):
+    """
+    Bir ölçümü 'runs' kez tekrarlar
+    
+    Returns:
+        dict: Medyan verimli tekrarın sonucu; ayrıca words_per_sec_runs (tüm
+              tekrarların verimi) ve spread (medyandan en büyük göreli sapma)
+    """
+    outcomes = sorted((bench(*args) for _ in range(runs)), key=lambda result: result['words_per_sec'])
+    result = dict(outcomes[len(outcomes) // 2])
+    rates = [outcome['words_per_sec'] for outcome in outcomes]
+    median = float(np.median(rates))
+    result['words_per_sec'] = round(median, 1)
+    result['words_per_sec_runs'] = rates
+    result['spread'] = round(max(abs(rate - median) for rate in rates) / median, 4)
+    return result
+
+def bench_scalar_ops(codec, inputs, prefix, repeat, results, runs=1):
+    """Tekil encode, detect_and_correct ve decode ölçümlerini sonuçlara ekler"""
+    results[f"scalar/encode/{prefix}/data"] = repeated(runs, bench_scalar, codec.encode, inputs['data'], repeat)
+    for kind, _ in INPUT_KINDS:
+        results[f"scalar/detect_and_correct/{prefix}/{kind}"] = repeated(
+            runs, bench_scalar, codec.detect_and_correct, inputs[kind], repeat)
+        results[f"scalar/decode/{prefix}/{kind}"] = repeated(
+            runs, bench_scalar, codec.decode, inputs[kind], repeat)
+
+def run(widths=DEFAULT_WIDTHS, engines=ENGINES, repeat=2000, batch_repeat=20,
+        batch_size=BATCH_SIZE, seed=1, codes=CODES, runs=DEFAULT_RUNS):
+    """
+    Tüm ölçümleri çalıştırır
+    
+    Args:
+        widths (tuple): Veri bit uzunlukları
+        engines (tuple): Kodlama motorları
+        repeat (int): Tekil ölçüm başına örnek sayısı
+        batch_repeat (int): Toplu ölçüm başına örnek sayısı
+        batch_size (int): Toplu çağrı başına kelime
+        seed (int): Girdi tohumu
+        codes (tuple): Kod yapıları
+        runs (int): Ölçüm başına tekrar (medyan alınır)
+    
+    Returns:
+        dict: 'meta' ve 'results' anahtarlı ölçüm raporu
+    """
+    results = {}
+    for width in widths:
+        for engine in engines:
+            for code in codes:
+                codec = get_codec(width, engine, code)
+                inputs = make_inputs(codec, SCALAR_INPUTS, seed)
+                prefix = f"{code}/{engine}/{width}"
+                bench_scalar_ops(codec, inputs, prefix, repeat, results, runs)
+                
+                # Derlenmiş (düz çizgi) fonksiyonlar yalnızca tekil yolu değiştirir
+                compiled = get_codec(width, engine, code, compiled=True)
+                bench_scalar_ops(compiled, inputs, f"{code}/{engine}-compiled/{width}", repeat, results, runs)
+                
+                batch_inputs = make_inputs(codec, batch_size, seed)
+                data = as_batch(batch_inputs['data'], codec.data_bits)
+                results[f"batch/encode_batch/{prefix}/data"] = repeated(
+                    runs, bench_batch, codec.encode_batch, data, batch_repeat)
+                for kind, _ in INPUT_KINDS:
+                    words = as_batch(batch_inputs[kind], codec.total_bits)
+                    results[f"batch/decode_batch/{prefix}/{kind}"] = repeated(
+                        runs, bench_batch, codec.decode_batch, words, batch_repeat)
+    
+                # NumPy gerektirmeyen bit dilimli yol Python listeleriyle çalışır
+                bitslice = BitsliceBatch(codec)
+                results[f"batch/encode_bitslice/{prefix}/data"] = repeated(
+                    runs, bench_batch, bitslice.encode, batch_inputs['data'], batch_repeat)
+                for kind, _ in INPUT_KINDS:
+                    results[f"batch/decode_bitslice/{prefix}/{kind}"] = repeated(
+                        runs, bench_batch, bitslice.decode, batch_inputs[kind], batch_repeat)
+    
+    meta = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'batch_repeat': batch_repeat,
+        'batch_size': batch_size,
+        'seed': seed,
+        'runs': runs
+    }
+    return {'meta': meta, 'results': results}
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Raporu temel çizgiyle karşılaştırır
+    
+    Ölçüm başına eşik: tolerans + temel çizginin saçılımı + güncel saçılım.
+    Saçılımı olmayan (tek tekrarlı) kayıtlarda saçılım 0 sayılır.
+    
+    Args:
+        report (dict): run() sonucu
+        baseline (dict): Kayıtlı run() sonucu
+        tolerance (float): Saçılıma eklenen göreli verim düşüşü
+    
+    Returns:
+        list: (anahtar, temel verim, güncel verim, oran, eşik) gerileme listesi
+    """
+    regressions = []
+    for key, current in report['results'].items():
+        previous = baseline.get('results', {}).get(key)
+        if previous is None:
+            continue
+        ratio = current['words_per_sec'] / previous['words_per_sec']
+        threshold = tolerance + previous.get('spread', 0.0) + current.get('spread', 0.0)
+        if ratio < 1.0 - threshold:
+            regressions.append((key, previous['words_per_sec'], current['words_per_sec'], ratio, threshold))
+    return regressions
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED codec verim ve gecikme ölçümleri")
+    parser.add_argument('--widths', type=int, nargs='+', default=list(DEFAULT_WIDTHS), help="Veri bit uzunlukları")
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=ENGINES, help="Kodlama motorları")
+    parser.add_argument('--codes', nargs='+', default=list(CODES), choices=CODES, help="Kod yapıları")
+    parser.add_argument('--repeat', type=int, default=2000, help="Tekil ölçüm başına örnek")
+    parser.add_argument('--batch-repeat', type=int, default=20, help="Toplu ölçüm başına örnek")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help="Toplu çağrı başına kelime")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help="Ölçüm başına tekrar (medyan alınır)")
+    parser.add_argument('--quick', action='store_true', help="Az örnekle hızlı koşu")
+    parser.add_argument('--output', help="JSON raporunun yazılacağı dosya (varsayılan: standart çıktı)")
+    parser.add_argument('--baseline', help="Karşılaştırılacak temel çizgi JSON dosyası")
+    parser.add_argument('--save-baseline', help="Raporu temel çizgi olarak bu dosyaya kaydet")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Saçılıma eklenen göreli verim düşüşü")
+    args = parser.parse_args(argv)
+    
+    if args.quick:
+        args.repeat, args.batch_repeat, args.batch_size = 200, 5, 4096
+    
+    report = run(tuple(args.widths), tuple(args.engines), args.repeat,
+                 args.batch_repeat, args.batch_size, codes=tuple(args.codes), runs=args.runs)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            f.write(text + '\n')
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for field in ('machine', 'python', 'numpy'):
+            if baseline.get('meta', {}).get(field) != report['meta'][field]:
+                print(f"Uyarı: temel çizgi farklı bir ortamda ölçülmüş ({field})", file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        for key, previous, current, ratio, threshold in regressions:
+            print(f"GERİLEME {key}: {previous:.0f} -> {current:.0f} kelime/sn "
+                  f"({ratio:.2f}x, eşik {1.0 - threshold:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"Gerileme yok ({len(report['results'])} ölçüm)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
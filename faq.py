@@ -83,7 +83,7 @@ class FAQDialog(QDialog):
         Seçilen bit uzunluğundan daha büyük veriler otomatik olarak kesilir.</p>
         
         <h3>3. Bellek Adresi</h3>
-        <p>Verinizin yazılacağı bellek adresini seçin (0-1023 arası).</p>
+        <p>Verinizin yazılacağı bellek adresini seçin (0-1048575 arası). Bit uzunluğu değiştirildiğinde bellek sıfırlanır.</p>
         
         <h3>4. Kodlama ve Belleğe Yazma</h3>
         <p>"Kodla ve Belleğe Yaz" düğmesine tıklayarak veriyi Hamming SEC-DED algoritması ile kodlayın 
@@ -123,7 +123,7 @@ class FAQDialog(QDialog):
         <ul>
             <li><b>Adres</b>: Bellek adresi</li>
             <li><b>Kodlanmış Veri</b>: Hamming kodu ile kodlanmış veri (onaltılık)</li>
-            <li><b>Orijinal Veri</b>: Kodlanmadan önceki orijinal veri (onaltılık)</li>
+            <li><b>Orijinal Veri</b>: Kelimenin kod çözümünden elde edilen veri (onaltılık)</li>
         </ul>
         
         <h3>İşlem Geçmişi</h3>
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hamming SEC-DED için NumPy tabanlı toplu (vektörel) kodlama ve kod çözme
+
+Kelimeler uint64 dizileri olarak işlenir. Kodlanmış kelimesi 64 bitten geniş
+olan codec'lerde her kelime, küçük uçlu (little-endian) 64 bitlik parçalardan
+(limb) oluşan bir satırdır: dizi şekli (N, parça sayısı) olur.
+
+Kod doğrusal olduğundan her işlem bayt şeridi başına 256 girişlik tablolara
+yapılan vektörel aramaların XOR'udur:
+    - kodlama: veri baytı -> kodlanmış kelime katkısı
+    - sendrom: kodlanmış kelime baytı -> sendrom tablosu indeksi katkısı
+    - veri çıkarma: kodlanmış kelime baytı -> veri katkısı
+"""
+
+import numpy as np
+
+from hamming_codec import ERROR_NONE, ERROR_SINGLE, ERROR_DOUBLE, ERROR_UNKNOWN
+
+# Toplu tablolar kod yerleşimine göre önbelleğe alınır: {CodecLayout: BatchTables}
+_BATCH_CACHE = {}
+
+def limb_count(bits):
+    """Verilen bit sayısını tutmak için gereken 64 bitlik parça sayısı"""
+    return (bits + 63) // 64
+
+def int_to_limbs(value, limbs):
+    """Python tam sayısını küçük uçlu 64 bitlik parçalara böler"""
+    return [(value >> (64 * i)) & 0xFFFFFFFFFFFFFFFF for i in range(limbs)]
+
+def limbs_to_int(row):
+    """64 bitlik parçalardan (küçük uçlu) Python tam sayısını oluşturur"""
+    value = 0
+    for i, limb in enumerate(row):
+        value |= int(limb) << (64 * i)
+    return value
+
+def as_words(values, limbs):
+    """
+    Girdiyi (N, parça) şekilli, bitişik, küçük uçlu uint64 dizisine çevirir
+    
+    Tek parçalı kelimelerde 1 boyutlu (N,) diziler de kabul edilir.
+    """
+    array = np.ascontiguousarray(values, dtype='<u8')
+    if array.ndim == 1 and limbs == 1:
+        array = array.reshape(-1, 1)
+    if array.ndim != 2 or array.shape[1] != limbs:
+        raise ValueError(f"Dizi şekli (N, {limbs}) olmalıdır, {array.shape} verildi")
+    return array
+
+def _byte_lanes(words, lanes):
+    """(N, parça) uint64 dizisinin ilk 'lanes' baytını (N, lanes) olarak döndürür"""
+    return words.view(np.uint8).reshape(words.shape[0], -1)[:, :lanes]
+
+def _squeeze(table, limbs):
+    """Tek parçalı tablolarda son ekseni atar (1 boyutlu arama daha hızlıdır)"""
+    return table[..., 0] if limbs == 1 else table
+
+class DecodeStats:
+    def __init__(self):
+        """Kod çözme sırasında kelime durumlarının sayaçları"""
+        self.words = 0
+        self.clean = 0
+        self.corrected = 0
+        self.double = 0
+        self.unknown = 0
+    
+    def add(self, status):
+        """Bir parçanın durum kodu dizisini sayaçlara ekler"""
+        counts = np.bincount(status, minlength=4)
+        self.words += int(status.size)
+        self.clean += int(counts[ERROR_NONE])
+        self.corrected += int(counts[ERROR_SINGLE])
+        self.double += int(counts[ERROR_DOUBLE])
+        self.unknown += int(counts[ERROR_UNKNOWN])
+    
+    def merge(self, other):
+        """Başka bir sayaç kümesini bu kümeye ekler"""
+        self.words += other.words
+        self.clean += other.clean
+        self.corrected += other.corrected
+        self.double += other.double
+        self.unknown += other.unknown
+    
+    @property
+    def uncorrectable(self):
+        """Düzeltilemeyen (çift veya bilinmeyen hatalı) kelime sayısı"""
+        return self.double + self.unknown
+    
+    def as_dict(self):
+        """Sayaçları sözlük olarak döndürür"""
+        return {
+            'words': self.words,
+            'clean': self.clean,
+            'corrected': self.corrected,
+            'double': self.double,
+            'unknown': self.unknown
+        }
+
+class BatchTables:
+    def __init__(self, codec):
+        """
+        Bir codec için NumPy toplu işlem tablolarını oluşturur
+        
+        Args:
+            codec (HammingCodec): Tabloları oluşturulacak codec
+        """
+        layout = codec.layout
+        self.data_bits = codec.data_bits
+        self.total_bits = codec.total_bits
+        self.data_limbs = limb_count(codec.data_bits)
+        self.code_limbs = limb_count(codec.total_bits)
+        self.data_lanes = (codec.data_bits + 7) // 8
+        self.code_lanes = (codec.total_bits + 7) // 8
+        
+        # Veri baytı -> kodlanmış kelime katkısı
+        data_mask = (1 << codec.data_bits) - 1
+        encode = np.zeros((self.data_lanes, 256, self.code_limbs), dtype=np.uint64)
+        for lane in range(self.data_lanes):
+            for b in range(256):
+                value = codec._encode_word(((b << (8 * lane)) & data_mask))
+                encode[lane, b] = int_to_limbs(value, self.code_limbs)
+        self.encode_tables = _squeeze(encode, self.code_limbs)
+        
+        # Kodlanmış kelime baytı -> sendrom indeksi ve veri katkısı
+        syndrome = np.zeros((self.code_lanes, 256), dtype=np.uint32)
+        gather = np.zeros((self.code_lanes, 256, self.data_limbs), dtype=np.uint64)
+        for lane in range(self.code_lanes):
+            for b in range(256):
+                value = b << (8 * lane)
+                syndrome[lane, b] = codec._syndrome_word(value)
+                gather[lane, b] = int_to_limbs(layout.gather(value), self.data_limbs)
+        self.syndrome_tables = syndrome
+        self.gather_tables = _squeeze(gather, self.data_limbs)
+        
+        # Sendrom indeksi -> durum, hata pozisyonu (-1: yok), düzeltme maskesi
+        size = len(layout.syndrome_table)
+        self.status = np.zeros(size, dtype=np.uint8)
+        self.position = np.full(size, -1, dtype=np.int32)
+        flip = np.zeros((size, self.code_limbs), dtype=np.uint64)
+        for index, (status, position, mask) in enumerate(layout.syndrome_table):
+            self.status[index] = status
+            if position is not None:
+                self.position[index] = position
+                flip[index] = int_to_limbs(mask, self.code_limbs)
+        self.flip = _squeeze(flip, self.code_limbs)
+        
+        # Veri genişliğinin üst parçasında kullanılmayan bitler (doğrulama için)
+        spare = codec.data_bits % 64
+        self.top_spare_mask = np.uint64(~((1 << spare) - 1) & 0xFFFFFFFFFFFFFFFF) if spare else None
+    
+    def encode(self, data):
+        """
+        Veri kelimelerini toplu olarak kodlar
+        
+        Args:
+            data (array-like): (N,) veya (N, veri parça) uint64 veri kelimeleri
+        
+        Returns:
+            np.ndarray: Kodlanmış kelimeler ((N,) veya (N, kod parça) uint64)
+        """
+        words = as_words(data, self.data_limbs)
+        if self.top_spare_mask is not None and np.any(words[:, -1] & self.top_spare_mask):
+            raise ValueError(f"Veri {self.data_bits} bitten büyük olamaz")
+        
+        lanes = _byte_lanes(words, self.data_lanes)
+        encoded = self.encode_tables[0][lanes[:, 0]]
+        for lane in range(1, self.data_lanes):
+            encoded ^= self.encode_tables[lane][lanes[:, lane]]
+        return encoded
+    
+    def syndrome(self, codewords):
+        """
+        Kodlanmış kelimelerin sendrom tablosu indekslerini hesaplar
+        
+        Args:
+            codewords (np.ndarray): (N, kod parça) uint64 kodlanmış kelimeler
+        
+        Returns:
+            np.ndarray: (N,) uint32 sendrom indeksleri
+        """
+        lanes = _byte_lanes(codewords, self.code_lanes)
+        index = self.syndrome_tables[0][lanes[:, 0]]
+        for lane in range(1, self.code_lanes):
+            index ^= self.syndrome_tables[lane][lanes[:, lane]]
+        return index
+    
+    def gather(self, codewords):
+        """Kodlanmış kelimelerden veri bitlerini toplu olarak çıkarır"""
+        lanes = _byte_lanes(codewords, self.code_lanes)
+        data = self.gather_tables[0][lanes[:, 0]]
+        for lane in range(1, self.code_lanes):
+            data ^= self.gather_tables[lane][lanes[:, lane]]
+        return data
+    
+    def decode(self, codewords):
+        """
+        Kodlanmış kelimeleri toplu olarak kontrol eder ve tek hataları düzeltir
+        
+        Args:
+            codewords (array-like): (N,) veya (N, kod parça) uint64 kodlanmış kelimeler
+        
+        Returns:
+            tuple: Paralel diziler (durum, hata pozisyonu, düzeltilmiş kelime, veri)
+                durum: uint8 hata durum kodları (ERROR_NONE, ERROR_SINGLE, ...)
+                hata pozisyonu: int32, tek hata yoksa -1
+                düzeltilmiş kelime: girdiyle aynı şekilde uint64
+                veri: (N,) veya (N, veri parça) uint64
+        """
+        words = as_words(codewords, self.code_limbs)
+        return self.correct(words, self.syndrome(words))
+    
+    def correct(self, words, index):
+        """
+        Sendrom indekslerinden durum, pozisyon, düzeltilmiş kelime ve veriyi üretir
+        
+        Args:
+            words (np.ndarray): (N, kod parça) uint64 kodlanmış kelimeler
+            index (np.ndarray): (N,) sendrom tablosu indeksleri
+        
+        Returns:
+            tuple: decode() ile aynı paralel diziler
+        """
+        status = self.status[index]
+        position = self.position[index]
+        
+        flip = self.flip[index].reshape(words.shape)
+        corrected = words ^ flip
+        
+        # Tek parçalı kelimeler girdiyle aynı şekilde (N,) döndürülür
+        if self.code_limbs == 1:
+            corrected = corrected.reshape(-1)
+        return status, position, corrected, self.gather(corrected.reshape(words.shape))
+
+def get_batch_tables(codec):
+    """Codec'in toplu işlem tablolarını önbellekten döndürür, yoksa oluşturur"""
+    tables = _BATCH_CACHE.get(codec.layout)
+    if tables is None:
+        tables = BatchTables(codec)
+        _BATCH_CACHE[codec.layout] = tables
+    return tables
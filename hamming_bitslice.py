@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NumPy gerektirmeyen bit dilimli (bit-sliced) toplu kodlama ve kod çözme
+
+N kelimelik bir blok bit düzlemlerine (plane) çevrilir: i. düzlem, j. biti
+j. kelimenin i. biti olan bir Python tam sayısıdır. Her parite denklemi böylece
+düzlemler arasında birkaç XOR'a indirgenir ve N kelimenin hepsi aynı anda
+işlenir; büyük tam sayı işlemleri C düzeyinde kelime kelime yürür.
+
+Kelimeler ile düzlemler arasındaki dönüşüm bir bit matrisi devriğidir. Kelimeler
+S x S (S <= 64) bloklar halinde tek bir büyük tam sayıya yerleştirilir ve tüm
+bloklar log2(S) adet delta takası (delta swap) ile birlikte devrilir; düzlemler
+sonra memoryview üzerinde adımlı (strided) dilimlerle toplanır. 64 bitten
+geniş kelimeler 64 bitlik gruplar halinde devrilir.
+"""
+
+import sys
+from array import array
+from functools import lru_cache
+
+# Eleman boyutu (bayt) -> array tür kodu
+_TYPECODES = {array(code).itemsize: code for code in 'QLIHB'}
+
+def _block_size(bits):
+    """Grup genişliği için blok kenarı: 8 ile 64 arasında 2'nin kuvveti"""
+    return max(8, 1 << (bits - 1).bit_length())
+
+@lru_cache(maxsize=32)
+def _swap_masks(size, blocks):
+    """
+    S x S blok devriği için delta takası maskeleri (blok sayısı kadar tekrarlı)
+    
+    j adımında (satır & j == 0, sütun & j != 0) elemanları, j*(S-1) bit
+    uzaktaki (satır + j, sütun - j) elemanlarıyla yer değiştirir.
+    
+    Returns:
+        tuple: (delta, maske) çiftleri
+    """
+    steps = []
+    step = size // 2
+    while step:
+        columns = sum(1 << column for column in range(size) if column & step)
+        mask = sum(columns << (row * size) for row in range(size) if not row & step)
+        block = mask.to_bytes(size * size // 8, 'little')
+        steps.append((step * (size - 1), int.from_bytes(block * blocks, 'little')))
+        step //= 2
+    return tuple(steps)
+
+def _transpose(value, size, blocks):
+    """Büyük tam sayıdaki ardışık S x S bit bloklarının her birini devirir"""
+    for delta, mask in _swap_masks(size, blocks):
+        swap = ((value >> delta) ^ value) & mask
+        value ^= swap ^ (swap << delta)
+    return value
+
+def _typed(typecode, raw):
+    """Küçük uçlu baytlardan array oluşturur"""
+    values = array(typecode, raw)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def _raw(values):
+    """array'i küçük uçlu baytlara çevirir"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def words_to_planes(words, bits):
+    """
+    Kelimeleri bit düzlemlerine çevirir
+    
+    Args:
+        words (list): Negatif olmayan tam sayılar (her biri 'bits' bitlik)
+        bits (int): Kelime bit sayısı
+    
+    Returns:
+        list: 'bits' adet düzlem; i. düzlemin j. biti j. kelimenin i. biti
+    """
+    count = len(words)
+    planes = []
+    for base in range(0, bits, 64):
+        group = min(64, bits - base)
+        size = _block_size(group)
+        blocks = -(-count // size)
+        typecode = _TYPECODES[size // 8]
+        
+        if bits > 64:
+            lane = array(typecode, [(word >> base) & 0xFFFFFFFFFFFFFFFF for word in words])
+        else:
+            lane = array(typecode, words)
+        lane.extend(bytes(blocks * size - count))
+        
+        # Blok devriğinden sonra q. bloğun c. satırı, c. düzlemin q. parçasıdır
+        value = _transpose(int.from_bytes(_raw(lane), 'little'), size, blocks)
+        view = memoryview(value.to_bytes(blocks * size * size // 8, 'little')).cast(typecode)
+        for column in range(group):
+            planes.append(int.from_bytes(view[column::size].tobytes(), 'little'))
+    return planes
+
+def planes_to_words(planes, count):
+    """
+    Bit düzlemlerini kelimelere geri çevirir (words_to_planes'in tersi)
+    
+    Args:
+        planes (list): Düzlemler (her biri en fazla 'count' bitlik)
+        count (int): Kelime sayısı
+    
+    Returns:
+        list: 'count' adet tam sayı
+    """
+    words = [0] * count
+    for base in range(0, len(planes), 64):
+        group = planes[base:base + 64]
+        size = _block_size(len(group))
+        blocks = -(-count // size)
+        typecode = _TYPECODES[size // 8]
+        
+        rows = array(typecode, bytes(blocks * size * size // 8))
+        for column, plane in enumerate(group):
+            rows[column::size] = _typed(typecode, plane.to_bytes(blocks * size // 8, 'little'))
+        
+        value = _transpose(int.from_bytes(_raw(rows), 'little'), size, blocks)
+        lane = _typed(typecode, value.to_bytes(blocks * size * size // 8, 'little'))[:count]
+        if base == 0:
+            words = lane.tolist()
+        else:
+            words = [word | (limb << base) for word, limb in zip(words, lane)]
+    return words
+
+class BitsliceBatch:
+    def __init__(self, codec):
+        """
+        Codec'in G ve H matrislerinden bit dilimli toplu işlemler
+        
+        Args:
+            codec (HammingCodec): Kullanılacak codec (MatrixCodec dahil)
+        """
+        self.codec = codec
+        layout = codec.layout
+        generator = codec.generator_matrix()
+        data_positions = set(layout.data_positions)
+        
+        # Kontrol pozisyonu -> G sütununda 1 olan veri bitleri
+        self.check_terms = tuple(
+            (position, tuple(j for j, row in enumerate(generator) if (row >> position) & 1))
+            for position in range(layout.total_bits) if position not in data_positions)
+        
+        # Sendrom biti -> H satırındaki pozisyonlar
+        self.syndrome_terms = tuple(
+            tuple(p for p in range(layout.total_bits) if (mask >> p) & 1)
+            for mask in layout.check_masks)
+        
+        # Veri biti -> tek hatasının sendromu (H sütunu)
+        self.data_columns = tuple(
+            sum(((mask >> p) & 1) << i for i, mask in enumerate(layout.check_masks))
+            for p in layout.data_positions)
+    
+    def encode_planes(self, data_planes):
+        """
+        Veri düzlemlerinden kodlanmış kelime düzlemlerini hesaplar
+        
+        Returns:
+            list: total_bits adet düzlem
+        """
+        planes = [0] * self.codec.total_bits
+        for plane, position in zip(data_planes, self.codec.layout.data_positions):
+            planes[position] = plane
+        for position, terms in self.check_terms:
+            parity = 0
+            for j in terms:
+                parity ^= data_planes[j]
+            planes[position] = parity
+        return planes
+    
+    def syndrome_planes(self, planes):
+        """
+        Kodlanmış kelime düzlemlerinden sendrom düzlemlerini hesaplar
+        
+        Returns:
+            list: Sendrom biti başına bir düzlem (sendrom tablosu indeksi bitleri)
+        """
+        syndrome = []
+        for terms in self.syndrome_terms:
+            parity = 0
+            for p in terms:
+                parity ^= planes[p]
+            syndrome.append(parity)
+        return syndrome
+    
+    def encode(self, data):
+        """
+        Veri kelimelerini toplu olarak kodlar
+        
+        Args:
+            data (list): Veri kelimeleri (tam sayılar)
+        
+        Returns:
+            list: Kodlanmış kelimeler
+        """
+        if any(value >> self.codec.data_bits for value in data):
+            raise ValueError(f"Veri {self.codec.data_bits} bitten büyük olamaz")
+        planes = self.encode_planes(words_to_planes(data, self.codec.data_bits))
+        return planes_to_words(planes, len(data))
+    
+    def syndrome(self, codewords):
+        """
+        Sendrom tablosu indekslerini toplu olarak hesaplar
+        
+        Returns:
+            list: Kelime başına sendrom indeksi
+        """
+        planes = words_to_planes(codewords, self.codec.total_bits)
+        return planes_to_words(self.syndrome_planes(planes), len(codewords))
+    
+    def check(self, codewords):
+        """
+        Kelimeleri yalnızca kontrol eder
+        
+        Returns:
+            list: Kelime başına hata durum kodu
+        """
+        status = self.codec.layout.status_table
+        return [status[index] for index in self.syndrome(codewords)]
+    
+    def decode(self, codewords):
+        """
+        Kelimeleri toplu olarak kontrol eder ve tek hataları düzeltir
+        
+        Düzeltilmiş veri bitleri de düzlemler üzerinde hesaplanır: veri biti p
+        yalnızca sendromu p'nin H sütununa eşit olan kelimelerde terslenir.
+        
+        Returns:
+            tuple: decode_batch ile aynı sırada paralel listeler (durum kodu,
+                   hata pozisyonu (-1: yok), düzeltilmiş kelime, orijinal veri)
+        """
+        count = len(codewords)
+        layout = self.codec.layout
+        planes = words_to_planes(codewords, layout.total_bits)
+        syndrome = self.syndrome_planes(planes)
+        everyone = (1 << count) - 1
+        
+        data_planes = []
+        for column, position in zip(self.data_columns, layout.data_positions):
+            hit = everyone
+            for i, plane in enumerate(syndrome):
+                hit &= plane if (column >> i) & 1 else plane ^ everyone
+            data_planes.append(planes[position] ^ hit)
+        
+        table = layout.syndrome_table
+        entries = [table[index] for index in planes_to_words(syndrome, count)]
+        status = [entry[0] for entry in entries]
+        positions = [-1 if entry[1] is None else entry[1] for entry in entries]
+        corrected = [word ^ entry[2] for word, entry in zip(codewords, entries)]
+        return status, positions, corrected, planes_to_words(data_planes, count)
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MemoryBank önünde ECC korumalı küme ilişkili (set-associative) önbellek simülatörü
+
+Önbellek satırı birden çok codec kelimesinden oluşur (ör. 64 baytlık satır =
+8 adet 64 bitlik kelime) ve her kelime kendi ECC'sini taşır. Önbellek her
+yuvada satırın kelimelerinin bir kopyasını tutar. Satır bellekten doldurulurken
+(fill) okunan kelimeler kontrol edilir ve kopyaya düzeltilmiş halleri yazılır.
+Kirli (dirty) satır çıkarılırken (eviction) veya flush() ile geri yazılırken
+bu kopya yeniden kontrol edilir ve belleğe yazılır; böylece satır önbellekte
+dururken oluşan hatalar (inject_error) geri yazmada görülür ve tek hatalar
+düzeltilerek yazılır. Doldurma ve geri yazma sayaçları ayrı tutulur.
+Düzeltilemez kelimeler olduğu gibi taşınır (zehir kopyada ve geri yazmadan
+sonra bellekte kalır), bu yüzden her iki noktada da görünür.
+
+Etiketler (tag) sıkıştırılmış dizilerde tutulur: yuva başına satır numarası,
+LRU zaman damgası ve kirli biti; satır -> yuva araması bir sözlükle O(1)'dir.
+Erişim akışları parçalar halinde yeniden oynatılır (replay):
+
+    - adresler NumPy ile satır numaralarına çevrilir; aynı satıra art arda
+      erişimler tek bir erişime indirgenir (ilki dışındakiler kesin isabettir)
+    - etiket durumu sade bir Python döngüsüyle güncellenir, ıskalamalar
+      (miss) ve geri yazmalar sırasıyla kaydedilir
+    - parçanın ECC işleri tek bir decode_batch çağrısıyla yapılır
+
+Python döngüsü kelimeleri değil, yalnızca kaynaklarını izler: her doldurmanın
+okuduğu ve her geri yazmanın yazdığı kelimeler ya satırın parça başındaki
+bellek içeriği ya da bir yuvanın parça başındaki kopyasıdır (gerekirse
+düzeltilmiş hali). Düzeltme idempotent olduğundan (tek hata temizlenir,
+düzeltilemez kelime değişmez) her olayın durumu bu kökler bir kez çözülerek
+kesin olarak hesaplanır.
+"""
+
+import random
+from array import array
+
+import numpy as np
+
+from hamming_codec import ERROR_NONE, ERROR_SINGLE
+from hamming_batch import DecodeStats
+
+# Desteklenen yer değiştirme politikaları
+POLICIES = ('lru', 'random')
+
+# Yeniden oynatmada parça boyutu (erişim)
+DEFAULT_CHUNK_ACCESSES = 1 << 20
+
+class CacheStats:
+    def __init__(self):
+        """Önbellek erişim ve ECC sayaçları"""
+        self.accesses = 0
+        self.reads = 0
+        self.writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.fill = DecodeStats()        # Doldurmada bellekten okunan kelimeler
+        self.writeback = DecodeStats()   # Geri yazmada önbellek kopyasındaki kelimeler
+    
+    @property
+    def hit_rate(self):
+        """İsabet oranı (erişim yoksa 0)"""
+        return self.hits / self.accesses if self.accesses else 0.0
+    
+    @property
+    def corrected(self):
+        """Doldurma ve geri yazmada düzeltilen kelime sayısı"""
+        return self.fill.corrected + self.writeback.corrected
+    
+    @property
+    def uncorrectable(self):
+        """Doldurma ve geri yazmada bulunan düzeltilemez kelime sayısı"""
+        return self.fill.uncorrectable + self.writeback.uncorrectable
+    
+    def merge(self, other):
+        """Başka bir sayaç kümesini bu kümeye ekler"""
+        self.accesses += other.accesses
+        self.reads += other.reads
+        self.writes += other.writes
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+        self.writebacks += other.writebacks
+        self.fill.merge(other.fill)
+        self.writeback.merge(other.writeback)
+    
+    def as_dict(self):
+        """Sayaçları sözlük olarak döndürür"""
+        return {
+            'accesses': self.accesses,
+            'reads': self.reads,
+            'writes': self.writes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+            'writebacks': self.writebacks,
+            'corrected': self.corrected,
+            'uncorrectable': self.uncorrectable,
+            'fill': self.fill.as_dict(),
+            'writeback': self.writeback.as_dict()
+        }
+
+class ECCCache:
+    def __init__(self, bank, line_bytes=64, ways=8, sets=64, policy='lru', seed=0, code=None):
+        """
+        Bellek bankası önünde geri yazmalı (write-back), yazmada yer ayıran
+        (write-allocate) küme ilişkili önbellek
+        
+        Args:
+            bank (MemoryBank): Arkadaki bellek
+            line_bytes (int): Satır boyutu (bayt); kelime boyutunun katı olmalıdır
+            ways (int): İlişkililik (küme başına yuva)
+            sets (int): Küme sayısı
+            policy (str): Yer değiştirme politikası ('lru' veya 'random')
+            seed (int): 'random' politikası için tohum
+            code (str, optional): Kod yapısı; kelimeler bankanın codec'iyle
+                kodlandığından None ise bankanınki kullanılır, verilirse
+                bankanınkiyle aynı olmalıdır
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Bilinmeyen politika: {policy} (desteklenenler: {', '.join(POLICIES)})")
+        if ways < 1 or sets < 1:
+            raise ValueError("İlişkililik ve küme sayısı pozitif olmalıdır")
+        if code is not None and code != bank.codec.code:
+            raise ValueError(f"Önbellek kodu ({code}) bankanın koduyla ({bank.codec.code}) uyuşmuyor")
+        if bank.width % 8:
+            raise ValueError(f"Veri genişliği 8'in katı olmalıdır: {bank.width}")
+        word_bytes = bank.width // 8
+        if line_bytes < word_bytes or line_bytes % word_bytes:
+            raise ValueError(f"Satır boyutu {word_bytes} baytlık kelimenin katı olmalıdır: {line_bytes}")
+        line_words = line_bytes // word_bytes
+        if bank.size % line_words:
+            raise ValueError(f"Bellek boyutu satır başına {line_words} kelimenin katı olmalıdır")
+        
+        self.bank = bank
+        self.line_bytes = line_bytes
+        self.line_words = line_words
+        self.ways = ways
+        self.sets = sets
+        self.policy = policy
+        self.code = bank.codec.code
+        self.limbs = bank.limbs
+        self._random = random.Random(seed)
+        self.stats = CacheStats()
+        self.invalidate()
+    
+    @property
+    def size_bytes(self):
+        """Önbelleğin veri kapasitesi (bayt)"""
+        return self.line_bytes * self.ways * self.sets
+    
+    def invalidate(self):
+        """Tüm satırları geçersiz kılar (kirli satırlar geri yazılmaz)"""
+        slots = self.ways * self.sets
+        self._where = {}                                 # satır -> yuva
+        self._lines = array('q', [-1]) * slots           # yuva -> satır
+        self._stamps = array('Q', [0]) * slots           # yuva -> son erişim (LRU)
+        self._dirty = bytearray(slots)
+        self._occupancy = array('I', [0]) * self.sets    # küme başına dolu yuva
+        self._clock = 0
+        # yuva -> satırın önbellekteki kodlanmış kelimeleri
+        self._data = np.zeros((slots, self.line_words, self.limbs), dtype=np.uint64)
+    
+    def __contains__(self, address):
+        """Adresin satırı önbellekte mi"""
+        return address // self.line_words in self._where
+    
+    def __len__(self):
+        """Önbellekteki satır sayısı"""
+        return len(self._where)
+    
+    def inject_error(self, address, position):
+        """
+        Önbellekteki kopyada adresin kelimesinin bir bitini tersler
+        
+        Raises:
+            KeyError: Adresin satırı önbellekte değilse
+        """
+        slot = self._where.get(address // self.line_words)
+        if slot is None:
+            raise KeyError(f"{address} adresinin satırı önbellekte değil")
+        word = self._data[slot, address % self.line_words]
+        word[position >> 6] ^= np.uint64(1 << (position & 63))
+    
+    def access(self, address, write=False):
+        """
+        Tek bir erişim
+        
+        Returns:
+            bool: İsabet (hit) ise True
+        """
+        stats = self.replay([address], [write])
+        return stats.hits == 1
+    
+    def replay(self, addresses, writes=None, chunk_accesses=DEFAULT_CHUNK_ACCESSES):
+        """
+        Bir erişim akışını yeniden oynatır
+        
+        Args:
+            addresses (array-like): Kelime adresleri
+            writes (array-like, optional): Adreslerle paralel yazma bayrakları
+                                           (varsayılan: tümü okuma)
+            chunk_accesses (int): Parça başına erişim
+        
+        Returns:
+            CacheStats: Bu akışın sayaçları (self.stats'a da eklenir)
+        """
+        addresses = np.asarray(addresses, dtype=np.int64).reshape(-1)
+        if writes is None:
+            writes = np.zeros(addresses.size, dtype=bool)
+        else:
+            writes = np.asarray(writes, dtype=bool).reshape(-1)
+            if writes.size != addresses.size:
+                raise ValueError("Adres ve yazma bayrağı sayıları eşit olmalıdır")
+        if addresses.size and (addresses.min() < 0 or addresses.max() >= self.bank.size):
+            raise IndexError(f"Adres 0 ile {self.bank.size - 1} arasında olmalıdır")
+        
+        stats = CacheStats()
+        for start in range(0, addresses.size, chunk_accesses):
+            lines = addresses[start:start + chunk_accesses] // self.line_words
+            chunk_writes = writes[start:start + chunk_accesses]
+            
+            # Aynı satıra art arda erişimler tek erişime indirgenir
+            starts = np.flatnonzero(np.concatenate(([True], lines[1:] != lines[:-1])))
+            run_writes = np.logical_or.reduceat(chunk_writes, starts)
+            
+            events = self._simulate(lines[starts].tolist(), run_writes.tolist(), stats)
+            self._check_lines(*events, stats)
+            
+            stats.accesses += int(lines.size)
+            stats.writes += int(np.count_nonzero(chunk_writes))
+        
+        stats.reads = stats.accesses - stats.writes
+        stats.hits = stats.accesses - stats.misses
+        self.stats.merge(stats)
+        return stats
+    
+    def _simulate(self, lines, writes, stats):
+        """
+        Etiket durumunu günceller; ECC işleri için olayları sırasıyla toplar
+        
+        Kelime kaynakları 2 * kök + düzeltilmiş biçiminde tam sayılardır. Kök
+        yuva < yuva sayısı ise yuvanın parça başındaki kopyası, yuva sayısı +
+        satır ise satırın parça başındaki bellek içeriğidir. Geri yazmada
+        kontrol edilen kaynak kopyanın kendisi, belleğe yazılan düzeltilmiş
+        halidir.
+        
+        Returns:
+            tuple: (doldurmaların okuduğu kaynaklar, geri yazmaların yazdığı
+                    kaynaklar, {yuva: yeni kopya kaynağı}, {satır: yeni bellek
+                    kaynağı})
+        """
+        where = self._where
+        slot_lines = self._lines
+        stamps = self._stamps
+        dirty = self._dirty
+        occupancy = self._occupancy
+        ways = self.ways
+        sets = self.sets
+        lru = self.policy == 'lru'
+        draw = self._random.random
+        clock = self._clock
+        
+        fills = []
+        written_back = []
+        copies = {}
+        memory = {}
+        offset = ways * sets
+        misses = evictions = 0
+        
+        for line, write in zip(lines, writes):
+            clock += 1
+            slot = where.get(line)
+            if slot is None:
+                misses += 1
+                index = line % sets
+                base = index * ways
+                used = occupancy[index]
+                if used < ways:
+                    slot = base + used
+                    occupancy[index] = used + 1
+                else:
+                    if lru:
+                        window = stamps[base:base + ways]
+                        slot = base + window.index(min(window))
+                    else:
+                        slot = base + int(draw() * ways)
+                    victim = slot_lines[slot]
+                    del where[victim]
+                    evictions += 1
+                    if dirty[slot]:
+                        source = copies.get(slot, slot << 1)
+                        written_back.append(source)
+                        memory[victim] = source | 1
+                
+                source = memory.get(line, (offset + line) << 1)
+                fills.append(source)
+                copies[slot] = source | 1
+                where[line] = slot
+                slot_lines[slot] = line
+                dirty[slot] = write
+            elif write:
+                dirty[slot] = 1
+            stamps[slot] = clock
+        
+        self._clock = clock
+        stats.misses += misses
+        stats.evictions += evictions
+        return fills, written_back, copies, memory
+    
+    def flush(self):
+        """
+        Tüm kirli satırları geri yazar (satırlar önbellekte kalır)
+        
+        Returns:
+            CacheStats: Geri yazma sayaçları (self.stats'a da eklenir)
+        """
+        stats = CacheStats()
+        written_back = []
+        memory = {}
+        for slot, line in enumerate(self._lines):
+            if line >= 0 and self._dirty[slot]:
+                written_back.append(slot << 1)
+                memory[line] = (slot << 1) | 1
+                self._dirty[slot] = 0
+        self._check_lines([], written_back, {}, memory, stats)
+        self.stats.merge(stats)
+        return stats
+    
+    def _check_lines(self, fills, written_back, copies, memory, stats):
+        """
+        Doldurma ve geri yazma kelimelerini tek seferde kontrol eder, yuva
+        kopyalarını ve belleği günceller
+        
+        Doldurmalar bellekten okunan, geri yazmalar önbellek kopyasındaki
+        kelimeleri sayar. Bellek yalnızca parça başında okunandan beri
+        değişmemiş kelimelerde güncellenir.
+        """
+        stats.writebacks += len(written_back)
+        if not (fills or written_back):
+            return
+        
+        offset = self.ways * self.sets
+        groups = [np.array(fills, dtype=np.int64),
+                  np.array(written_back, dtype=np.int64),
+                  np.fromiter(copies.values(), dtype=np.int64, count=len(copies)),
+                  np.fromiter(memory.values(), dtype=np.int64, count=len(memory))]
+        targets = np.fromiter(memory, dtype=np.int64, count=len(memory))
+        
+        # Kökler sıralıdır: önce yuva kopyaları, sonra satırların bellek içeriği
+        roots, inverse = np.unique(np.concatenate([group >> 1 for group in groups] + [offset + targets]),
+                                   return_inverse=True)
+        bounds = np.cumsum([group.size for group in groups])
+        rows = np.split(inverse, bounds)
+        slots = roots[roots < offset]
+        lines = roots[roots >= offset] - offset
+        
+        bank = self.bank
+        index = (lines[:, None] * self.line_words + np.arange(self.line_words)).reshape(-1)
+        with bank.lock:
+            read = bank.codewords[index].reshape(lines.size, self.line_words, self.limbs)
+        words = np.concatenate((self._data[slots], read))
+        
+        status, _, corrected, _ = bank.codec.decode_batch(words.reshape(-1, self.limbs))
+        status = status.reshape(roots.size, self.line_words)
+        corrected = corrected.reshape(words.shape)
+        
+        # Düzeltilmiş kopyada tek hatalar görünmez, düzeltilemez kelimeler kalır
+        cleaned = np.where(status == ERROR_SINGLE, ERROR_NONE, status).astype(status.dtype)
+        
+        for group, row, tally in zip(groups, rows, (stats.fill, stats.writeback)):
+            if group.size:
+                fixed = (group & 1).astype(bool)[:, None]
+                tally.add(np.where(fixed, cleaned[row], status[row]).reshape(-1))
+        
+        def resolve(group, row):
+            """Kaynakların kelimeleri"""
+            fixed = (group & 1).astype(bool)[:, None, None]
+            return np.where(fixed, corrected[row], words[row])
+        
+        if copies:
+            self._data[np.fromiter(copies, dtype=np.int64, count=len(copies))] = resolve(groups[2], rows[2])
+        if not memory:
+            return
+        
+        # Geri yazılan satırların son içeriği, parça başından beri değişmemiş kelimelere yazılır
+        new = resolve(groups[3], rows[3]).reshape(-1, self.limbs)
+        old = words[rows[4]].reshape(-1, self.limbs)
+        index = (targets[:, None] * self.line_words + np.arange(self.line_words)).reshape(-1)
+        changed = np.flatnonzero((new != old).any(axis=1))
+        if not changed.size:
+            return
+        with bank.lock:
+            current = bank.codewords[index[changed]].reshape(-1, self.limbs)
+            same = (current == old[changed]).all(axis=1)
+            values = new[changed[same]]
+            bank.codewords[index[changed[same]]] = values.reshape(-1) if self.limbs == 1 else values
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Monte-Carlo hata enjeksiyonu kampanyaları
+
+Rastgele veri kelimeleri kodlanır, toplu olarak üretilen hata maskeleriyle
+bozulur ve toplu olarak çözülür. Her deneme şu sonuçlardan birine düşer:
+    - clean       : hata yok, kelime sağlam
+    - corrected   : tek hata doğru düzeltildi
+    - detected    : düzeltilemeyen hata tespit edildi (çift/bilinmeyen)
+    - miscorrected: çoklu hata yanlış bir 'tek hata' olarak düzeltildi (sessiz)
+    - undetected  : hata sendromu sıfır, bozuk kelime temiz göründü (sessiz)
+
+Hata maskeleri Python döngüsü olmadan NumPy ile üretilir: bit başına Bernoulli
+(bit hata oranı) için önce kelime başına hata sayısı binom dağılımından çekilir,
+ardından yalnızca hatalı kelimeler için farklı pozisyonlar seçilir. Rastgele
+sayı akışları SeedSequence ile parti başına türetilir; aynı tohum ve parti
+boyutu daima aynı sonucu verir (işçi sayısından bağımsız).
+
+Komut satırı kullanımı:
+    python hamming_campaign.py --width 32 --trials 100000000 --errors 3 --seed 1
+    python hamming_campaign.py --width 64 --trials 10000000 --ber 1e-3
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from hamming_codec import CODES, ERROR_NONE, ERROR_SINGLE, get_codec
+from hamming_batch import limb_count
+
+# Deneme sonuç kodları
+OUTCOME_CLEAN = 0
+OUTCOME_CORRECTED = 1
+OUTCOME_DETECTED = 2
+OUTCOME_MISCORRECTED = 3
+OUTCOME_UNDETECTED = 4
+OUTCOMES = ('clean', 'corrected', 'detected', 'miscorrected', 'undetected')
+
+# Varsayılan parti boyutu (deneme)
+DEFAULT_BATCH_SIZE = 1 << 20
+
+def _distinct_positions(rng, rows, total_bits, k):
+    """
+    Her satır için [0, total_bits) aralığında k farklı bit pozisyonu seçer
+    
+    Küçük k için tekrar eden satırlar yeniden çekilir (reddetme örneklemesi);
+    büyük k için rastgele anahtarların kısmi sıralaması kullanılır.
+    """
+    if k * 4 > total_bits:
+        keys = rng.random((rows, total_bits))
+        return np.argpartition(keys, k - 1, axis=1)[:, :k]
+    
+    positions = rng.integers(0, total_bits, size=(rows, k))
+    while True:
+        ordered = np.sort(positions, axis=1)
+        repeat = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if repeat.size == 0:
+            return positions
+        positions[repeat] = rng.integers(0, total_bits, size=(repeat.size, k))
+
+def _positions_to_masks(positions, limbs):
+    """(satır, k) pozisyon dizisini (satır, parça) uint64 hata maskelerine çevirir"""
+    masks = np.zeros((positions.shape[0], limbs), dtype=np.uint64)
+    bits = np.left_shift(np.uint64(1), (positions & 63).astype(np.uint64))
+    for limb in range(limbs):
+        masks[:, limb] = np.bitwise_or.reduce(np.where((positions >> 6) == limb, bits, np.uint64(0)), axis=1)
+    return masks
+
+def error_masks(rng, count, total_bits, ber=None, error_bits=None):
+    """
+    Toplu hata maskeleri üretir
+    
+    Args:
+        rng (np.random.Generator): Rastgele sayı üreteci
+        count (int): Maske sayısı
+        total_bits (int): Kodlanmış kelime bit sayısı
+        ber (float, optional): Bit başına hata olasılığı
+        error_bits (int, optional): Kelime başına tam olarak bu kadar bit hatası
+    
+    Returns:
+        tuple: ((count, parça) uint64 maskeler, (count,) hata ağırlıkları)
+    """
+    if (ber is None) == (error_bits is None):
+        raise ValueError("ber veya error_bits parametrelerinden yalnızca biri verilmelidir")
+    
+    limbs = limb_count(total_bits)
+    if error_bits is not None:
+        if error_bits < 0 or error_bits > total_bits:
+            raise ValueError(f"Hata biti sayısı 0 ile {total_bits} arasında olmalıdır")
+        weights = np.full(count, error_bits, dtype=np.int64)
+    else:
+        weights = rng.binomial(total_bits, ber, size=count)
+    
+    masks = np.zeros((count, limbs), dtype=np.uint64)
+    for k in np.unique(weights):
+        if k == 0:
+            continue
+        rows = np.flatnonzero(weights == k)
+        masks[rows] = _positions_to_masks(_distinct_positions(rng, rows.size, total_bits, int(k)), limbs)
+    return masks, weights
+
+def inject_errors(codewords, total_bits, rng, ber=None, error_bits=None):
+    """
+    Kodlanmış kelime dizisine (ör. bir bellek görüntüsü parçası) yerinde hata enjekte eder
+    
+    Returns:
+        np.ndarray: Kelime başına enjekte edilen hata sayısı
+    """
+    masks, weights = error_masks(rng, len(codewords), total_bits, ber, error_bits)
+    codewords ^= masks.reshape(codewords.shape)
+    return weights
+
+def classify(status, corrected, original):
+    """
+    Kod çözme sonuçlarını deneme sonuç kodlarına çevirir
+    
+    Args:
+        status (np.ndarray): decode_batch durum kodları
+        corrected (np.ndarray): Düzeltilmiş kelimeler
+        original (np.ndarray): Hatasız kelimeler (aynı şekilde)
+    
+    Returns:
+        np.ndarray: (N,) uint8 sonuç kodları
+    """
+    intact = corrected == original
+    if intact.ndim > 1:
+        intact = intact.all(axis=1)
+    
+    outcome = np.full(status.shape, OUTCOME_DETECTED, dtype=np.uint8)
+    clean = status == ERROR_NONE
+    single = status == ERROR_SINGLE
+    outcome[clean & intact] = OUTCOME_CLEAN
+    outcome[clean & ~intact] = OUTCOME_UNDETECTED
+    outcome[single & intact] = OUTCOME_CORRECTED
+    outcome[single & ~intact] = OUTCOME_MISCORRECTED
+    return outcome
+
+def _run_batch(width, engine, seed, count, ber, error_bits, code='hamming'):
+    """
+    Tek bir partiyi çalıştırır (işçi süreçlerde de çağrılır)
+    
+    Returns:
+        np.ndarray: (toplam bit + 1, sonuç sayısı) ağırlık x sonuç sayaçları
+    """
+    codec = get_codec(width, engine, code)
+    rng = np.random.default_rng(seed)
+    limbs = limb_count(width)
+    
+    data = rng.integers(0, 1 << 64, size=(count, limbs), dtype=np.uint64, endpoint=False)
+    if width % 64:
+        data[:, -1] &= np.uint64((1 << (width % 64)) - 1)
+    original = codec.encode_batch(data if limbs > 1 else data.reshape(-1))
+    
+    masks, weights = error_masks(rng, count, codec.total_bits, ber, error_bits)
+    status, _, corrected, _ = codec.decode_batch(original ^ masks.reshape(original.shape))
+    
+    outcome = classify(status, corrected, original)
+    cells = weights.astype(np.int64) * len(OUTCOMES) + outcome
+    counts = np.bincount(cells, minlength=(codec.total_bits + 1) * len(OUTCOMES))
+    return counts.reshape(codec.total_bits + 1, len(OUTCOMES))
+
+class CampaignReport:
+    def __init__(self, width, total_bits, by_weight):
+        """
+        Kampanya sonuçları
+        
+        Args:
+            width (int): Veri bit uzunluğu
+            total_bits (int): Kodlanmış kelime bit sayısı
+            by_weight (np.ndarray): (hata ağırlığı, sonuç) sayaç matrisi
+        """
+        self.width = width
+        self.total_bits = total_bits
+        self.by_weight = by_weight
+    
+    @property
+    def trials(self):
+        """Toplam deneme sayısı"""
+        return int(self.by_weight.sum())
+    
+    def count(self, outcome):
+        """Verilen sonuç kodunun toplam sayısı"""
+        return int(self.by_weight[:, outcome].sum())
+    
+    def as_dict(self):
+        """
+        Sonuçları sözlük olarak döndürür
+        
+        Returns:
+            dict: Toplamlar ve 'by_weight' altında hata ağırlığı başına sayaçlar
+        """
+        result = {'width': self.width, 'trials': self.trials}
+        for outcome, name in enumerate(OUTCOMES):
+            result[name] = self.count(outcome)
+        result['by_weight'] = {
+            int(weight): {name: int(row[i]) for i, name in enumerate(OUTCOMES)}
+            for weight, row in enumerate(self.by_weight) if row.any()
+        }
+        return result
+
+def run_campaign(width=32, trials=1000000, ber=None, error_bits=None, seed=None,
+                 batch_size=DEFAULT_BATCH_SIZE, engine='lut', workers=1, code='hamming'):
+    """
+    Monte-Carlo hata enjeksiyonu kampanyası çalıştırır
+    
+    Args:
+        width (int): Veri bit uzunluğu
+        trials (int): Deneme (kelime) sayısı
+        ber (float, optional): Bit başına hata olasılığı
+        error_bits (int, optional): Kelime başına sabit hata biti sayısı
+        seed (int, optional): Tohum (aynı tohum ve parti boyutu aynı sonucu verir)
+        batch_size (int): Parti başına deneme
+        engine (str): Kodlama motoru
+        workers (int): Partileri çalıştıracak süreç sayısı
+        code (str): Kod yapısı ('hamming' veya 'hsiao')
+    
+    Returns:
+        CampaignReport: Kampanya sonuçları
+    """
+    if (ber is None) == (error_bits is None):
+        raise ValueError("ber veya error_bits parametrelerinden yalnızca biri verilmelidir")
+    
+    codec = get_codec(width, engine, code)
+    sizes = [min(batch_size, trials - start) for start in range(0, trials, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    
+    totals = np.zeros((codec.total_bits + 1, len(OUTCOMES)), dtype=np.int64)
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_batch, width, engine, child, size, ber, error_bits, code)
+                       for child, size in zip(seeds, sizes)]
+            for future in futures:
+                totals += future.result()
+    else:
+        for child, size in zip(seeds, sizes):
+            totals += _run_batch(width, engine, child, size, ber, error_bits, code)
+    
+    return CampaignReport(width, codec.total_bits, totals)
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED hata enjeksiyonu kampanyası")
+    parser.add_argument('--width', type=int, default=32, help="Veri bit uzunluğu")
+    parser.add_argument('--trials', type=int, default=1000000, help="Deneme sayısı")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--ber', type=float, help="Bit başına hata olasılığı")
+    mode.add_argument('--errors', type=int, help="Kelime başına sabit hata biti sayısı")
+    parser.add_argument('--seed', type=int, default=None, help="Tohum")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Parti boyutu")
+    parser.add_argument('--workers', type=int, default=1, help="Süreç sayısı")
+    parser.add_argument('--code', default='hamming', choices=CODES, help="Kod yapısı")
+    args = parser.parse_args(argv)
+    
+    report = run_campaign(args.width, args.trials, args.ber, args.errors, args.seed,
+                          args.batch_size, workers=args.workers, code=args.code)
+    summary = report.as_dict()
+    by_weight = summary.pop('by_weight')
+    print(summary)
+    for weight, counts in by_weight.items():
+        print(f"  {weight} bit: {counts}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
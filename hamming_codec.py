@@ -5,18 +5,418 @@ Hamming SEC-DED (Single Error Correction - Double Error Detection) kodlaması
 ve hata düzeltme işlemleri için modül
 """
 
+from collections import namedtuple
+from itertools import combinations
+from math import comb
+
+# Desteklenen kodlama/kod çözme motorları
+#   'mask': parite başına bir kapsama maskesi, AND + popcount paritesi
+#   'lut' : bayt başına 256 girişlik tablolar, arama sonuçları XOR'lanır
+ENGINES = ('mask', 'lut')
+
+# Desteklenen SEC-DED kod yapıları
+#   'hamming': 2'nin kuvveti pozisyonlarında parite bitleri + genel parite biti
+#   'hsiao'  : sistematik yerleşim, tek ağırlıklı en küçük sütunlar (Hsiao, 1970)
+CODES = ('hamming', 'hsiao')
+
+# Arayüzde sunulan veri genişlikleri (64 bit: ECC DIMM (72,64); 128-512 bit:
+# önbellek satırı blokları). Codec herhangi bir pozitif genişliği destekler.
+SUPPORTED_WIDTHS = (8, 16, 32, 64, 128, 256, 512)
+
+# Hata durum kodları (sendrom tablosunda ve hızlı kontrol yollarında kullanılır)
+ERROR_NONE = 0      # Hata yok
+ERROR_SINGLE = 1    # Tek bit hatası (düzeltilebilir)
+ERROR_DOUBLE = 2    # Çift bit hatası (tespit edilir, düzeltilemez)
+ERROR_UNKNOWN = 3   # Geçersiz sendrom (çoklu hata, düzeltilemez)
+
+# Durum kodlarının detect_and_correct sözlüğündeki karşılıkları
+ERROR_TYPES = ('none', 'single', 'double', 'unknown')
+
+class DecodeResult(namedtuple('DecodeResult', ['status', 'error_position', 'corrected_data', 'original_data'])):
+    """
+    Kompakt kod çözme sonucu (demet tabanlı, örnek başına sözlük oluşturmaz)
+    
+    Alanlar:
+        status (int): Hata durum kodu (ERROR_NONE, ERROR_SINGLE, ...)
+        error_position (int | None): Tek hata pozisyonu (0'dan başlar)
+        corrected_data (int): Düzeltilmiş kodlanmış veri
+        original_data (int): Düzeltilmiş veriden çıkarılan orijinal veri
+    """
+    __slots__ = ()
+    
+    @property
+    def error_detected(self):
+        """Hata tespit edilip edilmediği"""
+        return self.status != ERROR_NONE
+    
+    @property
+    def error_type(self):
+        """Hata türü: 'none', 'single', 'double' veya 'unknown'"""
+        return ERROR_TYPES[self.status]
+
+_new_tuple = tuple.__new__
+
+# Bayt tabloları (LUT) kod yerleşimine göre önbelleğe alınır:
+#   {CodecLayout: (kodlama tabloları, sendrom tabloları)}
+_LUT_CACHE = {}
+
+# Bit yerleşimleri kod ve veri genişliğine göre önbelleğe alınır: {(kod, data_bits): CodecLayout}
+_LAYOUT_CACHE = {}
+
+# Hazır codec örnekleri: {(data_bits, engine, kod, derlenmiş): HammingCodec}
+_CODEC_CACHE = {}
+
+class CodecLayout:
+    def __init__(self, total_bits, data_positions, parity_positions,
+                 overall_parity_position, check_masks, double_mask):
+        """
+        Bir SEC-DED kodunun önceden hesaplanmış bit yerleşimi
+        
+        Kodlanmış kelime ile veri arasında toplama/dağıtma (PEXT/PDEP) için
+        bitişik bit bloklarını ve sendromdan doğrudan hata pozisyonuna giden
+        tabloyu tutar. Böylece kod çözme sırasında pozisyonlar üzerinde
+        döngü kurulmaz.
+        
+        Args:
+            total_bits (int): Kodlanmış kelimenin toplam bit sayısı
+            data_positions (list): Veri bitlerinin pozisyonları (veri bit sırasıyla)
+            parity_positions (list): Parite bitlerinin pozisyonları
+            overall_parity_position (int | None): Genel parite bitinin
+                pozisyonu (genel parite biti olmayan kodlarda None)
+            check_masks (list): Sendrom bitlerini üreten maskeler; i. sendrom
+                biti (kelime & check_masks[i]) değerinin paritesidir. Kodlamada
+                i. maske, check_positions[i] bitini ayarlar
+            double_mask (int): Tek bit hatası sendromlarında paritesi daima 1
+                olan sendrom bitleri maskesi; sıfır olmayan bir sendromda bu
+                bitlerin paritesi 0 ise çift hatadır
+        """
+        self.total_bits = total_bits
+        self.data_positions = tuple(data_positions)
+        self.parity_positions = tuple(parity_positions)
+        self.overall_parity_position = overall_parity_position
+        self.parity_set = frozenset(parity_positions)
+        
+        # Her kontrol maskesinin kodlamada ayarladığı bit (genel parite en son)
+        self.check_positions = self.parity_positions
+        if overall_parity_position is not None:
+            self.check_positions += (overall_parity_position,)
+        self.check_masks = tuple(check_masks)
+        self.double_mask = double_mask
+        
+        self._build_runs()
+        self._build_syndrome_table()
+    
+    def _build_runs(self):
+        """
+        Veri bitlerini bitişik bloklara (run) ayırır
+        
+        Her blok (kelime maskesi, veri maskesi, kaydırma) üçlüsüdür: kelimedeki
+        blok, verideki karşılığından 'kaydırma' kadar yukarıdadır. Toplama ve
+        dağıtma böylece bit başına değil blok başına iki işlemle yapılır.
+        """
+        runs = []
+        start = 0
+        count = len(self.data_positions)
+        while start < count:
+            end = start + 1
+            while (end < count and
+                   self.data_positions[end] == self.data_positions[end - 1] + 1):
+                end += 1
+            shift = self.data_positions[start] - start
+            data_mask = ((1 << (end - start)) - 1) << start
+            runs.append((data_mask << shift, data_mask, shift))
+            start = end
+        self.runs = tuple(runs)
+    
+    def _build_syndrome_table(self):
+        """
+        Sendrom -> (durum, hata pozisyonu, düzeltme maskesi) tablosunu oluşturur
+        
+        Tek bit hatalarının sendromları, her bitin kontrol maskelerindeki
+        sütunudur ve doğrudan pozisyona eşlenir. Kalan sıfır olmayan sendromlar
+        double_mask bitlerinin paritesine göre çift hata veya bilinmeyen hata
+        olarak işaretlenir.
+        """
+        size = 1 << len(self.check_masks)
+        table = [None] * size
+        table[0] = (ERROR_NONE, None, 0)
+        
+        for position in range(self.total_bits):
+            column = 0
+            for i, mask in enumerate(self.check_masks):
+                if (mask >> position) & 1:
+                    column |= (1 << i)
+            table[column] = (ERROR_SINGLE, position, 1 << position)
+        
+        for index in range(1, size):
+            if table[index] is None:
+                if (index & self.double_mask).bit_count() & 1:
+                    table[index] = (ERROR_UNKNOWN, None, 0)
+                else:
+                    table[index] = (ERROR_DOUBLE, None, 0)
+        
+        self.syndrome_table = tuple(table)
+        
+        # Yalnızca durum kodu gereken hızlı kontrol yolu için
+        self.status_table = bytes(entry[0] for entry in table)
+    
+    def gather(self, codeword):
+        """Kodlanmış kelimeden veri bitlerini toplar (yazılımsal PEXT)"""
+        data = 0
+        for word_mask, _, shift in self.runs:
+            data |= (codeword & word_mask) >> shift
+        return data
+    
+    def scatter(self, data):
+        """Veri bitlerini kodlanmış kelimedeki yerlerine dağıtır (yazılımsal PDEP)"""
+        codeword = 0
+        for _, data_mask, shift in self.runs:
+            codeword |= (data & data_mask) << shift
+        return codeword
+    
+    @classmethod
+    def for_hamming(cls, data_bits):
+        """
+        Verilen veri genişliği için Hamming SEC-DED yerleşimini döndürür
+        
+        Parite bitleri 1'den başlayan 2'nin kuvveti pozisyonlarında, genel
+        parite biti en yüksek bittedir. Yerleşimler genişliğe göre önbelleğe
+        alınır.
+        """
+        layout = _LAYOUT_CACHE.get(('hamming', data_bits))
+        if layout is not None:
+            return layout
+        
+        r = 0
+        while (2**r) < (data_bits + r + 1):
+            r += 1
+        total_bits = data_bits + r + 1
+        
+        parity_positions = [2**i - 1 for i in range(r)]  # 0-indexed
+        data_positions = [i - 1 for i in range(1, total_bits) if i & (i - 1)]
+        
+        # i. parite biti, 1'den başlayan pozisyonu 2^i bitini içeren bitleri
+        # (kendisi dahil) kapsar; son sendrom biti genel paritedir
+        check_masks = []
+        for i in range(r):
+            mask = 0
+            for j in range(1, total_bits):
+                if j & (2**i):
+                    mask |= (1 << (j - 1))
+            check_masks.append(mask)
+        check_masks.append((1 << total_bits) - 1)
+        
+        layout = cls(total_bits, data_positions, parity_positions,
+                     total_bits - 1, check_masks, 1 << r)
+        _LAYOUT_CACHE[('hamming', data_bits)] = layout
+        return layout
+    
+    @classmethod
+    def for_hsiao(cls, data_bits):
+        """
+        Verilen veri genişliği için Hsiao SEC-DED yerleşimini döndürür
+        
+        Yerleşim sistematiktir: veri bitleri 0..k-1 (tek blok, toplama/dağıtma
+        tek işlemdir), r kontrol biti k..k+r-1 pozisyonlarındadır. Kontrol
+        bitlerinin sütunları birim vektörlerdir; veri sütunları önce 3, sonra
+        5, ... ağırlıklı farklı sütunlardan, satır ağırlıkları (kontrol bitinin
+        XOR ağacı) dengeli kalacak şekilde seçilir. Tüm sütunlar tek ağırlıklı
+        olduğundan çift ağırlıklı sıfır olmayan her sendrom çift hatadır.
+        """
+        layout = _LAYOUT_CACHE.get(('hsiao', data_bits))
+        if layout is not None:
+            return layout
+        
+        # En az kontrol biti: 3 ve üzeri tek ağırlıklı sütun sayısı >= k
+        r = 2
+        while sum(comb(r, w) for w in range(3, r + 1, 2)) < data_bits:
+            r += 1
+        total_bits = data_bits + r
+        
+        columns = []
+        loads = [0] * r
+        weight = 3
+        while len(columns) < data_bits:
+            candidates = list(combinations(range(r), weight))
+            needed = data_bits - len(columns)
+            if needed >= len(candidates):
+                # Bu ağırlıktaki tüm sütunlar kullanılır (satırlara eşit dağılır)
+                for rows in candidates:
+                    for i in rows:
+                        loads[i] += 1
+                columns.extend(candidates)
+            else:
+                # Açgözlü dengeleme: satırları en az yüklü sütun seçilir
+                for _ in range(needed):
+                    best = min(candidates, key=lambda rows: sum(loads[i] for i in rows))
+                    candidates.remove(best)
+                    columns.append(best)
+                    for i in best:
+                        loads[i] += 1
+            weight += 2
+        
+        check_masks = []
+        for i in range(r):
+            mask = 1 << (data_bits + i)
+            for j, rows in enumerate(columns):
+                if i in rows:
+                    mask |= 1 << j
+            check_masks.append(mask)
+        
+        layout = cls(total_bits, range(data_bits), range(data_bits, total_bits),
+                     None, check_masks, (1 << r) - 1)
+        _LAYOUT_CACHE[('hsiao', data_bits)] = layout
+        return layout
+    
+    @classmethod
+    def from_matrices(cls, generator, parity_check, double_mask=None):
+        """
+        Üreteç (G) ve eşlik denetim (H) matrislerinden özel bir SEC-DED yerleşimi kurar
+        
+        Satırlar paketlenmiş tam sayılardır: j. bit, j. sütundur (kodlanmış
+        kelimenin j. biti). G sistematik olmalıdır: her veri satırının yalnızca
+        kendisinin 1 olduğu bir sütunu bulunur ve bu sütunlar artan sıradadır.
+        Kalan sütunlar kontrol bitleridir.
+        
+        Args:
+            generator (list): k satır, i. satır i. veri bitinin kodu
+            parity_check (list): n - k satır, H satırları (sendrom bitleri)
+            double_mask (int, optional): Çift hata sendrom maskesi; None ise
+                tüm bitleri 1 olan bir H satırından (genel parite) ya da tüm
+                sütunlar tek ağırlıklıysa tüm sendrom bitlerinden çıkarılır.
+                Çıkarılamazsa geçersiz sendromların hepsi çift hata sayılır.
+        
+        Returns:
+            CodecLayout: Yerleşim (önbelleğe alınmaz)
+        """
+        generator = tuple(generator)
+        parity_check = tuple(parity_check)
+        if not generator or not parity_check:
+            raise ValueError("G ve H matrisleri boş olamaz")
+        
+        total_bits = max(row.bit_length() for row in parity_check)
+        if any(row.bit_length() > total_bits for row in generator):
+            raise ValueError("G ve H sütun sayıları uyuşmuyor")
+        if len(generator) + len(parity_check) != total_bits:
+            raise ValueError(f"H {total_bits - len(generator)} satır olmalıdır")
+        
+        # Her veri satırı için yalnızca o satırda 1 olan ilk sütun
+        data_positions = []
+        for j, row in enumerate(generator):
+            others = 0
+            for i, other in enumerate(generator):
+                if i != j:
+                    others |= other
+            unit = row & ~others
+            if unit == 0:
+                raise ValueError("Üreteç matrisi sistematik olmalıdır")
+            data_positions.append((unit & -unit).bit_length() - 1)
+        if data_positions != sorted(data_positions):
+            raise ValueError("Veri sütunları artan sırada olmalıdır")
+        parity_positions = [p for p in range(total_bits) if p not in data_positions]
+        
+        if any((g & h).bit_count() & 1 for g in generator for h in parity_check):
+            raise ValueError("G ve H uyumsuz: G satırları H ile sıfır sendrom vermiyor")
+        columns = [sum(((h >> p) & 1) << i for i, h in enumerate(parity_check))
+                   for p in range(total_bits)]
+        if 0 in columns or len(set(columns)) != total_bits:
+            raise ValueError("H sütunları sıfırdan farklı ve birbirinden farklı olmalıdır (tek hata düzeltme)")
+        
+        if double_mask is None:
+            full = (1 << total_bits) - 1
+            overall = [i for i, h in enumerate(parity_check) if h == full]
+            if overall:
+                double_mask = 1 << overall[0]
+            elif all(column.bit_count() & 1 for column in columns):
+                double_mask = (1 << len(parity_check)) - 1
+            else:
+                double_mask = 0
+        
+        return cls(total_bits, data_positions, parity_positions, None, parity_check, double_mask)
+
 class HammingCodec:
-    def __init__(self, data_bits=16):
+    # Kod yapısı (get_codec ve CODES ile eşleşir)
+    code = 'hamming'
+    
+    def __init__(self, data_bits=16, engine='mask'):
         """
         Hamming kodlayıcı/kod çözücü sınıfı
         
         Args:
-            data_bits (int): Veri bit uzunluğu (8, 16 veya 32 olabilir)
+            data_bits (int): Veri bit uzunluğu (herhangi bir pozitif tam sayı;
+                             arayüz SUPPORTED_WIDTHS genişliklerini sunar)
+            engine (str): Kodlama motoru ('mask' veya 'lut')
         """
+        if not isinstance(data_bits, int) or data_bits < 1:
+            raise ValueError(f"Veri bit uzunluğu pozitif bir tam sayı olmalıdır: {data_bits}")
+        if engine not in ENGINES:
+            raise ValueError(f"Bilinmeyen motor: {engine} (desteklenenler: {', '.join(ENGINES)})")
+            
         self.data_bits = data_bits
+        self.engine = engine
+        self.compiled = False
+        
+        # Önceden hesaplanmış bit yerleşimi ve sendrom tablosu
+        self.layout = self._build_layout()
         self.parity_bits = self._calculate_parity_bits()
-        self.total_bits = self.data_bits + self.parity_bits + 1  # +1 genel parite biti için
+        self.total_bits = self.layout.total_bits  # Hamming: veri + parite + 1 genel parite biti
+        
+        # Parite kapsama maskeleri (kurulumda bir kez hesaplanır)
+        self._build_masks()
+        self._generator_rows = None  # update() için G satırları, ilk kullanımda
+        
+        # Motora göre kelime düzeyindeki kodlama ve sendrom fonksiyonları
+        if engine == 'lut':
+            self._lut_encode = None  # Tablolar ilk kullanımda yüklenir
+            self._lut_syndrome = None
+            self._encode_word = self._encode_lut
+            self._syndrome_word = self._syndrome_lut
+        else:
+            self._encode_word = self._encode_mask
+            self._syndrome_word = self._syndrome_mask
+    
+    def prepare(self):
+        """
+        İlk kullanımda oluşturulan tüm tabloları şimdi oluşturur
+        
+        Returns:
+            HammingCodec: Codec'in kendisi
+        """
+        if self.engine == 'lut' and self._lut_encode is None:
+            self._load_lut()
+        return self
+    
+    def compile(self, cache_dir=None):
+        """
+        Bu genişlik ve motor için üretilmiş düz çizgi fonksiyonlarına bağlanır
+        
+        encode, decode, check ve detect_and_correct örnek özniteliği olarak
+        derlenmiş fonksiyonlarla değiştirilir; kelime düzeyindeki kodlama ve
+        sendrom fonksiyonları da (decode_into ve toplu tablolar için) onlara
+        bağlanır. Sonuçlar sınıf metotlarıyla aynıdır.
+        
+        Args:
+            cache_dir (str, optional): Derlenmiş kodun saklanacağı disk dizini
+        
+        Returns:
+            HammingCodec: Codec'in kendisi
+        """
+        from hamming_codegen import compile_functions
+        functions = compile_functions(self, cache_dir)
         
+        self._encode_word = functions['encode_word']
+        self._syndrome_word = functions['syndrome']
+        self.encode = functions['encode']
+        self.decode = functions['decode']
+        self.check = functions['check']
+        self.detect_and_correct = functions['detect_and_correct']
+        self.compiled = True
+        return self
+        
+    def _build_layout(self):
+        """Kod yapısının bit yerleşimini döndürür (alt sınıflar değiştirir)"""
+        return CodecLayout.for_hamming(self.data_bits)
+    
     def _calculate_parity_bits(self):
         """Gerekli parite bit sayısını hesaplar: 2^r >= m + r + 1"""
         r = 0
@@ -24,6 +424,20 @@ class HammingCodec:
             r += 1
         return r
         
+    def _build_masks(self):
+        """
+        Her parite bitinin kapsadığı bit pozisyonları için maske oluşturur
+        
+        i. parite maskesi, 1'den başlayan pozisyonu 2^i bitini içeren tüm
+        bitleri (parite bitinin kendisi dahil) kapsar. Genel parite maskesi
+        kodlanmış kelimenin tüm bitlerini kapsar ve en sondadır; böylece
+        kodlamada diğer parite bitleri ayarlandıktan sonra hesaplanır.
+        Maskeler yerleşimden alınır.
+        """
+        self._parity_masks = self.layout.check_masks
+        self._parity_flags = tuple(1 << p for p in self.layout.check_positions)
+        self._code_mask = (1 << self.total_bits) - 1
+        
     def _is_power_of_two(self, num):
         """Bir sayının 2'nin kuvveti olup olmadığını kontrol eder"""
         return num != 0 and (num & (num - 1)) == 0
@@ -42,50 +456,166 @@ class HammingCodec:
         if data.bit_length() > self.data_bits:
             raise ValueError(f"Veri {self.data_bits} bitten büyük olamaz")
         
-        # Kodlanmış veri için yeterli uzunlukta bir dizi oluştur
-        encoded = 0
+        return self._encode_word(data)
         
+    def _encode_mask(self, data):
+        """Veriyi kapsama maskeleri ile kodlar (doğrulama yapmaz)"""
         # Veri bitlerini yerleştir
-        data_idx = 0
-        for i in range(1, self.total_bits):
-            # Parite biti pozisyonlarını atla (2'nin kuvvetleri)
-            if not self._is_power_of_two(i):
-                # Veri bitini uygun pozisyona yerleştir
-                if data & (1 << data_idx):
-                    encoded |= (1 << (i - 1))
-                data_idx += 1
+        encoded = self.layout.scatter(data)
                 
-        # Parite bitlerini hesapla ve yerleştir
-        for i in range(self.parity_bits):
-            parity_pos = 2**i
-            parity_val = 0
+        # Parite bitlerini hesapla ve yerleştir (maske AND + popcount paritesi);
+        # son maske genel paritedir (çift parite, en yüksek bit) ve önceki
+        # parite bitlerini de kapsar
+        for mask, flag in zip(self._parity_masks, self._parity_flags):
+            if (encoded & mask).bit_count() & 1:
+                encoded |= flag
             
-            # Bu parite bitinin kontrol ettiği bitleri topla
-            for j in range(1, self.total_bits):
-                if j & parity_pos:
-                    if encoded & (1 << (j - 1)):
-                        parity_val ^= 1
+        return encoded
+        
+    def _syndrome_mask(self, encoded_data):
+        """
+        Kapsama maskeleri ile sendromu hesaplar
+        
+        Returns:
+            int: Sendrom tablosu indeksi (en üst bitte genel parite)
+        """
+        # Her parite biti, kapsadığı bitlerle (kendisi dahil) birlikte çift
+        # pariteli olmalıdır; son maske genel parite kontrolüdür
+        index = 0
+        for i, mask in enumerate(self.layout.check_masks):
+            if (encoded_data & mask).bit_count() & 1:
+                index |= (1 << i)
+        
+        return index
+        
+    def _load_lut(self):
+        """Bayt tablolarını önbellekten alır, yoksa oluşturup önbelleğe koyar"""
+        tables = _LUT_CACHE.get(self.layout)
+        if tables is None:
+            tables = self._build_lut()
+            _LUT_CACHE[self.layout] = tables
+        self._lut_encode, self._lut_syndrome = tables
+        
+    def _build_lut(self):
+        """
+        Kodlama ve sendrom bayt tablolarını oluşturur
+        
+        Kod doğrusal olduğundan bir kelimenin kodu, bayt şeritlerinin ayrı ayrı
+        kodlarının XOR'udur. Veri baytı şeridi başına 256 girişlik tablo o
+        baytın kodlanmış kelimeye katkısını (veri + parite bitleri), kodlanmış
+        kelime baytı şeridi başına tablo ise sendrom katkısını tutar. Sendrom
+        girdisinde genel parite, sendromun hemen üstündeki bittedir.
+        
+        Returns:
+            tuple: (kodlama tabloları, sendrom tabloları)
+        """
+        encode_tables = []
+        for lane in range((self.data_bits + 7) // 8):
+            shift = 8 * lane
+            valid = ((1 << self.data_bits) - 1) >> shift
+            encode_tables.append(tuple(self._encode_mask((b & valid) << shift) for b in range(256)))
             
-            # Parite bitini yerleştir
-            if parity_val:
-                encoded |= (1 << (parity_pos - 1))
-                
-        # Genel parite bitini hesapla (even parity - çift parite)
-        overall_parity = 0
-        for i in range(self.total_bits - 1):
-            if encoded & (1 << i):
-                overall_parity ^= 1
-        
-        # Genel parite biti en yüksek birimli konuma yerleştirilir
-        if overall_parity:
-            encoded |= (1 << (self.total_bits - 1))
+        syndrome_tables = []
+        for lane in range((self.total_bits + 7) // 8):
+            shift = 8 * lane
+            syndrome_tables.append(tuple(self._syndrome_mask(b << shift) for b in range(256)))
             
+        return tuple(encode_tables), tuple(syndrome_tables)
+        
+    def _encode_lut(self, data):
+        """Veriyi bayt tabloları ile kodlar (doğrulama yapmaz)"""
+        if self._lut_encode is None:
+            self._load_lut()
+            
+        encoded = 0
+        for table, byte in zip(self._lut_encode, data.to_bytes(len(self._lut_encode), 'little')):
+            encoded ^= table[byte]
         return encoded
         
+    def _syndrome_lut(self, encoded_data):
+        """
+        Bayt tabloları ile sendromu hesaplar
+        
+        Returns:
+            int: Sendrom tablosu indeksi (en üst bitte genel parite)
+        """
+        if self._lut_syndrome is None:
+            self._load_lut()
+            
+        index = 0
+        word = (encoded_data & self._code_mask).to_bytes(len(self._lut_syndrome), 'little')
+        for table, byte in zip(self._lut_syndrome, word):
+            index ^= table[byte]
+        return index
+        
+    def decode(self, encoded_data):
+        """
+        Kodlanmış veriyi kontrol eder, varsa tek hatayı düzeltir
+        
+        detect_and_correct ile aynı işi yapar ancak sözlük yerine kompakt
+        bir DecodeResult demeti döndürür.
+        
+        Args:
+            encoded_data (int): Kodlanmış veri
+        
+        Returns:
+            DecodeResult: (durum, hata pozisyonu, düzeltilmiş veri, orijinal veri)
+        """
+        # Sendrom tablosu: tek hatalar doğrudan pozisyona ve düzeltme
+        # maskesine, diğer sendromlar çift/bilinmeyen hataya eşlenir
+        status, position, flip = self.layout.syndrome_table[self._syndrome_word(encoded_data)]
+        
+        # Hatalı biti tersle (hata yoksa maske sıfırdır)
+        corrected = encoded_data ^ flip
+        
+        # namedtuple.__new__ yerine doğrudan tuple.__new__ (daha az çağrı yükü)
+        return _new_tuple(DecodeResult, (status, position, corrected, self.layout.gather(corrected)))
+    
+    def check(self, encoded_data):
+        """
+        Kodlanmış veriyi yalnızca kontrol eder (düzeltme ve veri çıkarma yapmaz)
+        
+        Args:
+            encoded_data (int): Kodlanmış veri
+        
+        Returns:
+            int: Hata durum kodu (ERROR_NONE, ERROR_SINGLE, ERROR_DOUBLE, ERROR_UNKNOWN)
+        """
+        return self.layout.status_table[self._syndrome_word(encoded_data)]
+    
+    def decode_into(self, encoded_data, status, positions, corrected, data, index=0):
+        """
+        Kod çözme sonucunu çağıranın verdiği tamponlara yazar
+        
+        Tamponlar indekslenebilir herhangi bir dizi olabilir (list, array.array,
+        np.ndarray). Sonuç nesnesi oluşturulmaz.
+        
+        Args:
+            encoded_data (int): Kodlanmış veri
+            status: Durum kodlarının yazılacağı tampon
+            positions: Hata pozisyonlarının yazılacağı tampon (tek hata yoksa -1)
+            corrected: Düzeltilmiş kodlanmış verinin yazılacağı tampon
+            data: Orijinal verinin yazılacağı tampon
+            index (int): Tamponlarda yazılacak indeks
+        
+        Returns:
+            int: Hata durum kodu
+        """
+        code, position, flip = self.layout.syndrome_table[self._syndrome_word(encoded_data)]
+        fixed = encoded_data ^ flip
+        
+        status[index] = code
+        positions[index] = -1 if position is None else position
+        corrected[index] = fixed
+        data[index] = self.layout.gather(fixed)
+        return code
+    
     def detect_and_correct(self, encoded_data):
         """
         Kodlanmış veriyi kontrol eder ve varsa hataları tespit edip düzeltir
         
+        decode üzerine kurulu uyumluluk sarmalayıcısıdır.
+        
         Args:
             encoded_data (int): Kodlanmış veri
             
@@ -99,75 +629,44 @@ class HammingCodec:
                     'original_data': int    # Orijinal veri (düzeltmeden sonra)
                 }
         """
-        result = {
-            'error_detected': False,
-            'error_type': 'none',
-            'error_position': None,
-            'corrected_data': encoded_data,
-            'original_data': None
+        status, position, corrected, original = self.decode(encoded_data)
+        
+        return {
+            'error_detected': status != ERROR_NONE,
+            'error_type': ERROR_TYPES[status],
+            'error_position': position,
+            'corrected_data': corrected,
+            'original_data': original
         }
+    
+    def encode_batch(self, data):
+        """
+        Çok sayıda veri kelimesini NumPy ile toplu olarak kodlar
         
-        # Genel parite kontrolü
-        overall_parity = 0
-        for i in range(self.total_bits):
-            if encoded_data & (1 << i):
-                overall_parity ^= 1
-        
-        # Sendrom hesaplama (parite bitleri kontrol edilir)
-        syndrome = 0
-        for i in range(self.parity_bits):
-            parity_pos = 2**i
-            parity_check = 0
-            
-            # Parite biti için tüm bitleri kontrol et
-            for j in range(1, self.total_bits):
-                if j & parity_pos:
-                    if encoded_data & (1 << (j - 1)):
-                        parity_check ^= 1
-            
-            # Parite uyuşmazlığı varsa, sendroma ekle
-            if parity_check != ((encoded_data & (1 << (parity_pos - 1))) != 0):
-                syndrome |= parity_pos
-        
-        # Hata tespiti ve düzeltme
-        if syndrome == 0 and overall_parity == 0:
-            # Hata yok
-            result['error_type'] = 'none'
-            
-        elif syndrome != 0 and overall_parity != 0:
-            # Tek hata - düzeltilebilir
-            result['error_detected'] = True
-            result['error_type'] = 'single'
-            result['error_position'] = syndrome - 1
-            
-            # Hatalı biti tersle
-            result['corrected_data'] = encoded_data ^ (1 << (syndrome - 1))
-            
-        elif syndrome != 0 and overall_parity == 0:
-            # Çift hata - tespit edilebilir ancak düzeltilemez
-            result['error_detected'] = True
-            result['error_type'] = 'double'
-            
-        elif syndrome == 0 and overall_parity != 0:
-            # Genel parite bitinde hata var
-            result['error_detected'] = True
-            result['error_type'] = 'single'
-            result['error_position'] = self.total_bits - 1
-            result['corrected_data'] = encoded_data ^ (1 << (self.total_bits - 1))
-            
-        # Düzeltilmiş veriden orijinal veriyi çıkar
-        corrected = result['corrected_data']
-        original = 0
-        data_idx = 0
+        Args:
+            data (np.ndarray): uint64 veri kelimeleri; kelimesi 64 bitten geniş
+                codec'lerde (N, parça) şekilli küçük uçlu 64 bitlik parçalar
         
-        for i in range(1, self.total_bits):
-            if not self._is_power_of_two(i) and i < self.total_bits - 1:  # Genel parite hariç
-                if corrected & (1 << (i - 1)):
-                    original |= (1 << data_idx)
-                data_idx += 1
+        Returns:
+            np.ndarray: uint64 kodlanmış kelimeler (aynı düzende)
+        """
+        from hamming_batch import get_batch_tables
+        return get_batch_tables(self).encode(data)
+    
+    def decode_batch(self, encoded_data):
+        """
+        Çok sayıda kodlanmış kelimeyi NumPy ile toplu olarak kontrol edip düzeltir
         
-        result['original_data'] = original
-        return result
+        Args:
+            encoded_data (np.ndarray): uint64 kodlanmış kelimeler
+        
+        Returns:
+            tuple: Paralel diziler (durum kodu, hata pozisyonu, düzeltilmiş
+                   kelime, orijinal veri); durum kodları ERROR_* sabitleridir,
+                   hata pozisyonu tek hata yoksa -1'dir
+        """
+        from hamming_batch import get_batch_tables
+        return get_batch_tables(self).decode(encoded_data)
     
     def inject_error(self, encoded_data, position):
         """
@@ -186,6 +685,90 @@ class HammingCodec:
         # Belirtilen pozisyondaki biti tersle
         return encoded_data ^ (1 << position)
     
+    def update(self, encoded_data, data_xor_mask, verify=False):
+        """
+        Kodlanmış kelimenin veri bitlerini tersler ve pariteyi artımlı günceller
+        
+        Kod doğrusal olduğundan veri bitlerini terslemek, kelimeyi o bitlerin
+        G satırlarının XOR'u kadar değiştirir; kelime yeniden kodlanmaz.
+        'lut' motorunda değişen her bayt şeridi için bir tablo araması,
+        'mask' motorunda değişen her bit için bir G satırı kullanılır.
+        
+        Args:
+            encoded_data (int): Kodlanmış veri
+            data_xor_mask (int): Terslenecek veri bitleri (veri bit sırasıyla)
+            verify (bool): Önce kelimeyi kontrol et; tek hatayı düzelt, çift
+                           veya bilinmeyen hatada ValueError yükselt. Kapalıyken
+                           kelimedeki hata değişiklikten sonra da korunur.
+        
+        Returns:
+            int: Güncellenmiş kodlanmış veri
+        """
+        if data_xor_mask.bit_length() > self.data_bits:
+            raise ValueError(f"Veri {self.data_bits} bitten büyük olamaz")
+        if verify:
+            encoded_data = self._verified(encoded_data)
+        
+        return encoded_data ^ self._delta(data_xor_mask)
+    
+    def write_bytes(self, encoded_data, offset, values, verify=False):
+        """
+        Veri kelimesinin bayt şeritlerine yazar (bayt etkinleştirmeli kısmi yazma)
+        
+        Eski baytlar kelimeden okunur, yeni baytlarla farkı update() ile
+        uygulanır; diğer şeritler ve kelime yeniden kodlanmaz.
+        
+        Args:
+            encoded_data (int): Kodlanmış veri
+            offset (int): İlk bayt şeridi (0 = en düşük veri baytı)
+            values (bytes): Yazılacak baytlar
+            verify (bool): update() ile aynı
+        
+        Returns:
+            int: Güncellenmiş kodlanmış veri
+        """
+        lanes = (self.data_bits + 7) // 8
+        if offset < 0 or offset + len(values) > lanes:
+            raise ValueError(f"Bayt şeritleri 0 ile {lanes - 1} arasında olmalıdır")
+        if verify:
+            encoded_data = self._verified(encoded_data)
+        
+        shift = 8 * offset
+        old = (self.layout.gather(encoded_data) >> shift) & ((1 << (8 * len(values))) - 1)
+        return self.update(encoded_data, (old ^ int.from_bytes(values, 'little')) << shift)
+    
+    def _verified(self, encoded_data):
+        """Kelimeyi kontrol eder; tek hatayı düzeltir, düzeltilemez hatada ValueError"""
+        status, _, flip = self.layout.syndrome_table[self._syndrome_word(encoded_data)]
+        if status > ERROR_SINGLE:
+            raise ValueError(f"Kelimede düzeltilemez hata ({ERROR_TYPES[status]}); kısmi yazma yapılmadı")
+        return encoded_data ^ flip
+    
+    def _delta(self, data_xor_mask):
+        """Veri XOR maskesinin kodlanmış kelimedeki karşılığı (maskenin kodu)"""
+        # Yoğun maskelerde bit başına döngü tam kodlamadan yavaştır
+        if self.engine != 'lut' and data_xor_mask.bit_count() > len(self._parity_masks):
+            return self._encode_word(data_xor_mask)
+        
+        delta = 0
+        if self.engine == 'lut':
+            if self._lut_encode is None:
+                self._load_lut()
+            tables = self._lut_encode
+            while data_xor_mask:
+                shift = ((data_xor_mask & -data_xor_mask).bit_length() - 1) & ~7
+                delta ^= tables[shift >> 3][(data_xor_mask >> shift) & 255]
+                data_xor_mask &= ~(255 << shift)
+        else:
+            if self._generator_rows is None:
+                self._generator_rows = self.generator_matrix()
+            rows = self._generator_rows
+            while data_xor_mask:
+                low = data_xor_mask & -data_xor_mask
+                delta ^= rows[low.bit_length() - 1]
+                data_xor_mask ^= low
+        return delta
+    
     def get_bit_string(self, value, total_bits=None):
         """
         Tam sayıyı bit dizisi olarak döndürür
@@ -202,6 +785,25 @@ class HammingCodec:
             
         return bin(value)[2:].zfill(total_bits)
     
+    def generator_matrix(self):
+        """
+        Üreteç matrisi G (paketlenmiş satırlar)
+        
+        Returns:
+            tuple: k tam sayı; j. satır, yalnızca j. veri biti 1 olan verinin kodu
+        """
+        return tuple(self._encode_word(1 << j) for j in range(self.data_bits))
+    
+    def parity_check_matrix(self):
+        """
+        Eşlik denetim matrisi H (paketlenmiş satırlar)
+        
+        Returns:
+            tuple: Sendrom bitleri kadar tam sayı; kodlanmış kelimenin i.
+                   sendrom biti (kelime & H[i]) değerinin paritesidir
+        """
+        return self.layout.check_masks
+    
     def is_parity_bit(self, position):
         """
         Belirtilen pozisyonun bir parite biti olup olmadığını kontrol eder
@@ -212,15 +814,8 @@ class HammingCodec:
         Returns:
             bool: Eğer pozisyon bir parite biti ise True, değilse False
         """
-        # Genel parite biti (en son bit) kontrolü
-        if position == self.total_bits - 1:
-            return False
-            
-        # 1'den başlayan pozisyon (indeks+1)
-        pos_from_one = position + 1
-        
-        # Parite bitleri 2'nin kuvvetleri olan pozisyonlardadır (1, 2, 4, 8, ...)
-        return self._is_power_of_two(pos_from_one)
+        # Genel parite biti parite kümesinde değildir
+        return position in self.layout.parity_set
     
     def get_data_and_parity_positions(self):
         """
@@ -231,21 +826,111 @@ class HammingCodec:
                 {
                     'data_positions': [int, ...],  # Veri bit pozisyonları
                     'parity_positions': [int, ...],  # Parite bit pozisyonları
-                    'overall_parity_position': int   # Genel parite bit pozisyonu
+                    'overall_parity_position': int | None  # Genel parite bit pozisyonu
                 }
         """
-        parity_positions = []
-        data_positions = []
-        
-        for i in range(self.parity_bits):
-            parity_positions.append(2**i - 1)  # 0-indexed
-            
-        for i in range(1, self.total_bits):
-            if not self._is_power_of_two(i) and i < 2**(self.parity_bits):
-                data_positions.append(i - 1)  # 0-indexed
-        
         return {
-            'data_positions': data_positions,
-            'parity_positions': parity_positions,
-            'overall_parity_position': self.total_bits - 1
+            'data_positions': list(self.layout.data_positions),
+            'parity_positions': list(self.layout.parity_positions),
+            'overall_parity_position': self.layout.overall_parity_position
         }
+
+class HsiaoCodec(HammingCodec):
+    """
+    Hsiao SEC-DED kodlayıcı/kod çözücü sınıfı
+    
+    HammingCodec ile aynı API'yi sunar; yalnızca bit yerleşimi farklıdır.
+    Hsiao kodunda genel parite biti yoktur: tüm sütunlar tek ağırlıklıdır,
+    bu yüzden kontrol bitleri daha az biti kapsar (daha sığ XOR ağaçları)
+    ve çift hata, sendromun çift ağırlıklı olmasıyla tespit edilir.
+    Kodlanmış kelimede veri bitleri en altta, kontrol bitleri üsttedir.
+    """
+    code = 'hsiao'
+    
+    def _build_layout(self):
+        """Hsiao bit yerleşimini döndürür"""
+        return CodecLayout.for_hsiao(self.data_bits)
+    
+    def _calculate_parity_bits(self):
+        """Kontrol biti sayısı: 3 ve üzeri tek ağırlıklı sütun sayısı >= m"""
+        return len(self.layout.parity_positions)
+
+class MatrixCodec(HammingCodec):
+    """
+    G ve H matrisleriyle tanımlanan özel SEC-DED kodu (ör. kısaltılmış kodlar)
+    
+    HammingCodec ile aynı API'yi sunar. Kodlamada her kontrol biti, G'nin o
+    sütunundaki veri bitlerinin paritesidir; sendrom doğrudan verilen H ile
+    hesaplanır.
+    """
+    code = 'matrix'
+    
+    def __init__(self, generator, parity_check, engine='mask', double_mask=None):
+        """
+        Args:
+            generator (list): G satırları (paketlenmiş tam sayılar)
+            parity_check (list): H satırları (paketlenmiş tam sayılar)
+            engine (str): Kodlama motoru ('mask' veya 'lut')
+            double_mask (int, optional): Çift hata sendrom maskesi
+        """
+        self._matrix_layout = CodecLayout.from_matrices(generator, parity_check, double_mask)
+        self._generator = tuple(generator)
+        super().__init__(len(self._generator), engine)
+    
+    def _build_layout(self):
+        """Matrislerden kurulan yerleşimi döndürür"""
+        return self._matrix_layout
+    
+    def _calculate_parity_bits(self):
+        """Kontrol biti sayısı: n - k"""
+        return len(self.layout.parity_positions)
+    
+    def _build_masks(self):
+        """
+        Kodlama maskelerini G'den oluşturur
+        
+        c kontrol bitinin maskesi, G'nin c. sütununda 1 olan veri bitlerinin
+        pozisyonları ile c'nin kendisidir; maske başka kontrol biti içermez,
+        bu yüzden kontrol bitleri herhangi bir sırada ayarlanabilir.
+        """
+        masks = []
+        for position in self.layout.parity_positions:
+            mask = 1 << position
+            for row, data_position in zip(self._generator, self.layout.data_positions):
+                if (row >> position) & 1:
+                    mask |= 1 << data_position
+            masks.append(mask)
+        self._parity_masks = tuple(masks)
+        self._parity_flags = tuple(1 << p for p in self.layout.parity_positions)
+        self._code_mask = (1 << self.total_bits) - 1
+
+# Kod yapısı -> codec sınıfı
+CODEC_CLASSES = {'hamming': HammingCodec, 'hsiao': HsiaoCodec}
+
+def get_codec(width, engine='mask', code='hamming', compiled=False):
+    """
+    Verilen genişlik ve motor için önceden hazırlanmış codec örneğini döndürür
+    
+    Örnekler (genişlik, motor) çiftine göre önbelleğe alınır ve ilk oluşturmada
+    tüm tabloları hazırlanır; aynı genişliğe tekrar geçmek yeni hesaplama
+    gerektirmez. Codec örnekleri durumsuzdur, paylaşılarak kullanılabilir.
+    
+    Args:
+        width (int): Veri bit uzunluğu
+        engine (str): Kodlama motoru ('mask' veya 'lut')
+        code (str): Kod yapısı ('hamming' veya 'hsiao')
+        compiled (bool): Üretilmiş düz çizgi fonksiyonlarına bağlı codec döndür
+    
+    Returns:
+        HammingCodec: Hazır codec örneği
+    """
+    key = (width, engine, code, compiled)
+    codec = _CODEC_CACHE.get(key)
+    if codec is None:
+        if code not in CODEC_CLASSES:
+            raise ValueError(f"Bilinmeyen kod: {code} (desteklenenler: {', '.join(CODES)})")
+        codec = CODEC_CLASSES[code](width, engine).prepare()
+        if compiled:
+            codec.compile()
+        _CODEC_CACHE[key] = codec
+    return codec
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Genişliğe özel düz çizgi (straight-line) kodlama/kod çözme fonksiyonları
+
+Sabit bir kod yerleşimi için parite denklemleri sabittir. Bu modül her
+(yerleşim, motor) çifti için döngü ve dal içermeyen Python kaynağı üretir,
+derler ve önbelleğe alır:
+    - 'mask' motoru: her kontrol biti tek bir (kelime & SABİT).bit_count() & 1
+      ifadesidir; kodlamada kontrol bitleri doğrudan veri maskelerinden
+      hesaplanır (kod doğrusaldır), sıralı bağımlılık yoktur
+    - 'lut' motoru: bayt şeridi tabloları açılmış (unrolled) aramaların XOR'udur
+Veri bitlerinin toplanması/dağıtılması da blok (run) başına tek bir maske ve
+kaydırma ifadesine açılır.
+
+Derlenen kod nesneleri bellekte, istenirse diskte de (marshal) önbelleğe
+alınır. Disk önbelleği yerleşim imzası ve Python sürümüyle anahtarlanır.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+from hamming_codec import DecodeResult, ERROR_TYPES
+
+# Üretilen kaynağın biçim sürümü (değiştiğinde disk önbelleği geçersizleşir)
+CODEGEN_VERSION = 1
+
+# Derlenmiş fonksiyonlar: {(CodecLayout, motor): {ad: fonksiyon}}
+_COMPILED_CACHE = {}
+
+def _or_terms(terms):
+    """İfade terimlerini OR ile birleştirir (boşsa 0)"""
+    return ' | '.join(terms) if terms else '0'
+
+def _shifted(expression, shift):
+    """İfadeyi sola (pozitif) veya sağa (negatif) kaydırır; sıfır kaydırma atlanır"""
+    if shift > 0:
+        return f"({expression} << {shift})"
+    if shift < 0:
+        return f"({expression} >> {-shift})"
+    return expression
+
+def _lanes(variable, width, prefix, valid_mask=None):
+    """Bayt şeridi tablo aramalarının açılmış XOR ifadesi"""
+    terms = []
+    for lane in range((width + 7) // 8):
+        byte_mask = 255
+        if valid_mask is not None:
+            byte_mask = (valid_mask >> (8 * lane)) & 255
+        terms.append(f"{prefix}{lane}[{_shifted(variable, -8 * lane)} & {byte_mask:#x}]")
+    return ' ^ '.join(terms)
+
+def generate_source(codec):
+    """
+    Codec'in yerleşimi ve motoru için düz çizgi Python kaynağı üretir
+    
+    Üretilen modül şu fonksiyonları tanımlar: encode, encode_word, syndrome,
+    check, decode, detect_and_correct. Tablolar ve sonuç türleri modül ad
+    alanından (namespace) gelir.
+    
+    Returns:
+        str: Python kaynağı
+    """
+    layout = codec.layout
+    data_bits = codec.data_bits
+    
+    scatter = _or_terms([_shifted(f"(d & {data_mask:#x})", shift)
+                         for _, data_mask, shift in layout.runs])
+    gather = _or_terms([_shifted(f"(c & {word_mask:#x})", -shift)
+                        for word_mask, _, shift in layout.runs])
+    
+    if codec.engine == 'lut':
+        encode = _lanes('d', data_bits, 'E')
+        syndrome = _lanes('w', codec.total_bits, 'S', (1 << codec.total_bits) - 1)
+    else:
+        # Kontrol biti c, veri bitlerinin doğrusal bir fonksiyonudur: c'yi
+        # ayarlayan veri bitleri maskesi birim vektörlerin kodlarından bulunur
+        columns = [codec._encode_mask(1 << j) for j in range(data_bits)]
+        parity = []
+        for position in layout.check_positions:
+            mask = sum(1 << j for j, column in enumerate(columns) if (column >> position) & 1)
+            parity.append(_shifted(f"((d & {mask:#x}).bit_count() & 1)", position))
+        encode = _or_terms([scatter] + parity)
+        syndrome = _or_terms([_shifted(f"((w & {mask:#x}).bit_count() & 1)", i)
+                              for i, mask in enumerate(layout.check_masks)])
+    
+    return f'''# {codec.code} {data_bits} bit, motor: {codec.engine} (üretilmiş kod)
+
+def encode_word(d):
+    return {encode}
+
+def encode(d):
+    if d >> {data_bits}:
+        raise ValueError("Veri {data_bits} bitten büyük olamaz")
+    return {encode}
+
+def syndrome(w):
+    return {syndrome}
+
+def check(w):
+    return STATUS[{syndrome}]
+
+def decode(w):
+    status, position, flip = TABLE[{syndrome}]
+    c = w ^ flip
+    return NEW(RESULT, (status, position, c, {gather}))
+
+def detect_and_correct(w):
+    status, position, flip = TABLE[{syndrome}]
+    c = w ^ flip
+    return {{
+        'error_detected': status != 0,
+        'error_type': TYPES[status],
+        'error_position': position,
+        'corrected_data': c,
+        'original_data': {gather}
+    }}
+'''
+
+def _signature(codec):
+    """Yerleşim, motor ve üretici sürümünden türetilen disk önbelleği anahtarı"""
+    layout = codec.layout
+    key = repr((CODEGEN_VERSION, codec.code, codec.engine, layout.total_bits,
+                layout.data_positions, layout.check_positions, layout.check_masks))
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+def _load_code(codec, cache_dir):
+    """Kaynağı üretip derler; cache_dir verilmişse kod nesnesini diskten okur/yazar"""
+    if cache_dir is None:
+        return compile(generate_source(codec), f"<{codec.code}-{codec.data_bits}-{codec.engine}>", 'exec')
+    
+    name = f"{codec.code}_{codec.data_bits}_{codec.engine}_{_signature(codec)}.{sys.implementation.cache_tag}.bin"
+    path = os.path.join(cache_dir, name)
+    try:
+        with open(path, 'rb') as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    
+    code = compile(generate_source(codec), path, 'exec')
+    os.makedirs(cache_dir, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as f:
+        marshal.dump(code, f)
+    os.replace(temporary, path)
+    return code
+
+def compile_functions(codec, cache_dir=None):
+    """
+    Codec için derlenmiş düz çizgi fonksiyonlarını döndürür
+    
+    Args:
+        codec (HammingCodec): Fonksiyonları üretilecek codec
+        cache_dir (str, optional): Kod nesnelerinin saklanacağı disk dizini
+    
+    Returns:
+        dict: {ad: fonksiyon} (encode, encode_word, syndrome, check, decode,
+              detect_and_correct)
+    """
+    key = (codec.layout, codec.engine)
+    functions = _COMPILED_CACHE.get(key)
+    if functions is not None:
+        return functions
+    
+    codec.prepare()
+    namespace = {
+        'TABLE': codec.layout.syndrome_table,
+        'STATUS': codec.layout.status_table,
+        'NEW': tuple.__new__,
+        'RESULT': DecodeResult,
+        'TYPES': ERROR_TYPES
+    }
+    if codec.engine == 'lut':
+        for lane, table in enumerate(codec._lut_encode):
+            namespace[f"E{lane}"] = table
+        for lane, table in enumerate(codec._lut_syndrome):
+            namespace[f"S{lane}"] = table
+    
+    exec(_load_code(codec, cache_dir), namespace)
+    functions = {name: namespace[name] for name in
+                 ('encode', 'encode_word', 'syndrome', 'check', 'decode', 'detect_and_correct')}
+    _COMPILED_CACHE[key] = functions
+    return functions
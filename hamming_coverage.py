@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hata deseni kapsama analizi (tam sayım)
+
+Kod doğrusal olduğundan bozuk bir kelimenin sendromu yalnızca hata desenine
+bağlıdır: S(c ^ e) = S(e) ve S(e) desendeki bitlerin sütun sendromlarının
+XOR'udur. Bu yüzden tek, çift ve üçlü bit hata desenlerinin tamamı veri
+değerleri yerine sütun sendromları üzerinden sayılır; sonuçlar her kodlanmış
+kelime için aynen geçerlidir.
+
+Her desen şu sonuçlardan birine düşer (hamming_campaign ile aynı kodlar):
+    - corrected   : tek hata doğru düzeltildi
+    - detected    : düzeltilemeyen hata tespit edildi (çift/bilinmeyen)
+    - miscorrected: çoklu hata yanlış bir 'tek hata' olarak düzeltildi (sessiz)
+    - undetected  : hata sendromu sıfır (sessiz)
+
+Çift desenler tek bir vektörel XOR ile, üçlü desenler ise ilk bit başına
+çiftlerin son ekine (i < j < k) yapılan vektörel XOR ile sayılır.
+
+Komut satırı kullanımı:
+    python hamming_coverage.py --width 64
+    python hamming_coverage.py --width 32 --max-weight 3 --per-bit
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from hamming_codec import CODES, ERROR_NONE, ERROR_SINGLE, get_codec
+from hamming_campaign import (OUTCOMES, OUTCOME_CORRECTED, OUTCOME_DETECTED,
+                              OUTCOME_MISCORRECTED, OUTCOME_UNDETECTED)
+
+# Sayımı desteklenen en büyük hata ağırlığı
+MAX_WEIGHT = 3
+
+def column_syndromes(codec):
+    """
+    Her kodlanmış kelime bitinin tek başına oluşturduğu sendrom indeksi
+    
+    Returns:
+        np.ndarray: (toplam bit,) uint32 sütun sendromları
+    """
+    return np.array([codec._syndrome_word(1 << bit) for bit in range(codec.total_bits)],
+                    dtype=np.uint32)
+
+def outcome_table(codec):
+    """
+    Çoklu bit hataları için sendrom indeksi -> sonuç kodu tablosu
+    
+    Çoklu bir desenden bir bit çevrilse bile hata kalır; bu yüzden 'tek hata'
+    durumu çoklu desenlerde daima yanlış düzeltmedir.
+    """
+    status = np.frombuffer(codec.layout.status_table, dtype=np.uint8)
+    table = np.full(status.shape, OUTCOME_DETECTED, dtype=np.uint8)
+    table[status == ERROR_NONE] = OUTCOME_UNDETECTED
+    table[status == ERROR_SINGLE] = OUTCOME_MISCORRECTED
+    return table
+
+class CoverageReport:
+    def __init__(self, width, total_bits, by_weight, by_bit):
+        """
+        Kapsama analizi sonuçları
+        
+        Args:
+            width (int): Veri bit uzunluğu
+            total_bits (int): Kodlanmış kelime bit sayısı
+            by_weight (dict): {hata ağırlığı: (sonuç sayısı,) sayaçlar}
+            by_bit (dict): {hata ağırlığı: (toplam bit, sonuç sayısı) sayaçlar}
+                Bir bitin sayacı, o biti içeren desenlerin sonuçlarıdır.
+        """
+        self.width = width
+        self.total_bits = total_bits
+        self.by_weight = by_weight
+        self.by_bit = by_bit
+    
+    def patterns(self, weight):
+        """Verilen ağırlıktaki toplam desen sayısı"""
+        return int(self.by_weight[weight].sum())
+    
+    def count(self, weight, outcome):
+        """Verilen ağırlık ve sonuç kodu için desen sayısı"""
+        return int(self.by_weight[weight][outcome])
+    
+    def as_dict(self, per_bit=False):
+        """
+        Sonuçları sözlük olarak döndürür
+        
+        Args:
+            per_bit (bool): Bit pozisyonu başına sayaçları da ekle
+        
+        Returns:
+            dict: Ağırlık başına sonuç sayaçları (ve isteğe bağlı bit başına)
+        """
+        result = {'width': self.width, 'total_bits': self.total_bits, 'by_weight': {}}
+        for weight, counts in self.by_weight.items():
+            entry = {'patterns': int(counts.sum())}
+            for outcome, name in enumerate(OUTCOMES):
+                if outcome != 0:
+                    entry[name] = int(counts[outcome])
+            result['by_weight'][weight] = entry
+        
+        if per_bit:
+            result['by_bit'] = {
+                weight: [{name: int(row[outcome]) for outcome, name in enumerate(OUTCOMES) if outcome != 0}
+                         for row in rows]
+                for weight, rows in self.by_bit.items()
+            }
+        return result
+
+def _tally_bits(outcome, bits, total_bits, per_bit):
+    """Desen grubunun sonuçlarını, desendeki her bitin sayacına ekler"""
+    outcomes = len(OUTCOMES)
+    for bit in bits:
+        cells = bit.astype(np.int64) * outcomes + outcome
+        per_bit += np.bincount(cells, minlength=total_bits * outcomes).reshape(total_bits, outcomes)
+
+def analyze(width, max_weight=MAX_WEIGHT, engine='lut', code='hamming'):
+    """
+    Tek, çift ve üçlü bit hata desenlerinin tamamını sayar
+    
+    Args:
+        width (int): Veri bit uzunluğu
+        max_weight (int): Sayılacak en büyük hata ağırlığı (1-3)
+        engine (str): Sütun sendromlarını hesaplayacak kodlama motoru
+        code (str): Kod yapısı ('hamming' veya 'hsiao')
+    
+    Returns:
+        CoverageReport: Ağırlık ve bit pozisyonu başına sonuçlar
+    """
+    if max_weight < 1 or max_weight > MAX_WEIGHT:
+        raise ValueError(f"Hata ağırlığı 1 ile {MAX_WEIGHT} arasında olmalıdır")
+    
+    codec = get_codec(width, engine, code)
+    n = codec.total_bits
+    columns = column_syndromes(codec)
+    table = outcome_table(codec)
+    outcomes = len(OUTCOMES)
+    by_weight = {}
+    by_bit = {}
+    
+    # Tek hatalar: sendrom tablosunun gösterdiği pozisyon hatalı bitin kendisi olmalı
+    counts = np.zeros(outcomes, dtype=np.int64)
+    per_bit = np.zeros((n, outcomes), dtype=np.int64)
+    bits = np.arange(n)
+    position = np.array([codec.layout.syndrome_table[s][1] for s in columns], dtype=object)
+    outcome = np.where(position == bits, OUTCOME_CORRECTED, table[columns]).astype(np.uint8)
+    counts += np.bincount(outcome, minlength=outcomes)
+    _tally_bits(outcome, [bits], n, per_bit)
+    by_weight[1] = counts
+    by_bit[1] = per_bit
+    
+    if max_weight >= 2:
+        # Çiftler ilk bite göre sıralı (i < j) üretilir
+        first, second = np.triu_indices(n, k=1)
+        pairs = columns[first] ^ columns[second]
+        
+        counts = np.zeros(outcomes, dtype=np.int64)
+        per_bit = np.zeros((n, outcomes), dtype=np.int64)
+        outcome = table[pairs]
+        counts += np.bincount(outcome, minlength=outcomes)
+        _tally_bits(outcome, [first, second], n, per_bit)
+        by_weight[2] = counts
+        by_bit[2] = per_bit
+    
+    if max_weight >= 3:
+        # i < j < k: i bitine, ilk biti i'den büyük çiftlerin son eki eklenir
+        starts = np.searchsorted(first, np.arange(n + 1))
+        counts = np.zeros(outcomes, dtype=np.int64)
+        per_bit = np.zeros((n, outcomes), dtype=np.int64)
+        for i in range(n - 2):
+            begin = starts[i + 1]
+            outcome = table[pairs[begin:] ^ columns[i]]
+            ones = np.bincount(outcome, minlength=outcomes)
+            counts += ones
+            per_bit[i] += ones
+            _tally_bits(outcome, [first[begin:], second[begin:]], n, per_bit)
+        by_weight[3] = counts
+        by_bit[3] = per_bit
+    
+    return CoverageReport(width, n, by_weight, by_bit)
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED hata deseni kapsama analizi")
+    parser.add_argument('--width', type=int, default=32, help="Veri bit uzunluğu")
+    parser.add_argument('--max-weight', type=int, default=MAX_WEIGHT, help="En büyük hata ağırlığı (1-3)")
+    parser.add_argument('--code', default='hamming', choices=CODES, help="Kod yapısı")
+    parser.add_argument('--per-bit', action='store_true', help="Bit pozisyonu başına sayaçları yazdır")
+    args = parser.parse_args(argv)
+    
+    try:
+        report = analyze(args.width, args.max_weight, code=args.code)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    
+    summary = report.as_dict(args.per_bit)
+    print(f"{report.width} bit veri, {report.total_bits} bit kodlanmış kelime")
+    for weight, counts in summary['by_weight'].items():
+        print(f"  {weight} bit: {counts}")
+    for weight, rows in summary.get('by_bit', {}).items():
+        print(f"{weight} bitlik desenler, bit pozisyonu başına:")
+        for bit, counts in enumerate(rows):
+            print(f"  bit {bit}: {counts}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EDAC tarzı yapılandırılmış hata olay kaydı
+
+Düzeltilen (CE) ve düzeltilemeyen (UE) hatalar sınırlı kapasiteli bir halka
+tamponda (zaman, adres, tür, pozisyon) kayıtları olarak tutulur. Kayıt
+eklenirken ve tampon dolduğunda en eski kayıt düşerken şu dizinler artımlı
+olarak güncellenir; böylece sorgular geçmişi taramaz:
+
+    - adres başına olay sayısı (ve isteğe bağlı olarak sayfa başına)
+    - adres başına düzeltilemez olay sayısı
+    - bit pozisyonu başına düzeltilen hata sayısı
+
+Dizinler yalnızca tamponda kalan olayları (kayan pencere) yansıtır; toplam
+sayaçlar ise kayıt açıldığından beri tüm olayları sayar. En sık hata veren
+adresler sayı kovalarıyla bulunur: her sayı için o sayıya sahip adres kümesi
+ve boş olmayan sayıların sıralı listesi tutulur. Sayaç güncellemesi O(1)
+(yeni kova açılırken O(log k) arama), en sık n adres ve eşik sorguları
+O(log k + sonuç) sürer (k: farklı sayı değeri adedi).
+
+Kayıt her çağrıyı ayrı bir olay sayar; aynı hatanın tekrar tekrar görülmesini
+ayıklamak olayı üreten tarafın işidir. Devriye tarayıcı kalıcı bir düzeltilemez
+hatayı her geçişte değil, yalnızca ilk görüldüğünde kaydeder; böylece adres
+başına sayılar geçiş sayısıyla büyümez.
+
+Sayfa emekliye ayırma (page retirement) gibi politikalar bu sorgular üzerine
+kurulabilir (ör. addresses_at_least(3) veya hot_pages(10)).
+"""
+
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+# Olay türleri
+EVENT_CORRECTED = 0       # Tek bit hatası düzeltildi (CE)
+EVENT_UNCORRECTABLE = 1   # Düzeltilemez hata (UE)
+
+EVENT_TYPES = ('corrected', 'uncorrectable')
+
+# Varsayılan halka tampon kapasitesi (olay)
+DEFAULT_CAPACITY = 1 << 16
+
+class ErrorEvent(namedtuple('ErrorEvent', ['timestamp', 'address', 'type', 'position'])):
+    """
+    Tek bir hata olayı
+    
+    Alanlar:
+        timestamp (float): Olay zamanı (time.time())
+        address (int): Bellek adresi
+        type (int): EVENT_CORRECTED veya EVENT_UNCORRECTABLE
+        position (int | None): Düzeltilen bit pozisyonu (UE için None)
+    """
+    __slots__ = ()
+    
+    @property
+    def type_name(self):
+        """Olay türü: 'corrected' veya 'uncorrectable'"""
+        return EVENT_TYPES[self.type]
+
+class CountIndex:
+    def __init__(self):
+        """Anahtar başına sayaç ve sayı kovaları (en sık anahtar sorguları için)"""
+        self.counts = {}
+        self.buckets = {}   # sayı -> o sayıya sahip anahtarlar kümesi
+        self.levels = []    # boş olmayan sayılar (artan sırada)
+    
+    def __len__(self):
+        return len(self.counts)
+    
+    def get(self, key):
+        """Anahtarın sayısı (yoksa 0)"""
+        return self.counts.get(key, 0)
+    
+    def _move(self, key, old, new):
+        """Anahtarı 'old' kovasından 'new' kovasına taşır (0: kova yok)"""
+        if old:
+            bucket = self.buckets[old]
+            bucket.discard(key)
+            if not bucket:
+                del self.buckets[old]
+                del self.levels[bisect_left(self.levels, old)]
+        if new:
+            bucket = self.buckets.get(new)
+            if bucket is None:
+                bucket = self.buckets[new] = set()
+                insort(self.levels, new)
+            bucket.add(key)
+            self.counts[key] = new
+        else:
+            del self.counts[key]
+    
+    def increment(self, key):
+        """Anahtarın sayısını bir artırır"""
+        old = self.counts.get(key, 0)
+        self._move(key, old, old + 1)
+    
+    def decrement(self, key):
+        """Anahtarın sayısını bir azaltır (0'a inince anahtar silinir)"""
+        old = self.counts[key]
+        self._move(key, old, old - 1)
+    
+    def top(self, n):
+        """
+        En yüksek sayılı n anahtar (eşit sayılılar arasında sıra belirsizdir)
+        
+        Returns:
+            list: (anahtar, sayı) çiftleri, azalan sayı sırasında
+        """
+        result = []
+        for level in reversed(self.levels):
+            if len(result) >= n:
+                break
+            keys = islice(self.buckets[level], n - len(result))
+            result.extend((key, level) for key in keys)
+        return result
+    
+    def at_least(self, threshold):
+        """
+        Sayısı eşiğe eşit veya büyük anahtarlar
+        
+        Returns:
+            list: (anahtar, sayı) çiftleri, azalan sayı sırasında
+        """
+        result = []
+        for level in reversed(self.levels[bisect_left(self.levels, max(1, threshold)):]):
+            result.extend((key, level) for key in sorted(self.buckets[level]))
+        return result
+
+class EventLog:
+    def __init__(self, capacity=DEFAULT_CAPACITY, page_words=None):
+        """
+        Sınırlı kapasiteli hata olay kaydı
+        
+        Kayıtlar tip dizilerinde tutulur; yazma ve sorgular bir kilitle
+        korunur, böylece arka plan tarayıcısı ile arayüz aynı kaydı kullanabilir.
+        
+        Args:
+            capacity (int): Tamponda tutulacak en fazla olay
+            page_words (int, optional): Sayfa başına kelime; verilirse sayfa
+                                        başına sayaçlar da tutulur
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError(f"Kapasite pozitif bir tam sayı olmalıdır: {capacity}")
+        if page_words is not None and page_words < 1:
+            raise ValueError(f"Sayfa boyutu pozitif olmalıdır: {page_words}")
+        
+        self.capacity = capacity
+        self.page_words = page_words
+        self.lock = threading.Lock()
+        
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.event_addresses = np.zeros(capacity, dtype=np.int64)
+        self.event_types = np.zeros(capacity, dtype=np.uint8)
+        self.positions = np.full(capacity, -1, dtype=np.int32)
+        self.clear()
+    
+    def clear(self):
+        """Tüm kayıtları, dizinleri ve toplam sayaçları sıfırlar"""
+        with self.lock:
+            self.head = 0       # Bir sonraki kaydın yazılacağı yer
+            self.count = 0
+            self.addresses = CountIndex()
+            self.pages = CountIndex()
+            self.uncorrectable = {}
+            self.bits = {}
+            self.totals = [0] * len(EVENT_TYPES)
+            self.dropped = 0    # Tampondan düşen eski olaylar
+    
+    def __len__(self):
+        return self.count
+    
+    def _index(self, address, event_type, position, step):
+        """Bir olayı dizinlere ekler (step=1) veya dizinlerden çıkarır (step=-1)"""
+        update = CountIndex.increment if step > 0 else CountIndex.decrement
+        update(self.addresses, address)
+        if self.page_words is not None:
+            update(self.pages, address // self.page_words)
+        
+        if event_type == EVENT_UNCORRECTABLE:
+            table, key = self.uncorrectable, address
+        else:
+            table, key = self.bits, position
+        count = table.get(key, 0) + step
+        if count:
+            table[key] = count
+        else:
+            del table[key]
+    
+    def _append(self, timestamp, address, event_type, position):
+        """Kaydı tampona ekler, doluysa en eskisini düşürür (kilit tutulur)"""
+        slot = self.head
+        if self.count == self.capacity:
+            old_position = int(self.positions[slot])
+            self._index(int(self.event_addresses[slot]), int(self.event_types[slot]),
+                        old_position if old_position >= 0 else None, -1)
+            self.dropped += 1
+        else:
+            self.count += 1
+        
+        self.timestamps[slot] = timestamp
+        self.event_addresses[slot] = address
+        self.event_types[slot] = event_type
+        self.positions[slot] = -1 if position is None else position
+        self.head = (slot + 1) % self.capacity
+        self._index(address, event_type, position, 1)
+        self.totals[event_type] += 1
+    
+    def record(self, address, event_type, position=None, timestamp=None):
+        """
+        Tek bir hata olayı kaydeder
+        
+        Args:
+            address (int): Bellek adresi
+            event_type (int): EVENT_CORRECTED veya EVENT_UNCORRECTABLE
+            position (int, optional): Düzeltilen bit pozisyonu (CE için)
+            timestamp (float, optional): Olay zamanı (varsayılan: şimdi)
+        """
+        if event_type not in (EVENT_CORRECTED, EVENT_UNCORRECTABLE):
+            raise ValueError(f"Geçersiz olay türü: {event_type}")
+        if event_type == EVENT_CORRECTED and position is None:
+            raise ValueError("Düzeltilen hata için bit pozisyonu gereklidir")
+        
+        timestamp = time.time() if timestamp is None else timestamp
+        with self.lock:
+            self._append(timestamp, int(address), event_type,
+                         None if event_type == EVENT_UNCORRECTABLE else int(position))
+    
+    def record_many(self, addresses, event_type, positions=None, timestamp=None):
+        """
+        Aynı türden birden çok olayı tek kilitle kaydeder (toplu tarama için)
+        
+        Args:
+            addresses (iterable): Adresler
+            event_type (int): EVENT_CORRECTED veya EVENT_UNCORRECTABLE
+            positions (iterable, optional): CE için adreslerle paralel bit pozisyonları
+            timestamp (float, optional): Tüm olaylar için ortak zaman
+        """
+        if event_type not in (EVENT_CORRECTED, EVENT_UNCORRECTABLE):
+            raise ValueError(f"Geçersiz olay türü: {event_type}")
+        
+        addresses = [int(a) for a in addresses]
+        if event_type == EVENT_CORRECTED:
+            if positions is None:
+                raise ValueError("Düzeltilen hatalar için bit pozisyonları gereklidir")
+            positions = [int(p) for p in positions]
+            if len(positions) != len(addresses):
+                raise ValueError("Adres ve pozisyon sayıları eşit olmalıdır")
+        else:
+            positions = [None] * len(addresses)
+        
+        timestamp = time.time() if timestamp is None else timestamp
+        with self.lock:
+            for address, position in zip(addresses, positions):
+                self._append(timestamp, address, event_type, position)
+    
+    def _event(self, slot):
+        """Tampondaki bir kaydı ErrorEvent olarak döndürür (kilit tutulur)"""
+        position = int(self.positions[slot])
+        return ErrorEvent(float(self.timestamps[slot]), int(self.event_addresses[slot]),
+                          int(self.event_types[slot]), position if position >= 0 else None)
+    
+    def recent(self, n=None):
+        """
+        Son n olay (varsayılan: tamponun tamamı)
+        
+        Returns:
+            list: ErrorEvent listesi, eskiden yeniye
+        """
+        with self.lock:
+            n = self.count if n is None else min(n, self.count)
+            first = self.head - n
+            return [self._event(slot % self.capacity) for slot in range(first, self.head)]
+    
+    def address_count(self, address):
+        """Adresin tampondaki olay sayısı (CE + UE)"""
+        with self.lock:
+            return self.addresses.get(address)
+    
+    def uncorrectable_count(self, address):
+        """Adresin tampondaki düzeltilemez olay sayısı"""
+        with self.lock:
+            return self.uncorrectable.get(address, 0)
+    
+    def page_count(self, page):
+        """Sayfanın tampondaki olay sayısı (page_words verilmişse)"""
+        with self.lock:
+            return self.pages.get(page)
+    
+    def bit_count(self, position):
+        """Bit pozisyonunda düzeltilen hata sayısı"""
+        with self.lock:
+            return self.bits.get(position, 0)
+    
+    def bit_counts(self):
+        """
+        Bit pozisyonu başına düzeltilen hata sayıları
+        
+        Returns:
+            dict: {pozisyon: sayı}, pozisyona göre sıralı
+        """
+        with self.lock:
+            return dict(sorted(self.bits.items()))
+    
+    def hot_addresses(self, n=10):
+        """
+        En çok olay kaydedilen n adres
+        
+        Returns:
+            list: (adres, sayı) çiftleri, azalan sayı sırasında
+        """
+        with self.lock:
+            return self.addresses.top(n)
+    
+    def hot_pages(self, n=10):
+        """
+        En çok olay kaydedilen n sayfa (page_words verilmişse)
+        
+        Returns:
+            list: (sayfa, sayı) çiftleri, azalan sayı sırasında
+        """
+        with self.lock:
+            return self.pages.top(n)
+    
+    def addresses_at_least(self, threshold):
+        """
+        Olay sayısı eşiğe ulaşan adresler (emekliye ayırma adayları)
+        
+        Returns:
+            list: (adres, sayı) çiftleri, azalan sayı sırasında
+        """
+        with self.lock:
+            return self.addresses.at_least(threshold)
+    
+    def pages_at_least(self, threshold):
+        """
+        Olay sayısı eşiğe ulaşan sayfalar
+        
+        Returns:
+            list: (sayfa, sayı) çiftleri, azalan sayı sırasında
+        """
+        with self.lock:
+            return self.pages.at_least(threshold)
+    
+    def summary(self):
+        """
+        Toplam sayaçlar ve tampon durumu
+        
+        Returns:
+            dict: corrected, uncorrectable (tüm zamanlar), buffered, dropped,
+                  addresses (olaylı farklı adres sayısı)
+        """
+        with self.lock:
+            return {
+                'corrected': self.totals[EVENT_CORRECTED],
+                'uncorrectable': self.totals[EVENT_UNCORRECTABLE],
+                'buffered': self.count,
+                'dropped': self.dropped,
+                'addresses': len(self.addresses)
+            }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Patlama (burst) hatalarına dayanıklı serpiştirilmiş (interleaved) kodlama
+
+D derinlikli serpiştirmede D kodlanmış kelime bir blokta birleştirilir: j.
+kelimenin i. biti bloğun i*D + j. bitine yazılır. Böylece fiziksel olarak
+komşu bitler farklı kelimelere aittir ve en fazla D bitlik ardışık bir
+patlama, her kelimede en fazla bir (düzeltilebilir) tek bit hatasına dönüşür.
+
+Serpiştirme ve geri çözme bit matrisi devriğidir; bit döngüsü yerine NumPy
+unpackbits / transpose / packbits ile toplu olarak yapılır. Bloklar (blok
+sayısı, blok baytı) şekilli uint8 dizileridir; bloğun bitleri küçük uçlu
+(bayt içinde en düşük bit önce) sıradadır.
+"""
+
+import numpy as np
+
+from hamming_codec import get_codec
+from hamming_batch import as_words, limb_count
+
+# Varsayılan serpiştirme derinliği
+DEFAULT_DEPTH = 8
+
+class InterleavedCodec:
+    def __init__(self, width=32, depth=DEFAULT_DEPTH, engine='lut', code='hamming'):
+        """
+        HammingCodec üzerinde D derinlikli serpiştirme katmanı
+        
+        Args:
+            width (int): Veri bit uzunluğu
+            depth (int): Blok başına kelime (düzeltilebilen en uzun patlama)
+            engine (str): Kodlama motoru
+            code (str): Kod yapısı ('hamming' veya 'hsiao')
+        """
+        if not isinstance(depth, int) or depth < 1:
+            raise ValueError(f"Serpiştirme derinliği pozitif bir tam sayı olmalıdır: {depth}")
+        
+        self.codec = get_codec(width, engine, code)
+        self.code = code
+        self.depth = depth
+        self.total_bits = self.codec.total_bits
+        self.code_limbs = limb_count(self.total_bits)
+        self.block_bits = self.total_bits * depth
+        self.block_bytes = (self.block_bits + 7) // 8
+    
+    def _block_count(self, words):
+        """Kelime sayısının derinliğin katı olduğunu doğrular ve blok sayısını döndürür"""
+        if words % self.depth:
+            raise ValueError(f"Kelime sayısı serpiştirme derinliğinin ({self.depth}) katı olmalıdır")
+        return words // self.depth
+    
+    def interleave(self, codewords):
+        """
+        Kodlanmış kelimeleri D'şerli bloklara serpiştirir
+        
+        Args:
+            codewords (np.ndarray): encode_batch düzeninde kodlanmış kelimeler
+        
+        Returns:
+            np.ndarray: (blok sayısı, blok baytı) uint8 bloklar
+        """
+        words = as_words(codewords, self.code_limbs)
+        blocks = self._block_count(words.shape[0])
+        
+        # (blok, kelime, bit) -> (blok, bit, kelime): bit i, kelime j -> i*D + j
+        bits = np.unpackbits(words.view(np.uint8).reshape(-1), bitorder='little')
+        bits = bits.reshape(blocks, self.depth, self.code_limbs * 64)[:, :, :self.total_bits]
+        
+        # Satır başına paketleme yavaştır: bayt sınırına tamamlanmış düz dizi paketlenir
+        padded = np.zeros((blocks, self.block_bytes * 8), dtype=np.uint8)
+        padded[:, :self.block_bits].reshape(blocks, self.total_bits, self.depth)[:] = bits.transpose(0, 2, 1)
+        return np.packbits(padded.reshape(-1), bitorder='little').reshape(blocks, self.block_bytes)
+    
+    def deinterleave(self, blocks):
+        """
+        Blokları kodlanmış kelimelere geri çözer
+        
+        Args:
+            blocks (np.ndarray): (blok sayısı, blok baytı) uint8 bloklar
+        
+        Returns:
+            np.ndarray: decode_batch düzeninde kodlanmış kelimeler
+        """
+        blocks = np.ascontiguousarray(blocks, dtype=np.uint8)
+        if blocks.ndim != 2 or blocks.shape[1] != self.block_bytes:
+            raise ValueError(f"Blok dizisi şekli (N, {self.block_bytes}) olmalıdır, {blocks.shape} verildi")
+        count = blocks.shape[0]
+        
+        bits = np.unpackbits(blocks.reshape(-1), bitorder='little').reshape(count, -1)[:, :self.block_bits]
+        bits = bits.reshape(count, self.total_bits, self.depth).transpose(0, 2, 1)
+        
+        # Kelime bitleri 64 bitlik parça sınırına tamamlanıp düz olarak paketlenir
+        padded = np.zeros((count, self.depth, self.code_limbs * 64), dtype=np.uint8)
+        padded[:, :, :self.total_bits] = bits
+        words = np.packbits(padded.reshape(-1), bitorder='little').view('<u8')
+        return words if self.code_limbs == 1 else words.reshape(-1, self.code_limbs)
+    
+    def encode(self, data):
+        """
+        Veri kelimelerini kodlar ve serpiştirir
+        
+        Args:
+            data (np.ndarray): encode_batch düzeninde veri (sayısı derinliğin katı)
+        
+        Returns:
+            np.ndarray: (blok sayısı, blok baytı) uint8 bloklar
+        """
+        return self.interleave(self.codec.encode_batch(data))
+    
+    def decode(self, blocks):
+        """
+        Blokları geri çözer, kelimeleri kontrol eder ve tek hataları düzeltir
+        
+        Args:
+            blocks (np.ndarray): (blok sayısı, blok baytı) uint8 bloklar
+        
+        Returns:
+            tuple: decode_batch paralel dizileri (kelimeler blok sırasıyla)
+        """
+        return self.codec.decode_batch(self.deinterleave(blocks))
+    
+    def scrub(self, blocks):
+        """
+        Blokları yerinde düzeltir (düzeltilen kelimeler yeniden serpiştirilir)
+        
+        Returns:
+            np.ndarray: Kelime başına durum kodları
+        """
+        status, _, corrected, _ = self.decode(blocks)
+        blocks[:] = self.interleave(corrected)
+        return status
+
+def inject_burst(blocks, block, start, length):
+    """
+    Bir blokta 'start' bitinden başlayan 'length' bitlik ardışık patlama hatası oluşturur
+    
+    Args:
+        blocks (np.ndarray): (blok sayısı, blok baytı) uint8 bloklar (yerinde değişir)
+        block (int): Blok indeksi
+        start (int): Patlamanın ilk biti
+        length (int): Patlama uzunluğu (bit)
+    """
+    bits = np.unpackbits(blocks[block], bitorder='little')
+    if start < 0 or start + length > bits.size:
+        raise IndexError("Patlama blok sınırlarını aşıyor")
+    bits[start:start + length] ^= 1
+    blocks[block] = np.packbits(bits, bitorder='little')
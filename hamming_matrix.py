@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Üreteç (G) ve eşlik denetim (H) matrisleri ile GF(2) toplu matris çarpımı
+
+Codec'in G ve H matrisleri paketlenmiş satırlar (tam sayılar) olarak
+HammingCodec.generator_matrix() ve parity_check_matrix() ile alınır. Bu modül
+onları NumPy bit matrislerine ve paketlenmiş uint64 satırlarına çevirir;
+toplu kodlama ve sendrom hesabı çok sayıda kelime üzerinde GF(2) matris
+çarpımıdır:
+    kod = veri · G (mod 2)        sendrom = kelime · Hᵀ (mod 2)
+
+Çarpım, 0/1 değerli float32 matrislerin BLAS çarpımı ve ardından mod 2 ile
+yapılır; iç boyut 2^24'ten küçük olduğu sürece tam sonuç verir. Böylece toplu
+verim bit mantığına değil matris çekirdeğine bağlıdır ve herhangi bir özel
+kod (MatrixCodec) aynı yoldan çalışır.
+"""
+
+import numpy as np
+
+from hamming_batch import as_words, get_batch_tables, int_to_limbs, limb_count
+
+# Bellek kullanımını sınırlamak için çarpım başına satır
+DEFAULT_CHUNK_ROWS = 1 << 16
+
+def bit_matrix(rows, bits):
+    """
+    Paketlenmiş satırları (tam sayılar) 0/1 değerli bit matrisine çevirir
+    
+    Returns:
+        np.ndarray: (satır, bits) uint8; [i, j] = i. satırın j. biti
+    """
+    packed = pack_rows(rows, bits)
+    return words_to_bits(packed, bits)
+
+def pack_rows(rows, bits):
+    """
+    Paketlenmiş satırları küçük uçlu uint64 parçalarına çevirir
+    
+    Returns:
+        np.ndarray: (satır, parça) uint64
+    """
+    limbs = limb_count(bits)
+    return np.array([int_to_limbs(row, limbs) for row in rows], dtype=np.uint64).reshape(len(rows), limbs)
+
+def words_to_bits(words, bits):
+    """(N, parça) uint64 kelimeleri (N, bits) 0/1 bit matrisine açar"""
+    words = np.ascontiguousarray(words, dtype='<u8')
+    flat = np.unpackbits(words.view(np.uint8).reshape(-1), bitorder='little')
+    return flat.reshape(words.shape[0], -1)[:, :bits]
+
+def bits_to_words(bits_matrix):
+    """(N, bits) 0/1 bit matrisini (N, parça) uint64 kelimelere paketler"""
+    count, bits = bits_matrix.shape
+    padded = np.zeros((count, limb_count(bits) * 64), dtype=np.uint8)
+    padded[:, :bits] = bits_matrix
+    return np.packbits(padded.reshape(-1), bitorder='little').view('<u8').reshape(count, -1)
+
+def gf2_matmul(a, b):
+    """
+    GF(2) üzerinde bit matrisi çarpımı
+    
+    Args:
+        a (np.ndarray): (N, K) 0/1 matris
+        b (np.ndarray): (K, M) 0/1 matris
+    
+    Returns:
+        np.ndarray: (N, M) uint8, (a · b) mod 2
+    """
+    product = np.matmul(a.astype(np.float32), b.astype(np.float32))
+    return (product.astype(np.int32) & 1).astype(np.uint8)
+
+class MatrixBatch:
+    def __init__(self, codec, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """
+        Codec'in G ve H matrisleriyle toplu kodlama ve kod çözme
+        
+        Args:
+            codec (HammingCodec): Matrisleri kullanılacak codec (MatrixCodec dahil)
+            chunk_rows (int): Çarpım başına işlenecek kelime
+        """
+        self.codec = codec
+        self.chunk_rows = chunk_rows
+        self.data_limbs = limb_count(codec.data_bits)
+        self.code_limbs = limb_count(codec.total_bits)
+        
+        # G: (k, n), Hᵀ: (n, r) float32 bit matrisleri
+        self.generator = bit_matrix(codec.generator_matrix(), codec.total_bits).astype(np.float32)
+        parity_check = codec.parity_check_matrix()
+        self.parity_check_t = bit_matrix(parity_check, codec.total_bits).T.astype(np.float32)
+        self.syndrome_weights = (1 << np.arange(len(parity_check), dtype=np.uint32))
+    
+    def _chunks(self, count):
+        """[start, stop) parça sınırları"""
+        for start in range(0, count, self.chunk_rows):
+            yield start, min(start + self.chunk_rows, count)
+    
+    def encode(self, data):
+        """
+        Veri kelimelerini veri · G (mod 2) ile kodlar
+        
+        Args:
+            data (array-like): encode_batch düzeninde veri kelimeleri
+        
+        Returns:
+            np.ndarray: encode_batch ile aynı düzende kodlanmış kelimeler
+        """
+        words = as_words(data, self.data_limbs)
+        spare = get_batch_tables(self.codec).top_spare_mask
+        if spare is not None and np.any(words[:, -1] & spare):
+            raise ValueError(f"Veri {self.codec.data_bits} bitten büyük olamaz")
+        
+        encoded = np.empty((words.shape[0], self.code_limbs), dtype=np.uint64)
+        for start, stop in self._chunks(words.shape[0]):
+            bits = words_to_bits(words[start:stop], self.codec.data_bits)
+            encoded[start:stop] = bits_to_words(gf2_matmul(bits, self.generator))
+        return encoded.reshape(-1) if self.code_limbs == 1 else encoded
+    
+    def syndrome(self, codewords):
+        """
+        Sendrom tablosu indekslerini kelime · Hᵀ (mod 2) ile hesaplar
+        
+        Returns:
+            np.ndarray: (N,) uint32 sendrom indeksleri
+        """
+        words = as_words(codewords, self.code_limbs)
+        index = np.empty(words.shape[0], dtype=np.uint32)
+        for start, stop in self._chunks(words.shape[0]):
+            bits = words_to_bits(words[start:stop], self.codec.total_bits)
+            index[start:stop] = gf2_matmul(bits, self.parity_check_t) @ self.syndrome_weights
+        return index
+    
+    def decode(self, codewords):
+        """
+        Kodlanmış kelimeleri matris sendromu ile kontrol eder ve düzeltir
+        
+        Returns:
+            tuple: decode_batch ile aynı paralel diziler
+        """
+        words = as_words(codewords, self.code_limbs)
+        return get_batch_tables(self.codec).correct(words, self.syndrome(words))
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diskteki sabit düzenli kodlanmış kelime dosyası üzerinde bellek eşlemeli
+(mmap) ECC bellek görüntüsü
+
+Dosya 64 baytlık bir başlık ve ardından adres başına sabit sayıda küçük uçlu
+64 bitlik parçadan oluşan kodlanmış kelime dizisinden oluşur. Dosya açılırken
+yalnızca başlık okunur; kelime dizisi numpy.memmap ile eşlenir. Okuma ve
+yazmalar yalnızca ilgili sayfalara dokunur, böylece RAM'den büyük görüntüler
+de taranabilir.
+
+Boş (sıfırlarla dolu) görüntü geçerlidir: sıfırın kodu sıfırdır.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from hamming_codec import CODES, ERROR_SINGLE, get_codec
+from hamming_batch import DecodeStats, int_to_limbs, limb_count, limbs_to_int
+
+# Görüntü başlığı: sihirli değer, sürüm, kod yapısı (CODES indeksi; 0: hamming),
+# veri biti, kelime parçası, ayrılmış, adres sayısı
+HEADER = struct.Struct('<4sBBHHHQ')
+HEADER_SIZE = 64
+MAGIC = b'HMIM'
+VERSION = 1
+
+# Tarama ve toplu işlemlerde varsayılan parça (kelime)
+DEFAULT_CHUNK_WORDS = 1 << 20
+
+class MappedMemoryImage:
+    def __init__(self, path, mode='r+', engine='lut'):
+        """
+        Var olan bir bellek görüntüsü dosyasını açar (içerik ayrıştırılmaz)
+        
+        Kod yapısı başlıktan okunur.
+        Args:
+            path (str): Görüntü dosyası
+            mode (str): 'r+' (okuma/yazma) veya 'r' (salt okunur)
+            engine (str): Kodlama motoru
+        """
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER.size)
+        if len(raw) != HEADER.size:
+            raise ValueError("Bellek görüntüsü başlığı eksik")
+        
+        magic, version, code, data_bits, limbs, _, count = HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise ValueError("Geçersiz bellek görüntüsü (sihirli değer uyuşmuyor)")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen görüntü sürümü: {version}")
+        if code >= len(CODES):
+            raise ValueError(f"Görüntüde bilinmeyen kod yapısı: {code}")
+        
+        self.path = path
+        self.code = CODES[code]
+        self.codec = get_codec(data_bits, engine, self.code)
+        self.limbs = limbs
+        self.count = count
+        if limbs != limb_count(self.codec.total_bits):
+            raise ValueError("Başlıktaki kelime boyutu codec ile uyuşmuyor")
+        if os.path.getsize(path) < HEADER_SIZE + count * limbs * 8:
+            raise ValueError("Bellek görüntüsü kısaltılmış")
+        
+        shape = (count,) if limbs == 1 else (count, limbs)
+        self.codewords = np.memmap(path, dtype='<u8', mode=mode,
+                                   offset=HEADER_SIZE, shape=shape)
+    
+    @classmethod
+    def create(cls, path, width, count, engine='lut', code='hamming'):
+        """
+        Verilen genişlik ve adres sayısı için boş bir görüntü dosyası oluşturur
+        
+        Dosya seyrek (sparse) olarak büyütülür; diske sıfır yazılmaz.
+        
+        Args:
+            path (str): Oluşturulacak dosya
+            width (int): Veri bit uzunluğu
+            count (int): Adres sayısı
+            engine (str): Kodlama motoru
+            code (str): Kod yapısı ('hamming' veya 'hsiao')
+        
+        Returns:
+            MappedMemoryImage: Okuma/yazma için açılmış görüntü
+        """
+        codec = get_codec(width, engine, code)
+        limbs = limb_count(codec.total_bits)
+        header = HEADER.pack(MAGIC, VERSION, CODES.index(code), width, limbs, 0, count)
+        
+        with open(path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b'\0'))
+            f.truncate(HEADER_SIZE + count * limbs * 8)
+        
+        return cls(path, 'r+', engine)
+    
+    def __len__(self):
+        return self.count
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _check_address(self, address):
+        """Adresin görüntü sınırları içinde olduğunu doğrular"""
+        if address < 0 or address >= self.count:
+            raise IndexError(f"Adres 0 ile {self.count - 1} arasında olmalıdır")
+    
+    def _check_range(self, start, stop):
+        """[start, stop) aralığının görüntü sınırları içinde olduğunu doğrular"""
+        if start < 0 or stop > self.count or start > stop:
+            raise IndexError(f"Adres aralığı 0 ile {self.count} arasında olmalıdır")
+    
+    def read_raw(self, address):
+        """Adresteki kodlanmış kelimeyi (düzeltmeden) döndürür"""
+        self._check_address(address)
+        if self.limbs == 1:
+            return int(self.codewords[address])
+        return limbs_to_int(self.codewords[address])
+    
+    def write_raw(self, address, codeword):
+        """Adrese kodlanmış kelimeyi olduğu gibi yazar"""
+        self._check_address(address)
+        if self.limbs == 1:
+            self.codewords[address] = codeword
+        else:
+            self.codewords[address] = int_to_limbs(codeword, self.limbs)
+    
+    def read(self, address):
+        """
+        Adresteki kelimeyi çözer (görüntüdeki kelime değiştirilmez)
+        
+        Returns:
+            DecodeResult: Kod çözme sonucu
+        """
+        return self.codec.decode(self.read_raw(address))
+    
+    def write(self, address, data):
+        """Veriyi kodlayıp adrese yazar"""
+        self.write_raw(address, self.codec.encode(data))
+    
+    def update(self, address, data_xor_mask, verify=True):
+        """
+        Adresteki kelimenin veri bitlerini tersler (okuma-değiştirme-yazma)
+        
+        Parite codec.update() ile artımlı güncellenir; verify açıkken tek hata
+        yazmadan önce düzeltilir, düzeltilemez hatada ValueError yükselir ve
+        kelime değişmez.
+        """
+        self.write_raw(address, self.codec.update(self.read_raw(address), data_xor_mask, verify))
+    
+    def write_bytes(self, address, offset, values, verify=True):
+        """Adresteki kelimenin 'offset' bayt şeridinden itibaren baytlarını yazar"""
+        self.write_raw(address, self.codec.write_bytes(self.read_raw(address), offset, values, verify))
+    
+    def inject_error(self, address, position):
+        """Adresteki kelimenin belirtilen bitini tersler"""
+        self.write_raw(address, self.codec.inject_error(self.read_raw(address), position))
+    
+    def read_block(self, start, count):
+        """
+        Ardışık adresleri toplu olarak çözer
+        
+        Returns:
+            tuple: decode_batch paralel dizileri
+        """
+        self._check_range(start, start + count)
+        return self.codec.decode_batch(self.codewords[start:start + count])
+    
+    def write_block(self, start, data):
+        """Veri kelimelerini toplu olarak kodlayıp 'start' adresinden itibaren yazar"""
+        encoded = self.codec.encode_batch(data)
+        self._check_range(start, start + len(encoded))
+        self.codewords[start:start + len(encoded)] = encoded
+    
+    def iter_blocks(self, start=0, stop=None, chunk_words=DEFAULT_CHUNK_WORDS):
+        """
+        Görüntüyü parça parça dolaşır
+        
+        Yields:
+            tuple: (başlangıç adresi, kodlanmış kelime görünümü)
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        for begin in range(start, stop, chunk_words):
+            yield begin, self.codewords[begin:min(begin + chunk_words, stop)]
+    
+    def scrub(self, start=0, stop=None, chunk_words=DEFAULT_CHUNK_WORDS, write_back=True):
+        """
+        Görüntüyü parça parça çözer ve tek bit hatalarını geri yazar
+        
+        Geri yazma yalnızca düzeltilen kelimelere yapılır, temiz sayfalar
+        kirletilmez.
+        
+        Args:
+            start (int): Başlangıç adresi
+            stop (int, optional): Bitiş adresi (hariç), None ise görüntü sonu
+            chunk_words (int): Parça başına kelime
+            write_back (bool): Düzeltilen kelimeleri görüntüye yaz
+        
+        Returns:
+            DecodeStats: Tarama istatistikleri
+        """
+        stats = DecodeStats()
+        for begin, block in self.iter_blocks(start, stop, chunk_words):
+            status, _, corrected, _ = self.codec.decode_batch(block)
+            stats.add(status)
+            if write_back:
+                fixed = np.flatnonzero(status == ERROR_SINGLE)
+                if fixed.size:
+                    block[fixed] = corrected[fixed]
+        return stats
+    
+    def flush(self):
+        """Değişiklikleri diske yazar"""
+        self.codewords.flush()
+    
+    def close(self):
+        """Değişiklikleri diske yazar ve eşlemeyi bırakır"""
+        if self.codewords is not None:
+            self.flush()
+            self.codewords = None
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tip dizileriyle (NumPy) tutulan kompakt ECC bellek bankası
+
+Her adres yalnızca kodlanmış kelimesini tutar: kodlanmış kelimesi 64 bite
+sığan genişliklerde adres başına tek bir uint64 (8 bayt), daha genişlerde
+küçük uçlu 64 bitlik parçalar. Hangi adreslere yazıldığı ayrı bir geçerlilik
+bit haritasında (adres başına 1 bit) tutulur. Orijinal veri ayrıca saklanmaz,
+kelimenin kod çözümünden elde edilir.
+
+Tek adres okuma/yazma O(1)'dir; blok işlemleri encode_batch/decode_batch
+üzerinden doğrudan dizi dilimlerinde yapılır. Yazmalar bankanın kilidi (lock)
+altında yapılır; arka plan tarayıcısı (hamming_scrub) geri yazarken aynı
+kilidi kullanır.
+
+Toplu işlemler (desen doldurma, dosyadan yazma, doğrulama) aralığı sabit
+boyutlu parçalar halinde toplu kodlama/kod çözmeden geçirir.
+"""
+
+import operator
+import os
+import threading
+
+import numpy as np
+
+from hamming_codec import ERROR_SINGLE, get_codec
+from hamming_batch import DecodeStats, int_to_limbs, limb_count, limbs_to_int
+from hamming_patterns import pattern_data
+from hamming_stream import iter_chunks, pack_words
+
+# Toplu işlemlerde parça boyutu (kelime)
+DEFAULT_CHUNK_WORDS = 1 << 20
+
+# Doğrulamada raporlanan en fazla uyuşmayan adres
+MAX_REPORTED = 64
+
+# Bayt başına 1 bit sayısı (geçerlilik sayımı için)
+_POPCOUNT = np.array([bin(b).count('1') for b in range(256)], dtype=np.uint8)
+
+class VerifyReport(DecodeStats):
+    def __init__(self):
+        """Toplu doğrulama sonucu: kod çözme sayaçları ve beklenen veriyle karşılaştırma"""
+        super().__init__()
+        self.mismatched = 0    # Çözülen verisi beklenenden farklı (veya düzeltilemez)
+        self.unwritten = 0     # Hiç yazılmamış adresler (uyuşmayan sayılır)
+        self.mismatch_addresses = []
+    
+    @property
+    def ok(self):
+        """Tüm adresler beklenen veriyi veriyor mu"""
+        return self.mismatched == 0
+    
+    def as_dict(self):
+        """Sayaçları sözlük olarak döndürür"""
+        result = super().as_dict()
+        result.update({
+            'mismatched': self.mismatched,
+            'unwritten': self.unwritten,
+            'mismatch_addresses': list(self.mismatch_addresses)
+        })
+        return result
+
+class MemoryBank:
+    def __init__(self, width, size, engine='mask', code='hamming'):
+        """
+        Verilen genişlik ve adres sayısı için boş bir bellek bankası oluşturur
+        
+        Diziler sıfırla ayrılır; işletim sistemi dokunulmamış sayfaları
+        fiziksel belleğe yerleştirmez.
+        
+        Args:
+            width (int): Veri bit uzunluğu
+            size (int): Adres sayısı
+            engine (str): Kodlama motoru (varsayılan get_codec ile aynı; arayüz
+                codec'i ile bankanın codec'i aynı nesnedir)
+            code (str): Kod yapısı
+        """
+        if not isinstance(size, int) or size < 1:
+            raise ValueError(f"Adres sayısı pozitif bir tam sayı olmalıdır: {size}")
+        
+        self.codec = get_codec(width, engine, code)
+        self.width = width
+        self.size = size
+        self.limbs = limb_count(self.codec.total_bits)
+        
+        shape = (size,) if self.limbs == 1 else (size, self.limbs)
+        self.codewords = np.zeros(shape, dtype='<u8')
+        self.valid = np.zeros((size + 7) // 8, dtype=np.uint8)
+        self.lock = threading.Lock()
+    
+    def __len__(self):
+        return self.size
+    
+    def __contains__(self, address):
+        """Adrese yazılmış mı (dict'teki 'in' gibi; geçersiz adres False)"""
+        try:
+            address = operator.index(address)
+        except TypeError:
+            return False
+        if address < 0 or address >= self.size:
+            return False
+        return self._is_valid(address)
+    
+    @property
+    def nbytes(self):
+        """Kelime dizisi ve geçerlilik haritasının toplam boyutu (bayt)"""
+        return self.codewords.nbytes + self.valid.nbytes
+    
+    def _check_address(self, address):
+        """Adresin banka sınırları içinde olduğunu doğrular"""
+        if address < 0 or address >= self.size:
+            raise IndexError(f"Adres 0 ile {self.size - 1} arasında olmalıdır")
+    
+    def _check_range(self, start, stop):
+        """[start, stop) aralığının banka sınırları içinde olduğunu doğrular"""
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Adres aralığı 0 ile {self.size} arasında olmalıdır")
+    
+    def _is_valid(self, address):
+        """Adresin geçerlilik biti (sınır kontrolü yapılmaz)"""
+        return bool((self.valid[address >> 3] >> (address & 7)) & 1)
+    
+    def _mark(self, start, stop, valid=True):
+        """[start, stop) adreslerinin geçerlilik bitlerini ayarlar"""
+        if start >= stop:
+            return
+        first, last = start >> 3, (stop - 1) >> 3
+        head = (0xFF << (start & 7)) & 0xFF
+        tail = 0xFF >> (7 - ((stop - 1) & 7))
+        if first == last:
+            masks = ((first, head & tail),)
+        else:
+            masks = ((first, head), (last, tail))
+            self.valid[first + 1:last] = 0xFF if valid else 0
+        for index, mask in masks:
+            if valid:
+                self.valid[index] |= mask
+            else:
+                self.valid[index] &= ~mask & 0xFF
+    
+    def read_raw(self, address):
+        """
+        Adresteki kodlanmış kelimeyi (düzeltmeden) döndürür
+        
+        Raises:
+            KeyError: Adrese hiç yazılmamışsa
+        """
+        self._check_address(address)
+        if not self._is_valid(address):
+            raise KeyError(f"{address} adresinde veri yok")
+        if self.limbs == 1:
+            return int(self.codewords[address])
+        return limbs_to_int(self.codewords[address])
+    
+    def write_raw(self, address, codeword):
+        """Adrese kodlanmış kelimeyi olduğu gibi yazar ve adresi geçerli işaretler"""
+        self._check_address(address)
+        with self.lock:
+            self._store(address, codeword)
+    
+    def _store(self, address, codeword):
+        """Kelimeyi yazar (kilit çağıran tarafından tutulur)"""
+        if self.limbs == 1:
+            self.codewords[address] = codeword
+        else:
+            self.codewords[address] = int_to_limbs(codeword, self.limbs)
+        self.valid[address >> 3] |= 1 << (address & 7)
+    
+    def read(self, address):
+        """
+        Adresteki kelimeyi çözer (bankadaki kelime değiştirilmez)
+        
+        Returns:
+            DecodeResult: Kod çözme sonucu
+        """
+        return self.codec.decode(self.read_raw(address))
+    
+    def write(self, address, data):
+        """Veriyi kodlayıp adrese yazar"""
+        self.write_raw(address, self.codec.encode(data))
+    
+    def inject_error(self, address, position):
+        """Adresteki kelimenin belirtilen bitini tersler"""
+        with self.lock:
+            self._store(address, self.codec.inject_error(self.read_raw(address), position))
+    
+    def clear(self, start=0, stop=None):
+        """[start, stop) adreslerini siler (varsayılan: tüm banka)"""
+        stop = self.size if stop is None else stop
+        self._check_range(start, stop)
+        with self.lock:
+            self.codewords[start:stop] = 0
+            self._mark(start, stop, False)
+    
+    def read_block(self, start, count):
+        """
+        Ardışık adresleri toplu olarak çözer (geçerlilik dikkate alınmaz)
+        
+        Returns:
+            tuple: decode_batch paralel dizileri
+        """
+        self._check_range(start, start + count)
+        return self.codec.decode_batch(self.codewords[start:start + count])
+    
+    def write_block(self, start, data):
+        """Veri kelimelerini toplu olarak kodlayıp 'start' adresinden itibaren yazar"""
+        encoded = self.codec.encode_batch(data)
+        self._check_range(start, start + len(encoded))
+        with self.lock:
+            self.codewords[start:start + len(encoded)] = encoded
+            self._mark(start, start + len(encoded))
+    
+    def valid_mask(self, start=0, stop=None):
+        """
+        [start, stop) adreslerinin geçerlilik bayrakları
+        
+        Returns:
+            np.ndarray: bool dizisi
+        """
+        stop = self.size if stop is None else stop
+        self._check_range(start, stop)
+        first = start >> 3
+        bits = np.unpackbits(self.valid[first:(stop + 7) >> 3], bitorder='little')
+        return bits[start - 8 * first:stop - 8 * first].astype(bool)
+    
+    def addresses(self, start=0, stop=None):
+        """
+        [start, stop) aralığında yazılmış adresler (artan sırada)
+        
+        Returns:
+            np.ndarray: Adres dizisi
+        """
+        return np.flatnonzero(self.valid_mask(start, stop)) + start
+    
+    def valid_count(self):
+        """Yazılmış adres sayısı"""
+        return int(_POPCOUNT[self.valid].sum(dtype=np.int64))
+
+    def fill(self, start, count, pattern, seed=0, chunk_words=DEFAULT_CHUNK_WORDS):
+        """
+        [start, start + count) aralığını bir veri deseniyle doldurur
+        
+        Args:
+            start (int): İlk adres
+            count (int): Kelime sayısı
+            pattern (str): hamming_patterns.PATTERNS içinden desen
+            seed (int): 'random' deseni için tohum
+            chunk_words (int): Parça başına kelime
+        """
+        self._check_range(start, start + count)
+        for begin in range(start, start + count, chunk_words):
+            size = min(chunk_words, start + count - begin)
+            self.write_block(begin, pattern_data(pattern, self.width, begin, size, seed))
+    
+    def _file_blocks(self, path, chunk_words):
+        """Dosyayı veri kelimesi blokları olarak okur (son kelime sıfırla tamamlanır)"""
+        if self.width % 8:
+            raise ValueError(f"Dosyadan yazma bayt hizalı genişlik gerektirir: {self.width}")
+        word_bytes = self.width // 8
+        limbs = limb_count(self.width)
+        with open(path, 'rb') as f:
+            for chunk in iter_chunks(f, chunk_words * word_bytes, word_bytes):
+                if len(chunk) % word_bytes:
+                    chunk += bytes(word_bytes - len(chunk) % word_bytes)
+                words = pack_words(chunk, word_bytes, limbs)
+                yield words.reshape(-1) if limbs == 1 else words
+    
+    def write_file(self, path, start=0, chunk_words=DEFAULT_CHUNK_WORDS):
+        """
+        Dosyanın ham içeriğini 'start' adresinden itibaren veri olarak yazar
+        
+        Her kelime genişlik/8 bayttır (küçük uçlu). Dosya boyutu yazmadan önce
+        kontrol edilir; bankaya sığmayan dosya için hiçbir adres değiştirilmez.
+        
+        Returns:
+            int: Yazılan kelime sayısı
+        
+        Raises:
+            ValueError: Dosya 'start' adresinden itibaren bankaya sığmıyorsa
+        """
+        if self.width % 8:
+            raise ValueError(f"Dosyadan yazma bayt hizalı genişlik gerektirir: {self.width}")
+        self._check_address(start)
+        word_bytes = self.width // 8
+        words = -(-os.path.getsize(path) // word_bytes)
+        if words > self.size - start:
+            raise ValueError(f"Dosya ({words} kelime) {start} adresinden itibaren bankaya sığmıyor "
+                             f"({self.size - start} kelime)")
+        
+        address = start
+        for data in self._file_blocks(path, chunk_words):
+            self.write_block(address, data)
+            address += len(data)
+        return address - start
+    
+    def verify(self, start, expected, report=None):
+        """
+        Adresleri okuyup (düzelterek, geri yazmadan) beklenen veriyle karşılaştırır
+        
+        Args:
+            start (int): İlk adres
+            expected (np.ndarray): encode_batch düzeninde beklenen veri
+            report (VerifyReport, optional): Sonuçların ekleneceği rapor
+        
+        Returns:
+            VerifyReport: Doğrulama raporu
+        """
+        report = VerifyReport() if report is None else report
+        count = len(expected)
+        status, _, _, data = self.read_block(start, count)
+        valid = self.valid_mask(start, start + count)
+        
+        same = data == expected
+        if same.ndim > 1:
+            same = same.all(axis=1)
+        good = same & valid & (status <= ERROR_SINGLE)
+        
+        report.add(status[valid])
+        report.unwritten += int(count - np.count_nonzero(valid))
+        bad = np.flatnonzero(~good)
+        report.mismatched += int(bad.size)
+        room = MAX_REPORTED - len(report.mismatch_addresses)
+        report.mismatch_addresses.extend(int(start + i) for i in bad[:max(0, room)])
+        return report
+    
+    def verify_pattern(self, start, count, pattern, seed=0, chunk_words=DEFAULT_CHUNK_WORDS):
+        """
+        Aralığı fill() ile yazılan desene göre doğrular (desen parça parça yeniden üretilir)
+        
+        Returns:
+            VerifyReport: Doğrulama raporu
+        """
+        self._check_range(start, start + count)
+        report = VerifyReport()
+        for begin in range(start, start + count, chunk_words):
+            size = min(chunk_words, start + count - begin)
+            self.verify(begin, pattern_data(pattern, self.width, begin, size, seed), report)
+        return report
+    
+    def verify_file(self, path, start=0, chunk_words=DEFAULT_CHUNK_WORDS):
+        """
+        Aralığı write_file() ile yazılan dosyaya göre doğrular
+        
+        Returns:
+            VerifyReport: Doğrulama raporu
+        """
+        report = VerifyReport()
+        address = start
+        for data in self._file_blocks(path, chunk_words):
+            self._check_range(address, address + len(data))
+            self.verify(address, data, report)
+            address += len(data)
+        return report
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HammingCodec için isteğe bağlı ölçüm katmanı
+
+instrument(codec) çağrıldığında codec'in public metotları örnek (instance)
+özniteliği olarak zaman ölçen sarmalayıcılarla değiştirilir; uninstrument(codec)
+önceki bağlamaları (sınıf metotları veya derlenmiş fonksiyonlar) geri yükler. Böylece ölçüm kapalıyken
+çağrı yolunda hiçbir ek kontrol yoktur.
+
+Toplanan ölçümler:
+    - kodlanan ve çözülen kelime sayaçları
+    - temiz, düzeltilen, çift ve bilinmeyen hata sayaçları
+    - bit pozisyonu başına düzeltme histogramı
+    - işlem başına HDR tarzı (log-doğrusal kovalı) gecikme histogramları
+
+Sayaç güncellemeleri bir kilitle korunur; snapshot() tutarlı bir kopya döndürür
+ve isteğe bağlı olarak sayaçları aynı anda sıfırlar.
+
+Not: get_codec() aynı codec nesnesini paylaştırır; paylaşılan bir codec'e
+ölçüm eklemek onu kullanan herkesin çağrılarını ölçer.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from hamming_codec import ERROR_NONE, ERROR_SINGLE, ERROR_DOUBLE, ERROR_UNKNOWN, ERROR_TYPES
+
+# Gecikme histogramı çözünürlüğü: 2'nin her kuvveti 2^SUB_BITS alt kovaya bölünür
+# (yaklaşık %3 bağıl hata)
+SUB_BITS = 5
+SUB_COUNT = 1 << SUB_BITS
+
+# 63 bitlik bir değerin düşebileceği en büyük kova + 1
+BUCKET_COUNT = (63 - SUB_BITS) * SUB_COUNT + 2 * SUB_COUNT
+
+# Raporlanan gecikme yüzdelikleri
+PERCENTILES = (50, 90, 99, 99.9)
+
+# Ölçülen codec metotları
+INSTRUMENTED = ('encode', 'decode', 'check', 'decode_into', 'encode_batch', 'decode_batch',
+                'detect_and_correct')
+
+def bucket_index(value):
+    """Değerin (ns) histogram kovası: 2*SUB_COUNT altı doğrudan, üstü log-doğrusal"""
+    shift = value.bit_length() - SUB_BITS - 1
+    if shift <= 0:
+        return value
+    return shift * SUB_COUNT + (value >> shift)
+
+def bucket_upper(index):
+    """Kovaya düşen en büyük değer"""
+    shift = max(0, index // SUB_COUNT - 1)
+    return ((index - shift * SUB_COUNT) << shift) + (1 << shift) - 1
+
+class LatencyHistogram:
+    def __init__(self):
+        """HDR tarzı gecikme histogramı (nanosaniye)"""
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+    
+    def record(self, value):
+        """Bir gecikme değeri (ns) ekler"""
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def percentile(self, percent):
+        """
+        Verilen yüzdeliğe karşılık gelen gecikme (kova üst sınırı, ns)
+        
+        Returns:
+            int | None: Gecikme veya histogram boşsa None
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, int(np.ceil(self.count * percent / 100.0)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper(index), self.max)
+        return self.max
+    
+    def as_dict(self):
+        """Özet istatistikleri sözlük olarak döndürür"""
+        result = {
+            'count': self.count,
+            'min_ns': self.min,
+            'max_ns': self.max if self.count else None,
+            'mean_ns': self.total / self.count if self.count else None
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent:g}_ns"] = self.percentile(percent)
+        return result
+
+class CodecMetrics:
+    def __init__(self, total_bits):
+        """
+        Codec çağrıları için iş parçacığı güvenli sayaçlar ve histogramlar
+        
+        Args:
+            total_bits (int): Kodlanmış kelime bit sayısı (pozisyon histogramı için)
+        """
+        self.total_bits = total_bits
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Tüm sayaçları ve histogramları sıfırlar"""
+        with self._lock:
+            self._reset()
+    
+    def _reset(self):
+        """Sayaçları sıfırlar (kilit çağıran tarafından tutulur)"""
+        self.encoded = 0
+        self.decoded = 0
+        self.status_counts = [0, 0, 0, 0]
+        self.corrections = [0] * self.total_bits
+        self.latency = {}
+    
+    def _latency(self, operation):
+        """İşlemin gecikme histogramı, yoksa oluşturulur"""
+        histogram = self.latency.get(operation)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.latency[operation] = histogram
+        return histogram
+    
+    def record_encode(self, operation, words, elapsed):
+        """Kodlama çağrısını kaydeder"""
+        with self._lock:
+            self.encoded += words
+            self._latency(operation).record(elapsed)
+    
+    def record_decode(self, operation, status, position, elapsed):
+        """Tek kelimelik kod çözme veya kontrol çağrısını kaydeder"""
+        with self._lock:
+            self.decoded += 1
+            self.status_counts[status] += 1
+            if status == ERROR_SINGLE and position is not None and position >= 0:
+                self.corrections[position] += 1
+            self._latency(operation).record(elapsed)
+    
+    def record_batch(self, operation, status, position, elapsed):
+        """Toplu kod çözme çağrısını kaydeder (dizi başına bir bincount)"""
+        status_counts = np.bincount(status, minlength=4)
+        fixed = position[status == ERROR_SINGLE]
+        corrections = np.bincount(fixed, minlength=self.total_bits)
+        with self._lock:
+            self.decoded += int(status.size)
+            for code in range(4):
+                self.status_counts[code] += int(status_counts[code])
+            for bit in np.flatnonzero(corrections):
+                self.corrections[bit] += int(corrections[bit])
+            self._latency(operation).record(elapsed)
+    
+    def snapshot(self, reset=False):
+        """
+        Ölçümlerin tutarlı bir kopyasını döndürür
+        
+        Args:
+            reset (bool): Kopyalandıktan sonra sayaçları aynı kilit altında sıfırla
+        
+        Returns:
+            dict: Sayaçlar, pozisyon histogramı ve işlem başına gecikme özetleri
+        """
+        with self._lock:
+            result = {
+                'encoded': self.encoded,
+                'decoded': self.decoded,
+                'clean': self.status_counts[ERROR_NONE],
+                'corrected': self.status_counts[ERROR_SINGLE],
+                'double': self.status_counts[ERROR_DOUBLE],
+                'unknown': self.status_counts[ERROR_UNKNOWN],
+                'corrections_by_position': list(self.corrections),
+                'latency': {operation: histogram.as_dict()
+                            for operation, histogram in self.latency.items()}
+            }
+            if reset:
+                self._reset()
+        return result
+
+def instrument(codec, metrics=None):
+    """
+    Codec'in public metotlarını ölçüm sarmalayıcılarıyla değiştirir
+    
+    detect_and_correct, sınıf metodu decode üzerinden geçtiği için yalnızca
+    derlenmiş codec'lerde (compile()) ayrıca sarılır. Zaten ölçülen bir codec için mevcut ölçüm nesnesi döndürülür.
+    
+    Args:
+        codec (HammingCodec): Ölçülecek codec
+        metrics (CodecMetrics, optional): Paylaşılacak ölçüm nesnesi
+    
+    Returns:
+        CodecMetrics: Codec'e bağlı ölçüm nesnesi
+    """
+    if 'metrics' in codec.__dict__:
+        return codec.metrics
+    if metrics is None:
+        metrics = CodecMetrics(codec.total_bits)
+    
+    # Geri yüklenecek örnek öznitelikleri (yoksa sınıf metodu kullanılır)
+    codec._uninstrumented = {name: codec.__dict__[name] for name in INSTRUMENTED
+                             if name in codec.__dict__}
+    
+    clock = time.perf_counter_ns
+    encode = codec.encode
+    decode = codec.decode
+    check = codec.check
+    decode_into = codec.decode_into
+    encode_batch = codec.encode_batch
+    decode_batch = codec.decode_batch
+    detect_and_correct = codec.detect_and_correct
+    
+    def timed_encode(data):
+        start = clock()
+        result = encode(data)
+        metrics.record_encode('encode', 1, clock() - start)
+        return result
+    
+    def timed_decode(encoded_data):
+        start = clock()
+        result = decode(encoded_data)
+        metrics.record_decode('decode', result[0], result[1], clock() - start)
+        return result
+    
+    def timed_check(encoded_data):
+        start = clock()
+        status = check(encoded_data)
+        metrics.record_decode('check', status, None, clock() - start)
+        return status
+    
+    def timed_decode_into(encoded_data, status, positions, corrected, data, index=0):
+        start = clock()
+        code = decode_into(encoded_data, status, positions, corrected, data, index)
+        metrics.record_decode('decode_into', code, positions[index], clock() - start)
+        return code
+    
+    def timed_encode_batch(data):
+        start = clock()
+        result = encode_batch(data)
+        metrics.record_encode('encode_batch', len(result), clock() - start)
+        return result
+    
+    def timed_decode_batch(encoded_data):
+        start = clock()
+        result = decode_batch(encoded_data)
+        metrics.record_batch('decode_batch', result[0], result[1], clock() - start)
+        return result
+    
+    def timed_detect_and_correct(encoded_data):
+        start = clock()
+        result = detect_and_correct(encoded_data)
+        metrics.record_decode('detect_and_correct', ERROR_TYPES.index(result['error_type']),
+                              result['error_position'], clock() - start)
+        return result
+    
+    if 'detect_and_correct' in codec.__dict__:
+        codec.detect_and_correct = timed_detect_and_correct
+    codec.encode = timed_encode
+    codec.decode = timed_decode
+    codec.check = timed_check
+    codec.decode_into = timed_decode_into
+    codec.encode_batch = timed_encode_batch
+    codec.decode_batch = timed_decode_batch
+    codec.metrics = metrics
+    return metrics
+
+def uninstrument(codec):
+    """
+    Ölçüm sarmalayıcılarını kaldırır ve önceki bağlamaları geri yükler
+    
+    Returns:
+        CodecMetrics | None: Kaldırılan ölçüm nesnesi
+    """
+    previous = codec.__dict__.pop('_uninstrumented', {})
+    for name in INSTRUMENTED:
+        codec.__dict__.pop(name, None)
+    codec.__dict__.update(previous)
+    return codec.__dict__.pop('metrics', None)
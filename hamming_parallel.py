@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çok çekirdekli toplu Hamming SEC-DED kodlama, kod çözme ve tarama
+
+Tampon, paylaşılan bellek (multiprocessing.shared_memory) bloklarına bir kez
+kopyalanır ve ProcessPoolExecutor işçileri arasında parçalara (shard) bölünür.
+İşçiler aynı bloklara adıyla bağlanır; yük verisi hiçbir zaman pickle ile
+taşınmaz, yalnızca blok adları ve parça sınırları gönderilir. Parça başına
+istatistikler sonda birleştirilir.
+
+Disk görüntüsü taramasında işçiler aynı dosyayı kendileri eşler (mmap), bu
+durumda kopyalama da yapılmaz.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from hamming_codec import ERROR_SINGLE, get_codec
+from hamming_batch import DecodeStats, as_words, limb_count
+from hamming_memmap import MappedMemoryImage
+
+# Varsayılan parça boyutu (kelime)
+DEFAULT_CHUNK_WORDS = 1 << 20
+
+def _create_shared(shape, dtype):
+    """Verilen şekilde yeni bir paylaşılan bellek bloğu ve üzerinde dizi oluşturur"""
+    size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _attach(spec):
+    """(ad, şekil, tür) tanımıyla var olan paylaşılan bloğa bağlanır"""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _release(blocks):
+    """Bağlanılan blokları kapatır (dizi görünümleri önceden bırakılmalıdır)"""
+    for shm in blocks:
+        shm.close()
+
+def _run_shard(source, targets, start, stop, work):
+    """
+    İşçide paylaşılan bloklara bağlanır, 'work' ile aralığı işler ve bağlantıyı kapatır
+    
+    Paylaşılan belleğin kapatılabilmesi için dizi görünümleri dönüşten önce
+    bırakılır.
+    """
+    blocks = []
+    arrays = []
+    try:
+        for spec in (source,) + tuple(targets):
+            shm, array = _attach(spec)
+            blocks.append(shm)
+            arrays.append(array)
+        return work(arrays[0][start:stop], [array[start:stop] for array in arrays[1:]])
+    finally:
+        arrays.clear()
+        _release(blocks)
+
+def _encode_shard(width, engine, code, source, targets, start, stop):
+    """İşçi: kaynak bloğun [start, stop) aralığını kodlayıp hedef bloğa yazar"""
+    codec = get_codec(width, engine, code)
+    
+    def work(data, outputs):
+        outputs[0][:] = codec.encode_batch(data).reshape(outputs[0].shape)
+    
+    _run_shard(source, targets, start, stop, work)
+
+def _decode_shard(width, engine, code, source, targets, start, stop):
+    """İşçi: kaynak bloğun [start, stop) aralığını çözüp paralel hedef bloklara yazar"""
+    codec = get_codec(width, engine, code)
+    
+    def work(codewords, outputs):
+        results = codec.decode_batch(codewords)
+        for target, result in zip(outputs, results):
+            target[:] = result.reshape(target.shape)
+        stats = DecodeStats()
+        stats.add(results[0])
+        return stats
+    
+    return _run_shard(source, targets, start, stop, work)
+
+def _scrub_shard(path, engine, start, stop, chunk_words):
+    """İşçi: disk görüntüsünün [start, stop) aralığını tarar"""
+    with MappedMemoryImage(path, 'r+', engine) as image:
+        return image.scrub(start, stop, chunk_words)
+
+class ParallelCodec:
+    def __init__(self, width=32, engine='lut', workers=None, chunk_words=DEFAULT_CHUNK_WORDS,
+                 code='hamming'):
+        """
+        HammingCodec üzerinde çok süreçli toplu işlem motoru
+        
+        Args:
+            width (int): Veri bit uzunluğu
+            engine (str): Kodlama motoru
+            workers (int, optional): İşçi süreç sayısı, None ise çekirdek sayısı
+            chunk_words (int): İşçi başına gönderilen parça (kelime)
+            code (str): Kod yapısı ('hamming' veya 'hsiao')
+        """
+        self.codec = get_codec(width, engine, code)
+        self.width = width
+        self.engine = engine
+        self.code = code
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_words = chunk_words
+        self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _executor(self):
+        """İşçi havuzunu ilk kullanımda oluşturur"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+    
+    def _shards(self, count):
+        """[start, stop) parça sınırlarını üretir"""
+        return [(start, min(start + self.chunk_words, count))
+                for start in range(0, count, self.chunk_words)]
+    
+    def _serial(self, count):
+        """Tek parça veya tek işçi durumunda havuz yükünden kaçınılır"""
+        return self.workers == 1 or count <= self.chunk_words
+    
+    def _run(self, worker, words, output_layouts):
+        """
+        Girdiyi paylaşılan belleğe kopyalar, parçaları işçilere dağıtır
+        
+        Args:
+            worker (callable): Parça işçisi (_encode_shard veya _decode_shard)
+            words (np.ndarray): Girdi kelimeleri
+            output_layouts (tuple): Çıktı blokları için (şekil, tür) çiftleri
+        
+        Returns:
+            tuple: (çıktı dizilerinin kopyaları, işçi dönüş değerleri)
+        """
+        blocks = []
+        arrays = []
+        try:
+            for shape, dtype in ((words.shape, words.dtype),) + tuple(output_layouts):
+                shm, array = _create_shared(shape, dtype)
+                blocks.append(shm)
+                arrays.append(array)
+            arrays[0][:] = words
+            
+            specs = [(shm.name, array.shape, array.dtype) for shm, array in zip(blocks, arrays)]
+            futures = [self._executor().submit(worker, self.width, self.engine, self.code,
+                                               specs[0], specs[1:], start, stop)
+                       for start, stop in self._shards(words.shape[0])]
+            returns = [future.result() for future in futures]
+            return [array.copy() for array in arrays[1:]], returns
+        finally:
+            arrays.clear()
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+    
+    def encode(self, data):
+        """
+        Veri kelimelerini işçiler arasında bölerek kodlar
+        
+        Args:
+            data (np.ndarray): encode_batch ile aynı düzende veri kelimeleri
+        
+        Returns:
+            np.ndarray: Kodlanmış kelimeler
+        """
+        words = as_words(data, limb_count(self.codec.data_bits))
+        if self._serial(words.shape[0]):
+            return self.codec.encode_batch(words)
+        
+        code_limbs = limb_count(self.codec.total_bits)
+        (encoded,), _ = self._run(_encode_shard, words, [((words.shape[0], code_limbs), np.uint64)])
+        return encoded.reshape(-1) if code_limbs == 1 else encoded
+    
+    def decode(self, codewords):
+        """
+        Kodlanmış kelimeleri işçiler arasında bölerek çözer ve düzeltir
+        
+        Args:
+            codewords (np.ndarray): decode_batch ile aynı düzende kodlanmış kelimeler
+        
+        Returns:
+            tuple: (decode_batch paralel dizileri, birleştirilmiş DecodeStats)
+        """
+        code_limbs = limb_count(self.codec.total_bits)
+        data_limbs = limb_count(self.codec.data_bits)
+        words = as_words(codewords, code_limbs)
+        count = words.shape[0]
+        stats = DecodeStats()
+        if self._serial(count):
+            results = self.codec.decode_batch(words)
+            stats.add(results[0])
+            return results, stats
+        
+        outputs, shard_stats = self._run(_decode_shard, words,
+                                         [((count,), np.uint8),
+                                          ((count,), np.int32),
+                                          ((count, code_limbs), np.uint64),
+                                          ((count, data_limbs), np.uint64)])
+        for shard in shard_stats:
+            stats.merge(shard)
+        
+        status, position, corrected, data = outputs
+        if code_limbs == 1:
+            corrected = corrected.reshape(-1)
+        if data_limbs == 1:
+            data = data.reshape(-1)
+        return (status, position, corrected, data), stats
+    
+    def scrub(self, codewords, write_back=True):
+        """
+        Paylaşılan veya yerel bir kodlanmış kelime dizisini paralel tarar
+        
+        Args:
+            codewords (np.ndarray): Taranacak kodlanmış kelimeler (yerinde güncellenir)
+            write_back (bool): Düzeltilen kelimeleri diziye geri yaz
+        
+        Returns:
+            DecodeStats: Birleştirilmiş tarama istatistikleri
+        """
+        (status, _, corrected, _), stats = self.decode(codewords)
+        if write_back and stats.corrected:
+            fixed = np.flatnonzero(status == ERROR_SINGLE)
+            codewords[fixed] = corrected[fixed]
+        return stats
+    
+    def scrub_image(self, image):
+        """
+        Disk görüntüsünü işçiler arasında bölerek tarar
+        
+        Her işçi aynı dosyayı kendisi eşler; veri süreçler arasında kopyalanmaz.
+        
+        Args:
+            image (MappedMemoryImage | str): Açık görüntü veya dosya yolu
+        
+        Returns:
+            DecodeStats: Birleştirilmiş tarama istatistikleri
+        """
+        if isinstance(image, MappedMemoryImage):
+            image.flush()
+            path, count = image.path, image.count
+        else:
+            with MappedMemoryImage(image, 'r', self.engine) as opened:
+                path, count = opened.path, opened.count
+        
+        if self._serial(count):
+            with MappedMemoryImage(path, 'r+', self.engine) as opened:
+                return opened.scrub(chunk_words=self.chunk_words)
+        
+        futures = [self._executor().submit(_scrub_shard, path, self.engine,
+                                           start, stop, self.chunk_words)
+                   for start, stop in self._shards(count)]
+        stats = DecodeStats()
+        for future in futures:
+            stats.merge(future.result())
+        return stats
+    
+    def close(self):
+        """İşçi havuzunu kapatır"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bellek testi (memtest) tarzı veri desenleri
+
+Her desen adres aralığı için veri kelimelerini doğrudan NumPy ile üretir;
+sonuç encode_batch düzenindedir (64 bite kadar (N,), daha genişlerde
+(N, parça) uint64). Bir adresin değeri yalnızca desene, adrese ve tohuma
+bağlıdır: aralık hangi parçalara bölünürse bölünsün aynı veri üretilir,
+böylece doğrulama yazmadan bağımsız olarak deseni yeniden üretebilir.
+
+Desenler:
+    zeros, ones        : tüm bitler 0 / 1
+    walking_ones       : a adresinde yalnızca (a mod genişlik). bit 1
+    walking_zeros      : a adresinde yalnızca (a mod genişlik). bit 0
+    checkerboard       : çift adreslerde 0101..., tek adreslerde 1010...
+    address            : adres-adreste (her 64 bitlik parçaya adresin kendisi)
+    random             : tohumlu, adres başına splitmix64 ile üretilen rastgele veri
+"""
+
+import numpy as np
+
+from hamming_batch import limb_count
+
+# Desteklenen desenler
+PATTERNS = ('zeros', 'ones', 'walking_ones', 'walking_zeros', 'checkerboard', 'address', 'random')
+
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+_CHECKER = np.uint64(0x5555555555555555)
+
+def splitmix64(values):
+    """
+    splitmix64 karıştırma fonksiyonu (uint64 dizisi üzerinde, taşma sarmalı)
+    
+    Returns:
+        np.ndarray: Karıştırılmış uint64 değerler
+    """
+    z = values + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+def pattern_data(pattern, width, start, count, seed=0):
+    """
+    [start, start + count) adresleri için desen verisini üretir
+    
+    Args:
+        pattern (str): PATTERNS içinden desen adı
+        width (int): Veri bit uzunluğu
+        start (int): İlk adres
+        count (int): Kelime sayısı
+        seed (int): 'random' deseni için tohum
+    
+    Returns:
+        np.ndarray: encode_batch düzeninde veri kelimeleri
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Bilinmeyen desen: {pattern} (desteklenenler: {', '.join(PATTERNS)})")
+    
+    limbs = limb_count(width)
+    addresses = np.arange(start, start + count, dtype=np.uint64)
+    words = np.zeros((count, limbs), dtype=np.uint64)
+    
+    if pattern == 'ones':
+        words[:] = _ALL_ONES
+    elif pattern in ('walking_ones', 'walking_zeros'):
+        bit = addresses % np.uint64(width)
+        words[np.arange(count), (bit // np.uint64(64)).astype(np.intp)] = np.uint64(1) << (bit % np.uint64(64))
+        if pattern == 'walking_zeros':
+            words ^= _ALL_ONES
+    elif pattern == 'checkerboard':
+        words[:] = _CHECKER
+        words[(addresses & np.uint64(1)).astype(bool)] ^= _ALL_ONES
+    elif pattern == 'address':
+        words[:] = addresses[:, None]
+    elif pattern == 'random':
+        key = splitmix64(np.array([seed & 0xFFFFFFFFFFFFFFFF], dtype=np.uint64))
+        counters = addresses[:, None] * np.uint64(limbs) + np.arange(limbs, dtype=np.uint64)
+        words[:] = splitmix64(counters ^ key)
+    
+    # Veri genişliğinin üstündeki bitler temizlenir
+    if width % 64:
+        words[:, -1] &= np.uint64((1 << (width % 64)) - 1)
+    return words.reshape(-1) if limbs == 1 else words
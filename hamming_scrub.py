@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Simüle edilen bellek üzerinde arka plan devriye taraması (patrol scrub)
+
+Gerçek ECC belleklerde olduğu gibi tarayıcı tüm belleği parça parça okur, tek
+bit hatalarını düzeltip geri yazar; böylece ikinci bir hata birikip kelimeyi
+düzeltilemez hale getirmeden önce temizlenir. Tarama bir işçi iş parçacığında
+(thread) yürür ve hızı sınırlanabilir (kelime/sn veya tam geçiş süresi).
+
+Ön plandaki okuma/yazmalar durdurulmaz: parça, bankanın kilidi altında yalnızca
+kopyalanır; kod çözme kilit dışında yapılır ve geri yazma yine kilit altında,
+yalnızca kopyadan beri değişmemiş kelimelere uygulanır (karşılaştır ve yaz).
+Arada ön plandan yazılmış bir kelimenin üzerine eski değer yazılmaz.
+
+Bir olay kaydı (hamming_events.EventLog) verilirse geri yazılan her düzeltme
+adresi ve bit pozisyonuyla kaydedilir. Düzeltilemez bir kelime her geçişte
+yeniden bulunur, ancak yalnızca ilk görüldüğünde raporlanır: tarayıcı bilinen
+düzeltilemez adresleri o anki kodlanmış kelimeleriyle birlikte tutar; kelime
+yeniden yazılınca (veya artık düzeltilemez değilse) adres unutulur.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from hamming_codec import ERROR_SINGLE, ERROR_DOUBLE, ERROR_UNKNOWN
+from hamming_batch import DecodeStats
+from hamming_events import EVENT_CORRECTED, EVENT_UNCORRECTABLE
+
+# Varsayılan parça boyutu (kelime)
+DEFAULT_CHUNK_WORDS = 1 << 12
+
+# Geçiş başına raporlanan en fazla düzeltilemez adres
+MAX_REPORTED = 64
+
+class ScrubStats(DecodeStats):
+    def __init__(self, number=0):
+        """
+        Bir tarama geçişinin sayaçları (yalnızca yazılmış adresler sayılır)
+        
+        Args:
+            number (int): Geçiş numarası (1'den başlar)
+        """
+        super().__init__()
+        self.number = number
+        self.written = 0       # Geri yazılan düzeltilmiş kelime
+        self.raced = 0         # Tarama sırasında ön plandan değiştirildiği için atlanan
+        self.new_uncorrectable = 0  # Bu geçişte ilk kez bulunan düzeltilemez adres
+        self.uncorrectable_addresses = []  # İlk kez bulunanlar (en fazla MAX_REPORTED)
+        self.started = time.monotonic()
+        self.elapsed = None    # Geçiş tamamlanınca saniye
+    
+    def as_dict(self):
+        """Sayaçları sözlük olarak döndürür"""
+        result = super().as_dict()
+        result.update({
+            'pass': self.number,
+            'written': self.written,
+            'raced': self.raced,
+            'new_uncorrectable': self.new_uncorrectable,
+            'uncorrectable_addresses': list(self.uncorrectable_addresses),
+            'elapsed': self.elapsed if self.elapsed is not None else time.monotonic() - self.started
+        })
+        return result
+
+class PatrolScrubber:
+    def __init__(self, bank, rate=None, pass_interval=None, chunk_words=DEFAULT_CHUNK_WORDS,
+                 events=None):
+        """
+        MemoryBank için devriye tarayıcı
+        
+        Args:
+            bank (MemoryBank): Taranacak bellek bankası
+            rate (float, optional): En fazla kelime/sn (None: sınırsız)
+            pass_interval (float, optional): Tam geçiş süresi (sn); verilirse
+                                             rate = adres sayısı / süre
+            chunk_words (int): Parça başına kelime
+            events (EventLog, optional): Bulunan hataların kaydedileceği olay kaydı
+        """
+        if pass_interval is not None:
+            if pass_interval <= 0:
+                raise ValueError(f"Geçiş süresi pozitif olmalıdır: {pass_interval}")
+            rate = bank.size / pass_interval
+        if rate is not None and rate <= 0:
+            raise ValueError(f"Tarama hızı pozitif olmalıdır: {rate}")
+        
+        self.bank = bank
+        self.rate = rate
+        self.chunk_words = chunk_words
+        self.events = events
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.position = 0
+        self.passes = 0
+        self.current = None
+        self.last_pass = None
+        self.total = ScrubStats()
+        
+        # Raporlanmış düzeltilemez adresler: parça başlangıcı -> {adres: kelime baytları}
+        self._known_uncorrectable = {}
+    
+    @property
+    def running(self):
+        """İşçi iş parçacığı çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Sürekli taramayı arka plan iş parçacığında başlatır"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="patrol-scrub", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout=None):
+        """Taramayı durdurur ve iş parçacığının bitmesini bekler (yarım geçiş sayılmaz)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self):
+        """İşçi döngüsü: durdurulana kadar art arda tam geçişler"""
+        while not self._stop.is_set():
+            self.run_pass()
+    
+    def run_pass(self):
+        """
+        Belleği baştan sona bir kez tarar (hız sınırına uyarak)
+        
+        İş parçacığı olmadan eşzamanlı olarak da çağrılabilir.
+        
+        Returns:
+            ScrubStats | None: Tamamlanan geçişin sayaçları, durdurulduysa None
+        """
+        stats = ScrubStats(self.passes + 1)
+        with self._lock:
+            self.current = stats
+            self.position = 0
+        
+        begin = time.monotonic()
+        for start in range(0, self.bank.size, self.chunk_words):
+            if self._stop.is_set():
+                return None
+            stop = min(start + self.chunk_words, self.bank.size)
+            self._scrub_chunk(start, stop, stats)
+            
+            # Hız sınırı: işlenen kelime sayısına göre bir sonraki parçanın zamanı
+            if self.rate is not None:
+                delay = begin + stop / self.rate - time.monotonic()
+                if delay > 0 and self._stop.wait(delay):
+                    return None
+        
+        with self._lock:
+            stats.elapsed = time.monotonic() - begin
+            self.passes = stats.number
+            self.last_pass = stats
+            self.current = None
+            self.total.merge(stats)
+            self.total.written += stats.written
+            self.total.raced += stats.raced
+            self.total.new_uncorrectable += stats.new_uncorrectable
+        return stats
+    
+    def _scrub_chunk(self, start, stop, stats):
+        """[start, stop) adreslerini çözer ve düzeltilen kelimeleri geri yazar"""
+        bank = self.bank
+        with bank.lock:
+            words = bank.codewords[start:stop].copy()
+        
+        status, positions, corrected, _ = bank.codec.decode_batch(words)
+        valid = bank.valid_mask(start, stop)
+        candidates = np.flatnonzero((status == ERROR_SINGLE) & valid)
+        written = 0
+        if candidates.size:
+            with bank.lock:
+                block = bank.codewords[start:stop]
+                same = block[candidates] == words[candidates]
+                if same.ndim > 1:
+                    same = same.all(axis=1)
+                fixed = candidates[same]
+                block[fixed] = corrected[fixed]
+                written = int(fixed.size)
+                # Yalnızca gerçekten geri yazılan düzeltmeler kaydedilir
+                if self.events is not None and written:
+                    self.events.record_many(fixed + start, EVENT_CORRECTED, positions[fixed])
+        
+        failed = np.flatnonzero(((status == ERROR_DOUBLE) | (status == ERROR_UNKNOWN)) & valid)
+        failed = self._new_uncorrectable(start, failed, words)
+        if self.events is not None and failed.size:
+            self.events.record_many(failed + start, EVENT_UNCORRECTABLE)
+        with self._lock:
+            stats.add(status[valid])
+            stats.written += written
+            stats.raced += int(candidates.size) - written
+            stats.new_uncorrectable += int(failed.size)
+            room = MAX_REPORTED - len(stats.uncorrectable_addresses)
+            stats.uncorrectable_addresses.extend(int(start + i) for i in failed[:max(0, room)])
+            self.position = stop
+    
+    def _new_uncorrectable(self, start, failed, words):
+        """
+        Parçadaki düzeltilemez kelimelerden daha önce raporlanmamış olanları seçer
+        
+        Önceki geçişte aynı kodlanmış kelimeyle görülen adresler atlanır; parçada
+        artık düzeltilemez olmayan veya yeniden yazılmış adresler unutulur.
+        
+        Args:
+            start (int): Parçanın ilk adresi
+            failed (np.ndarray): Parça içi düzeltilemez indeksler
+            words (np.ndarray): Parçanın kodlanmış kelimeleri
+        
+        Returns:
+            np.ndarray: İlk kez görülen parça içi indeksler
+        """
+        known = self._known_uncorrectable.pop(start, {})
+        if not failed.size:
+            return failed
+        
+        current = {}
+        new = []
+        for index in failed.tolist():
+            address = start + index
+            current[address] = words[index].tobytes()
+            if known.get(address) != current[address]:
+                new.append(index)
+        self._known_uncorrectable[start] = current
+        return np.array(new, dtype=failed.dtype)
+    
+    def snapshot(self):
+        """
+        Tarayıcı durumunun tutarlı bir kopyası
+        
+        Returns:
+            dict: running, position, passes, current (süren geçiş), last_pass,
+                  total (tüm tamamlanan geçişler)
+        """
+        with self._lock:
+            return {
+                'running': self.running,
+                'position': self.position,
+                'size': self.bank.size,
+                'passes': self.passes,
+                'current': self.current.as_dict() if self.current else None,
+                'last_pass': self.last_pass.as_dict() if self.last_pass else None,
+                'total': self.total.as_dict()
+            }
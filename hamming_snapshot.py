@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bellek bankası ve işlem geçmişi için ikili anlık görüntü (snapshot) biçimi
+
+Dosya düzeni:
+    - 64 baytlık başlık: sihirli değer, sürüm, bayraklar, motor, kod yapısı,
+      veri biti, kelime parçası, adres sayısı, geçmiş uzunluğu
+    - ham kodlanmış kelime dizisi (adres başına küçük uçlu 64 bitlik parçalar)
+    - geçerlilik bit haritası (adres başına 1 bit)
+    - işlem geçmişi (UTF-8 JSON)
+
+Kaydederken bankanın dizileri kilit altında kopyalanır, yazma kilit dışında
+yapılır. Sıkıştırılmamış görüntü tek seferlik toplu G/Ç ile yazılır (tofile) ve
+bankanın dizilerine doğrudan okunur (readinto). Sıkıştırma bayrağı açıksa
+başlıktan sonraki her şey tek bir zlib akışıdır; akış sabit boyutlu
+parçalar halinde sıkıştırılır ve açılır, tüm görüntü bellekte iki kez
+tutulmaz.
+"""
+
+import json
+import struct
+import zlib
+
+from hamming_codec import CODES, ENGINES
+from hamming_memory import MemoryBank
+
+# Başlık: sihirli değer, sürüm, bayraklar, motor, kod, veri biti, kelime parçası,
+# adres sayısı, geçmiş bayt sayısı
+HEADER = struct.Struct('<4sBBBBHHQQ')
+HEADER_SIZE = 64
+MAGIC = b'HMSN'
+VERSION = 1
+
+# Bayraklar
+FLAG_ZLIB = 1
+
+# Akış sıkıştırmada parça boyutu (bayt) ve varsayılan sıkıştırma düzeyi
+CHUNK_BYTES = 1 << 22
+DEFAULT_LEVEL = 1
+
+def _bytes_view(array):
+    """NumPy dizisinin bayt görünümü (kopyasız)"""
+    return memoryview(array).cast('B')
+
+class _InflateReader:
+    def __init__(self, f):
+        """Dosyadaki zlib akışını parça parça açan okuyucu"""
+        self.f = f
+        self.decompressor = zlib.decompressobj()
+    
+    def readinto(self, view):
+        """Hedef görünümü açılmış veriyle tamamen doldurur"""
+        filled = 0
+        while filled < len(view):
+            data = self.decompressor.unconsumed_tail or self.f.read(CHUNK_BYTES)
+            if not data:
+                break
+            out = self.decompressor.decompress(data, len(view) - filled)
+            view[filled:filled + len(out)] = out
+            filled += len(out)
+        return filled
+
+def _read_exact(reader, view):
+    """Görünümü okuyucudan doldurur; veri eksikse ValueError"""
+    if reader.readinto(view) != len(view):
+        raise ValueError("Anlık görüntü eksik veya bozuk")
+
+def save_snapshot(path, bank, history=(), compress=False, level=DEFAULT_LEVEL):
+    """
+    Bellek bankasını ve işlem geçmişini dosyaya yazar
+    
+    Args:
+        path (str): Hedef dosya
+        bank (MemoryBank): Kaydedilecek banka
+        history (list): Geçmiş satırları (JSON'a çevrilebilir değerler)
+        compress (bool): zlib ile akış halinde sıkıştır
+        level (int): zlib sıkıştırma düzeyi
+    """
+    payload = json.dumps(list(history), ensure_ascii=False).encode('utf-8')
+    header = HEADER.pack(MAGIC, VERSION, FLAG_ZLIB if compress else 0,
+                         ENGINES.index(bank.codec.engine), CODES.index(bank.codec.code),
+                         bank.width, bank.limbs, bank.size, len(payload))
+    
+    # Kilit yalnızca tutarlı bir kopya almak için tutulur; dosyaya yazma ve
+    # sıkıştırma kilit dışında yapılır, ön plan ve tarayıcı beklemez
+    with bank.lock:
+        codewords = bank.codewords.copy()
+        valid = bank.valid.copy()
+            
+    with open(path, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        if not compress:
+            codewords.tofile(f)
+            valid.tofile(f)
+            f.write(payload)
+            return
+        
+        compressor = zlib.compressobj(level)
+        for part in (_bytes_view(codewords), _bytes_view(valid), memoryview(payload)):
+            for start in range(0, len(part), CHUNK_BYTES):
+                f.write(compressor.compress(part[start:start + CHUNK_BYTES]))
+        f.write(compressor.flush())
+
+def load_snapshot(path):
+    """
+    Anlık görüntüyü okur
+    
+    Args:
+        path (str): Kaynak dosya
+    
+    Returns:
+        tuple: (MemoryBank, geçmiş satırları listesi)
+    """
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+        if len(raw) != HEADER_SIZE:
+            raise ValueError("Anlık görüntü başlığı eksik")
+        
+        magic, version, flags, engine, code, width, limbs, count, history_bytes = HEADER.unpack_from(raw)
+        if magic != MAGIC:
+            raise ValueError("Geçersiz anlık görüntü (sihirli değer uyuşmuyor)")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen anlık görüntü sürümü: {version}")
+        if engine >= len(ENGINES) or code >= len(CODES):
+            raise ValueError("Anlık görüntüde bilinmeyen motor veya kod yapısı")
+        
+        bank = MemoryBank(width, count, ENGINES[engine], CODES[code])
+        if limbs != bank.limbs:
+            raise ValueError("Başlıktaki kelime boyutu codec ile uyuşmuyor")
+        
+        reader = _InflateReader(f) if flags & FLAG_ZLIB else f
+        _read_exact(reader, _bytes_view(bank.codewords))
+        _read_exact(reader, _bytes_view(bank.valid))
+        payload = bytearray(history_bytes)
+        _read_exact(reader, memoryview(payload))
+    
+    return bank, json.loads(payload.decode('utf-8')) if history_bytes else []
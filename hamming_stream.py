@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dosya ve bayt akışları için parçalı (chunked) Hamming SEC-DED kodlama/kod çözme
+
+Girdi büyük parçalar hâlinde okunur, seçilen genişlikte veri kelimelerine
+bölünür ve toplu (NumPy) kodlayıcıdan geçirilerek paketlenmiş kodlanmış kelime
+akışı olarak yazılır. Bellek kullanımı parça boyutuyla sınırlıdır, dosya
+boyutuna bağlı değildir.
+
+Akış biçimi (tek geçişte yazılır; girdi uzunluğu önceden bilinmez, çıkış
+geri sarılmaz, böylece boru hattından boru hattına çalışır):
+    başlık  : sihirli değer, sürüm, kod yapısı (CODES indeksi), veri
+              genişliği, kodlanmış kelime baytı
+    çerçeve : parçadaki orijinal bayt sayısı (uint32), ardından parçanın
+              kelimeleri; her kelime ceil(toplam bit / 8) bayt, küçük uçlu
+    son     : bayt sayısı 0 olan çerçeve, ardından toplam orijinal uzunluk
+              ve dolgu baytı sayısı
+
+Komut satırı kullanımı:
+    python hamming_stream.py encode girdi.bin cikti.hmd --width 32 --code hsiao
+    python hamming_stream.py decode cikti.hmd geri.bin --verbose
+"""
+
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+from hamming_codec import CODES, get_codec
+from hamming_batch import DecodeStats, limb_count
+
+# Akış başlığı: sihirli değer, sürüm, kod yapısı (CODES indeksi), veri biti,
+# kelime baytı. Kod baytı eski akışlarda ayrılmıştı (0); 0 'hamming' olduğu
+# için bu akışlar aynı sürümle okunmaya devam eder.
+HEADER = struct.Struct('<4sBBHH')
+MAGIC = b'HMSD'
+VERSION = 2
+
+# Çerçeve öneki (parçadaki orijinal bayt sayısı; 0: akış sonu) ve son kayıt
+# (toplam orijinal uzunluk, dolgu)
+FRAME = struct.Struct('<I')
+TRAILER = struct.Struct('<QH')
+
+# Varsayılan okuma parçası (bayt)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+def _word_bytes(codec):
+    """(veri kelimesi baytı, kodlanmış kelime baytı) çiftini döndürür"""
+    if codec.data_bits % 8:
+        raise ValueError(f"Akış kodlaması bayt hizalı genişlik gerektirir: {codec.data_bits}")
+    return codec.data_bits // 8, (codec.total_bits + 7) // 8
+
+def pack_words(raw, word_bytes, limbs):
+    """
+    Ardışık kelime baytlarını (N, parça) uint64 dizisine çevirir
+    
+    Args:
+        raw (bytes): Uzunluğu word_bytes'ın katı olan bayt dizisi
+        word_bytes (int): Kelime başına bayt
+        limbs (int): Kelime başına 64 bitlik parça
+    
+    Returns:
+        np.ndarray: (N, parça) küçük uçlu uint64 dizisi
+    """
+    source = np.frombuffer(raw, dtype=np.uint8).reshape(-1, word_bytes)
+    words = np.zeros((source.shape[0], limbs * 8), dtype=np.uint8)
+    words[:, :word_bytes] = source
+    return words.view('<u8')
+
+def unpack_words(words, word_bytes):
+    """(N,) veya (N, parça) uint64 dizisindeki kelimeleri ardışık baytlara çevirir"""
+    words = np.ascontiguousarray(words, dtype='<u8').reshape(words.shape[0], -1)
+    return words.view(np.uint8)[:, :word_bytes].tobytes()
+
+def iter_chunks(stream, chunk_size=DEFAULT_CHUNK_SIZE, align=1):
+    """
+    Akışı 'align' baytın katı olan parçalar hâlinde okur
+    
+    Kısa okumalarda (boru hatları) kalan baytlar bir sonraki parçaya taşınır;
+    yalnızca son parça hizasız olabilir.
+    """
+    chunk_size = max(align, chunk_size - chunk_size % align)
+    pending = b''
+    while True:
+        data = stream.read(chunk_size - len(pending))
+        if not data:
+            break
+        pending += data
+        usable = len(pending) - len(pending) % align
+        if usable:
+            yield pending[:usable]
+            pending = pending[usable:]
+    if pending:
+        yield pending
+
+def _encode_chunk(chunk, codec, data_bytes, code_bytes, limbs):
+    """Ham veri parçasını kodlar (eksik son kelime sıfırla doldurulur)"""
+    remainder = len(chunk) % data_bytes
+    if remainder:
+        chunk += bytes(data_bytes - remainder)
+    return unpack_words(codec.encode_batch(pack_words(chunk, data_bytes, limbs)), code_bytes)
+
+def iter_encode(chunks, codec):
+    """
+    Ham veri parçalarını paketlenmiş kodlanmış kelime parçalarına dönüştürür
+    
+    Son parçadaki eksik kelime sıfırla doldurulur.
+    
+    Yields:
+        bytes: Kodlanmış kelime parçası
+    """
+    data_bytes, code_bytes = _word_bytes(codec)
+    limbs = limb_count(codec.data_bits)
+    for chunk in chunks:
+        yield _encode_chunk(chunk, codec, data_bytes, code_bytes, limbs)
+
+def _read_exact(src, size):
+    """Akıştan tam 'size' bayt okur; akış erken biterse ValueError"""
+    data = src.read(size)
+    while len(data) < size:
+        more = src.read(size - len(data))
+        if not more:
+            raise ValueError("Kodlanmış akış erken bitti (kesik dosya?)")
+        data += more
+    return data
+
+def iter_decode(src, codec, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Başlıktan sonraki çerçeveleri okur, çözer ve düzeltir
+    
+    Çerçeveler en fazla chunk_size baytlık (kelime sınırına yuvarlanmış)
+    parçalar halinde okunur; her çerçevenin dolgusu öneki ile kesilir.
+    
+    Args:
+        src: Başlığı okunmuş kodlanmış akış
+        codec (HammingCodec): Kullanılacak codec
+        chunk_size (int): Okuma parçası (bayt)
+    
+    Yields:
+        tuple: (veri parçası, parça istatistikleri)
+    """
+    data_bytes, code_bytes = _word_bytes(codec)
+    limbs = limb_count(codec.total_bits)
+    step = max(code_bytes, chunk_size - chunk_size % code_bytes)
+    total = 0
+    while True:
+        (length,) = FRAME.unpack(_read_exact(src, FRAME.size))
+        if not length:
+            break
+        remaining = length
+        while remaining:
+            words = -(-remaining // data_bytes)
+            chunk = _read_exact(src, min(step, words * code_bytes))
+            status, _, _, data = codec.decode_batch(pack_words(chunk, code_bytes, limbs))
+            stats = DecodeStats()
+            stats.add(status)
+        
+            output = unpack_words(data, data_bytes)[:remaining]
+            remaining -= len(output)
+            yield output, stats
+        total += length
+    
+    expected, padding = TRAILER.unpack(_read_exact(src, TRAILER.size))
+    if expected != total or padding != (-total) % data_bytes:
+        raise ValueError(f"Kodlanmış akış uzunluğu tutarsız: {expected} bekleniyor, {total} okundu")
+
+def encode_stream(src, dst, width=32, engine='lut', chunk_size=DEFAULT_CHUNK_SIZE, code='hamming'):
+    """
+    Bir bayt akışını kodlayıp çerçeveli kodlanmış kelime akışı olarak yazar
+    
+    Akış tek geçişte yazılır: girdinin uzunluğu bilinmesi ve çıkışın geri
+    sarılması gerekmez.
+    
+    Args:
+        src: Okunacak ikili akış
+        dst: Yazılacak ikili akış
+        width (int): Veri kelimesi genişliği (8'in katı)
+        engine (str): Kodlama motoru
+        chunk_size (int): Okuma parçası (bayt, çerçeve başına en fazla 4 GiB)
+        code (str): Kod yapısı ('hamming' veya 'hsiao'); başlığa yazılır
+    
+    Returns:
+        dict: {'bytes': orijinal uzunluk, 'words': kelime sayısı, 'padding': dolgu}
+    """
+    codec = get_codec(width, engine, code)
+    data_bytes, code_bytes = _word_bytes(codec)
+    limbs = limb_count(codec.data_bits)
+    chunk_size = min(chunk_size, 0xFFFFFFFF)
+    
+    dst.write(HEADER.pack(MAGIC, VERSION, CODES.index(code), codec.data_bits, code_bytes))
+    
+    total = 0
+    words = 0
+    for chunk in iter_chunks(src, chunk_size, data_bytes):
+        encoded = _encode_chunk(chunk, codec, data_bytes, code_bytes, limbs)
+        dst.write(FRAME.pack(len(chunk)))
+        dst.write(encoded)
+        total += len(chunk)
+        words += len(encoded) // code_bytes
+    
+    padding = (-total) % data_bytes
+    dst.write(FRAME.pack(0))
+    dst.write(TRAILER.pack(total, padding))
+    return {'bytes': total, 'words': words, 'padding': padding}
+
+def read_header(src):
+    """
+    Kodlanmış akışın başlığını okur ve doğrular
+    
+    Returns:
+        dict: {'code', 'data_bits', 'code_bytes'}
+    """
+    raw = src.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        raise ValueError("Kodlanmış akış başlığı eksik")
+    
+    magic, version, code, data_bits, code_bytes = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError("Geçersiz kodlanmış akış (sihirli değer uyuşmuyor)")
+    if version != VERSION:
+        raise ValueError(f"Desteklenmeyen akış sürümü: {version}")
+    if code >= len(CODES):
+        raise ValueError(f"Akışta bilinmeyen kod yapısı: {code}")
+    
+    return {
+        'code': CODES[code],
+        'data_bits': data_bits,
+        'code_bytes': code_bytes
+    }
+
+def decode_stream(src, dst, engine='lut', chunk_size=DEFAULT_CHUNK_SIZE, on_chunk=None,
+                  header=None):
+    """
+    Çerçeveli kodlanmış kelime akışını çözer, düzeltir ve ham veriyi yazar
+    
+    Kod yapısı ve genişlik akış başlığından alınır. Düzeltilemeyen kelimeler
+    olduğu gibi (düzeltilmeden) yazılır ve istatistiklerde sayılır.
+    
+    Args:
+        src: Okunacak kodlanmış akış
+        dst: Ham verinin yazılacağı akış
+        engine (str): Kod çözme motoru
+        chunk_size (int): Okuma parçası (bayt, kelime sınırına yuvarlanır)
+        on_chunk (callable, optional): Her parçadan sonra (parça no, DecodeStats) ile çağrılır
+        header (dict, optional): src'den önceden okunmuş başlık (read_header);
+                                 verilmezse başlık burada okunur
+    
+    Returns:
+        DecodeStats: Toplam istatistikler
+    """
+    if header is None:
+        header = read_header(src)
+    codec = get_codec(header['data_bits'], engine, header['code'])
+    _, code_bytes = _word_bytes(codec)
+    if code_bytes != header['code_bytes']:
+        raise ValueError("Başlıktaki kelime boyutu codec ile uyuşmuyor")
+    
+    totals = DecodeStats()
+    for index, (data, stats) in enumerate(iter_decode(src, codec, chunk_size)):
+        dst.write(data)
+        totals.merge(stats)
+        if on_chunk is not None:
+            on_chunk(index, stats)
+    
+    return totals
+
+def _open(path, mode):
+    """'-' için standart girdi/çıktıyı, aksi hâlde dosyayı açar"""
+    if path == '-':
+        return (sys.stdin.buffer if 'r' in mode else sys.stdout.buffer), False
+    return open(path, mode), True
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED akış kodlayıcı/kod çözücü")
+    sub = parser.add_subparsers(dest='command', required=True)
+    
+    enc = sub.add_parser('encode', help="Ham veriyi kodla")
+    enc.add_argument('input', help="Girdi dosyası ('-' standart girdi)")
+    enc.add_argument('output', help="Çıktı dosyası ('-' standart çıktı)")
+    enc.add_argument('--width', type=int, default=32, help="Veri kelimesi genişliği (bit, 8'in katı)")
+    enc.add_argument('--code', default='hamming', choices=CODES, help="Kod yapısı (başlığa yazılır)")
+    
+    dec = sub.add_parser('decode', help="Kodlanmış veriyi çöz ve düzelt")
+    dec.add_argument('input', help="Girdi dosyası ('-' standart girdi)")
+    dec.add_argument('output', help="Çıktı dosyası ('-' standart çıktı)")
+    dec.add_argument('--verbose', '-v', action='store_true', help="Parça başına istatistikleri yaz")
+    
+    for command in (enc, dec):
+        command.add_argument('--engine', default='lut', help="Kodlama motoru")
+        command.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Okuma parçası (bayt)")
+    
+    args = parser.parse_args(argv)
+    try:
+        src, close_src = _open(args.input, 'rb')
+    except OSError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    
+    # Çıktı, girdi açılıp başlık/genişlik doğrulandıktan sonra oluşturulur;
+    # hatalı bir çağrı var olan çıktı dosyasını boşaltmaz
+    dst, close_dst = None, False
+    try:
+        if args.command == 'encode':
+            _word_bytes(get_codec(args.width, args.engine, args.code))
+            dst, close_dst = _open(args.output, 'wb')
+            info = encode_stream(src, dst, args.width, args.engine, args.chunk_size, args.code)
+            print(f"{info['bytes']} bayt, {info['words']} kelime kodlandı "
+                  f"(dolgu: {info['padding']} bayt)", file=sys.stderr)
+            return 0
+        
+        def report(index, stats):
+            print(f"parça {index}: {stats.as_dict()}", file=sys.stderr)
+        
+        header = read_header(src)
+        dst, close_dst = _open(args.output, 'wb')
+        totals = decode_stream(src, dst, args.engine, args.chunk_size,
+                               report if args.verbose else None, header)
+        print(f"toplam: {totals.as_dict()}", file=sys.stderr)
+        return 1 if totals.uncorrectable else 0
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if close_src:
+            src.close()
+        if close_dst:
+            dst.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
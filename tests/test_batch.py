@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""NumPy toplu kodlama/kod çözme testleri (skaler codec ile eşdeğerlik)"""
+
+import random
+
+import numpy as np
+import pytest
+
+from hamming_batch import DecodeStats, int_to_limbs, limb_count, limbs_to_int
+from hamming_codec import CODES, ENGINES, ERROR_DOUBLE, ERROR_NONE, ERROR_SINGLE, get_codec
+
+def to_array(values, bits):
+    """Tam sayı listesini encode_batch düzenine çevirir"""
+    limbs = limb_count(bits)
+    if limbs == 1:
+        return np.array(values, dtype=np.uint64)
+    return np.array([int_to_limbs(value, limbs) for value in values], dtype=np.uint64)
+
+def to_ints(array):
+    """encode_batch düzenindeki diziyi tam sayı listesine çevirir"""
+    return [int(x) for x in array] if array.ndim == 1 else [limbs_to_int(row) for row in array]
+
+def corrupted_words(codec, count, seed):
+    """Temiz, tek hatalı ve çift hatalı kodlanmış kelimeler"""
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        word = codec.encode(rng.getrandbits(codec.data_bits))
+        flips = rng.choice((0, 1, 2))
+        for position in rng.sample(range(codec.total_bits), flips):
+            word ^= 1 << position
+        words.append(word)
+    return words
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('width', (8, 16, 32, 57, 64, 128))
+def test_batch_matches_scalar(width, engine, code):
+    codec = get_codec(width, engine, code)
+    rng = random.Random(width)
+    data = [0, (1 << width) - 1] + [rng.getrandbits(width) for _ in range(200)]
+    assert to_ints(codec.encode_batch(to_array(data, width))) == [codec.encode(x) for x in data]
+    
+    words = corrupted_words(codec, 300, width)
+    status, position, corrected, original = codec.decode_batch(to_array(words, codec.total_bits))
+    expected = [codec.decode(word) for word in words]
+    assert status.tolist() == [result.status for result in expected]
+    assert position.tolist() == [-1 if result.error_position is None else result.error_position
+                                 for result in expected]
+    assert to_ints(corrected) == [result.corrected_data for result in expected]
+    clean = status <= ERROR_SINGLE
+    assert [x for x, ok in zip(to_ints(original), clean) if ok] == \
+        [result.original_data for result, ok in zip(expected, clean) if ok]
+
+def test_oversized_data_rejected():
+    with pytest.raises(ValueError):
+        get_codec(8).encode_batch(np.array([256], dtype=np.uint64))
+
+def test_decode_stats():
+    stats = DecodeStats()
+    stats.add(np.array([ERROR_NONE, ERROR_SINGLE, ERROR_DOUBLE, ERROR_NONE], dtype=np.uint8))
+    other = DecodeStats()
+    other.add(np.array([ERROR_SINGLE], dtype=np.uint8))
+    stats.merge(other)
+    assert (stats.words, stats.clean, stats.corrected, stats.uncorrectable) == (5, 2, 2, 1)
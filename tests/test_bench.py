@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""Ölçüm paketinin karşılaştırma mantığı testleri"""
+
+from benchmarks.codec_bench import compare, repeated
+
+def test_repeated_takes_median_and_spread():
+    rates = iter([100.0, 80.0, 120.0])
+    result = repeated(3, lambda: {'words_per_sec': next(rates), 'p50_ns': 1.0})
+    assert result['words_per_sec'] == 100.0
+    assert result['spread'] == 0.2
+    assert result['words_per_sec_runs'] == [80.0, 100.0, 120.0]
+
+def test_compare_threshold_covers_spread():
+    baseline = {'results': {'a': {'words_per_sec': 100.0, 'spread': 0.2},
+                            'b': {'words_per_sec': 100.0, 'spread': 0.0}}}
+    report = {'results': {'a': {'words_per_sec': 75.0, 'spread': 0.0},
+                          'b': {'words_per_sec': 75.0, 'spread': 0.0}}}
+    regressions = compare(report, baseline, tolerance=0.1)
+    assert [entry[0] for entry in regressions] == ['b']
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Bit dilimli toplu motor testleri (skaler codec ile eşdeğerlik)"""
+
+import random
+
+import pytest
+
+from hamming_bitslice import BitsliceBatch, planes_to_words, words_to_planes
+from hamming_codec import CODES, ERROR_SINGLE, get_codec
+
+@pytest.mark.parametrize('bits', (1, 8, 13, 64, 137))
+@pytest.mark.parametrize('count', (0, 1, 63, 64, 65, 300))
+def test_planes_round_trip(bits, count):
+    rng = random.Random(bits * 1000 + count)
+    words = [rng.getrandbits(bits) for _ in range(count)]
+    assert planes_to_words(words_to_planes(words, bits), count) == words
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('width', (8, 16, 32, 64, 128))
+def test_bitslice_matches_scalar(width, code):
+    codec = get_codec(width, code=code)
+    batch = BitsliceBatch(codec)
+    rng = random.Random(width)
+    data = [0, (1 << width) - 1] + [rng.getrandbits(width) for _ in range(150)]
+    encoded = batch.encode(data)
+    assert encoded == [codec.encode(x) for x in data]
+    
+    words = []
+    for word in encoded:
+        for position in rng.sample(range(codec.total_bits), rng.choice((0, 1, 2))):
+            word ^= 1 << position
+        words.append(word)
+    
+    status, positions, corrected, original = batch.decode(words)
+    assert batch.check(words) == status
+    for i, word in enumerate(words):
+        result = codec.decode(word)
+        assert status[i] == result.status
+        assert positions[i] == (-1 if result.error_position is None else result.error_position)
+        assert corrected[i] == result.corrected_data
+        if result.status <= ERROR_SINGLE:
+            assert original[i] == data[i] == result.original_data
+
+def test_oversized_data_rejected():
+    with pytest.raises(ValueError):
+        BitsliceBatch(get_codec(8)).encode([1, 256])
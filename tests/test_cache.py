@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""ECC önbellek simülatörü testleri"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from hamming_cache import ECCCache
+from hamming_codec import ERROR_DOUBLE, get_codec
+from hamming_memory import MemoryBank
+
+def reference_lru(lines, writes, ways, sets):
+    """Küme başına OrderedDict ile sade LRU modeli: (isabet, ıskalama, çıkarma, geri yazma)"""
+    cache = [OrderedDict() for _ in range(sets)]
+    hits = misses = evictions = writebacks = 0
+    for line, write in zip(lines, writes):
+        entries = cache[line % sets]
+        if line in entries:
+            hits += 1
+            entries.move_to_end(line)
+            entries[line] |= write
+            continue
+        misses += 1
+        if len(entries) == ways:
+            _, dirty = entries.popitem(last=False)
+            evictions += 1
+            writebacks += dirty
+        entries[line] = write
+    return hits, misses, evictions, writebacks
+
+@pytest.mark.parametrize('chunk_accesses', (7, 1000, 1 << 20))
+def test_lru_matches_reference(chunk_accesses):
+    rng = np.random.default_rng(1)
+    bank = MemoryBank(64, 8 * 512)
+    cache = ECCCache(bank, line_bytes=64, ways=4, sets=16)
+    # Yerellik için dar bir pencere ve ardışık tekrarlar
+    addresses = np.repeat(rng.integers(0, bank.size, 3000), rng.integers(1, 4, 3000))
+    writes = rng.random(addresses.size) < 0.3
+    
+    stats = cache.replay(addresses, writes, chunk_accesses)
+    lines = (addresses // cache.line_words).tolist()
+    hits, misses, evictions, writebacks = reference_lru(lines, writes.tolist(), 4, 16)
+    assert (stats.hits, stats.misses, stats.evictions, stats.writebacks) == \
+        (hits, misses, evictions, writebacks)
+
+def test_fill_corrects_and_writeback_cleans_memory():
+    codec = get_codec(64)
+    bank = MemoryBank(64, 8 * 64)
+    bank.fill(0, bank.size, 'address')
+    bank.inject_error(9, 5)          # satır 1, tek hata
+    bank.inject_error(17, 1)         # satır 2, düzeltilemez
+    bank.inject_error(17, 2)
+    cache = ECCCache(bank, line_bytes=64, ways=1, sets=4)
+    
+    # Satır 1 ve 2 kirli doldurulur, aynı kümedeki satırlarla çıkarılır
+    stats = cache.replay([9, 17, 9 + 32, 17 + 32], [True, True, False, False])
+    assert stats.writebacks == 2
+    assert (stats.fill.corrected, stats.fill.uncorrectable, stats.fill.words) == (1, 1, 4 * 8)
+    # Kopya düzeltilmiş olduğundan geri yazmada yalnızca zehir görünür
+    assert (stats.writeback.corrected, stats.writeback.uncorrectable, stats.writeback.words) == (0, 1, 2 * 8)
+    assert bank.read_raw(9) == codec.encode(9)
+    assert bank.read(17).status == ERROR_DOUBLE
+    
+    # Yeniden doldurmada tek hata artık yok, zehir yine okunur
+    stats = cache.replay([9, 17])
+    assert stats.corrected == 0 and stats.fill.uncorrectable == 1
+
+@pytest.mark.parametrize('width', (32, 128))
+def test_error_in_cached_dirty_line_counted_at_writeback(width):
+    codec = get_codec(width)
+    line_words = 64 * 8 // width
+    bank = MemoryBank(width, line_words * 64)
+    bank.fill(0, bank.size, 'random', seed=4)
+    expected = [bank.read_raw(a) for a in range(line_words * 2)]
+    cache = ECCCache(bank, line_bytes=64, ways=1, sets=8)
+    
+    cache.replay([1, line_words + 2], [True, True])
+    cache.inject_error(1, 3)                     # satır 0: tek hata
+    cache.inject_error(line_words + 2, 0)        # satır 1: çift hata
+    cache.inject_error(line_words + 2, 1)
+    assert bank.read_raw(1) == expected[1]
+    
+    # Aynı kümelere düşen satırlar kirli satırları çıkarır
+    stats = cache.replay([8 * line_words, 9 * line_words])
+    assert stats.fill.corrected == stats.fill.uncorrectable == 0
+    assert stats.writebacks == 2
+    assert (stats.writeback.corrected, stats.writeback.uncorrectable) == (1, 1)
+    assert stats.writeback.words == 2 * line_words
+    
+    # Tek hata düzeltilerek, çift hata olduğu gibi belleğe yazılır
+    assert bank.read_raw(1) == expected[1] == codec.encode(bank.read(1).original_data)
+    assert bank.read_raw(line_words + 2) == expected[line_words + 2] ^ 0b11
+    assert bank.read(line_words + 2).status == ERROR_DOUBLE
+
+def test_flush_checks_cached_copy():
+    codec = get_codec(32)
+    bank = MemoryBank(32, 16 * 8)
+    bank.fill(0, bank.size, 'random', seed=2)
+    expected = bank.read(3).original_data
+    bank.inject_error(3, 7)
+    cache = ECCCache(bank, line_bytes=64, ways=2, sets=2)
+    assert cache.access(3, write=True) is False
+    assert cache.stats.fill.corrected == 1
+    
+    # Kopya doldurmada düzeltildi; flush temiz kopyayı geri yazar
+    stats = cache.flush()
+    assert stats.writebacks == 1 and stats.writeback.words == 16 and stats.corrected == 0
+    assert bank.read_raw(3) == codec.encode(expected)
+    assert 3 in cache and cache.flush().writebacks == 0
+
+    cache.access(5, write=True)
+    cache.inject_error(5, 30)
+    assert cache.flush().writeback.corrected == 1
+    with pytest.raises(KeyError):
+        cache.inject_error(100, 0)
+
+class ReferenceCache:
+    """Olay olay çalışan sade model: yuva başına kelime kopyaları, skaler codec"""
+    def __init__(self, bank, line_words, ways, sets):
+        self.bank, self.line_words, self.ways, self.sets = bank, line_words, ways, sets
+        self.entries = [OrderedDict() for _ in range(sets)]    # satır -> [kirli, kelimeler]
+        self.fill = [0, 0]
+        self.writeback = [0, 0]
+    
+    def _check(self, words, tally):
+        result = []
+        for word in words:
+            decoded = self.bank.codec.decode(word)
+            tally[0] += decoded.status == 1
+            tally[1] += decoded.status >= 2
+            result.append(decoded.corrected_data)
+        return result
+    
+    def _write_back(self, line, words):
+        for i, word in enumerate(self._check(words, self.writeback)):
+            self.bank.write_raw(line * self.line_words + i, word)
+    
+    def access(self, address, write):
+        line = address // self.line_words
+        entries = self.entries[line % self.sets]
+        if line in entries:
+            entries.move_to_end(line)
+            entries[line][0] |= write
+            return
+        if len(entries) == self.ways:
+            victim, (dirty, words) = entries.popitem(last=False)
+            if dirty:
+                self._write_back(victim, words)
+        words = [self.bank.read_raw(line * self.line_words + i) for i in range(self.line_words)]
+        entries[line] = [write, self._check(words, self.fill)]
+    
+    def inject_error(self, address, position):
+        line = address // self.line_words
+        self.entries[line % self.sets][line][1][address % self.line_words] ^= 1 << position
+    
+    def flush(self):
+        for entries in self.entries:
+            for line, entry in entries.items():
+                if entry[0]:
+                    self._write_back(line, entry[1])
+                    entry[0] = False
+
+@pytest.mark.parametrize('width', (32, 128))
+def test_batched_ecc_matches_event_by_event_reference(width):
+    rng = np.random.default_rng(width)
+    line_words = 64 * 8 // width
+    banks = [MemoryBank(width, line_words * 64) for _ in range(2)]
+    for bank in banks:
+        bank.fill(0, bank.size, 'random', seed=1)
+    cache = ECCCache(banks[0], line_bytes=64, ways=2, sets=4)
+    reference = ReferenceCache(banks[1], line_words, 2, 4)
+    total_bits = banks[0].codec.total_bits
+    
+    for _ in range(6):
+        # Bellekte ve önbellekteki kopyalarda rastgele hatalar
+        for address in rng.integers(0, banks[0].size, 10).tolist():
+            position = int(rng.integers(total_bits))
+            for bank in banks:
+                bank.inject_error(address, position)
+        for slot, line in enumerate(cache._lines):
+            if line >= 0 and rng.random() < 0.5:
+                address = line * line_words + int(rng.integers(line_words))
+                position = int(rng.integers(total_bits))
+                cache.inject_error(address, position)
+                reference.inject_error(address, position)
+        
+        addresses = rng.integers(0, banks[0].size, 400)
+        writes = rng.random(400) < 0.4
+        cache.replay(addresses, writes, chunk_accesses=int(rng.integers(1, 200)))
+        for address, write in zip(addresses.tolist(), writes.tolist()):
+            reference.access(address, write)
+    
+    cache.flush()
+    reference.flush()
+    stats = cache.stats
+    assert [stats.fill.corrected, stats.fill.uncorrectable] == reference.fill
+    assert [stats.writeback.corrected, stats.writeback.uncorrectable] == reference.writeback
+    assert np.array_equal(banks[0].codewords, banks[1].codewords)
+
+def test_cache_uses_bank_code():
+    bank = MemoryBank(64, 8 * 16, code='hsiao')
+    bank.fill(0, bank.size, 'random', seed=4)
+    bank.inject_error(3, 70)
+    assert ECCCache(bank, sets=2).code == 'hsiao'
+    with pytest.raises(ValueError):
+        ECCCache(bank, sets=2, code='hamming')
+    
+    cache = ECCCache(bank, ways=1, sets=2, code='hsiao')
+    stats = cache.replay([3, 16, 8], [True, False, False])
+    assert stats.writebacks == 1 and stats.fill.corrected == 1
+    assert bank.read_raw(3) == get_codec(64, 'mask', 'hsiao').encode(bank.read(3).original_data)
+    assert bank.verify_pattern(0, bank.size, 'random', seed=4).clean == bank.size
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Hata enjeksiyonu kampanyası testleri"""
+
+import numpy as np
+import pytest
+
+from hamming_campaign import OUTCOMES, classify, main, run_campaign
+from hamming_codec import ERROR_DOUBLE, ERROR_NONE, ERROR_SINGLE
+
+@pytest.mark.parametrize('code', ('hamming', 'hsiao'))
+def test_sec_ded_guarantees(code):
+    single = run_campaign(16, 5000, error_bits=1, seed=1, code=code)
+    double = run_campaign(16, 5000, error_bits=2, seed=1, code=code)
+    assert single.count(OUTCOMES.index('corrected')) == 5000
+    assert double.count(OUTCOMES.index('detected')) == 5000
+
+def test_cli_code_option(capsys):
+    assert main(['--width', '16', '--trials', '1000', '--errors', '1', '--seed', '1', '--code', 'hsiao']) == 0
+    assert "'corrected': 1000" in capsys.readouterr().out
+
+def test_seed_reproducible_across_workers():
+    serial = run_campaign(32, 20000, ber=0.02, seed=9, batch_size=4096)
+    parallel = run_campaign(32, 20000, ber=0.02, seed=9, batch_size=4096, workers=2)
+    assert np.array_equal(serial.by_weight, parallel.by_weight)
+    assert serial.trials == 20000
+
+def test_outcomes_by_weight():
+    report = run_campaign(16, 20000, error_bits=3, seed=2).as_dict()
+    assert list(report['by_weight']) == [3]
+    # Üç bitlik hata Hamming SEC-DED'de ya tespit edilir ya da yanlış düzeltilir
+    assert report['miscorrected'] > 0
+    assert report['clean'] == report['corrected'] == 0
+    assert report['detected'] + report['miscorrected'] + report['undetected'] == 20000
+
+def test_classify():
+    status = np.array([ERROR_NONE, ERROR_NONE, ERROR_SINGLE, ERROR_SINGLE, ERROR_DOUBLE], dtype=np.uint8)
+    original = np.array([1, 2, 3, 4, 5], dtype=np.uint64)
+    corrected = np.array([1, 9, 3, 9, 5], dtype=np.uint64)
+    assert [OUTCOMES[i] for i in classify(status, corrected, original)] == \
+        ['clean', 'undetected', 'corrected', 'miscorrected', 'detected']
+
+def test_requires_exactly_one_error_model():
+    with pytest.raises(ValueError):
+        run_campaign(16, 10)
+    with pytest.raises(ValueError):
+        run_campaign(16, 10, ber=0.1, error_bits=1)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Skaler codec için tam sayım testleri (temiz, tek ve çift bit hataları)"""
+
+from itertools import combinations
+
+import pytest
+
+from hamming_codec import CODES, ENGINES, ERROR_DOUBLE, ERROR_NONE, ERROR_SINGLE, get_codec
+
+CODECS = [(engine, code) for engine in ENGINES for code in CODES]
+
+# 16 bitte çift hata taraması için örnek değerler (tüm değerler x tüm çiftler çok uzun)
+SAMPLE_16 = (0x0000, 0xFFFF, 0x8000, 0x0001, 0xA5A5, 0x5A5A, 0x1234, 0xFEDC)
+
+@pytest.mark.parametrize('engine,code', CODECS)
+@pytest.mark.parametrize('width', (8, 16))
+def test_round_trip_exhaustive(width, engine, code):
+    codec = get_codec(width, engine, code)
+    for value in range(1 << width):
+        encoded = codec.encode(value)
+        result = codec.detect_and_correct(encoded)
+        assert result['error_type'] == 'none', hex(value)
+        assert result['original_data'] == value
+        assert codec.decode(encoded) == (ERROR_NONE, None, encoded, value)
+
+@pytest.mark.parametrize('engine,code', CODECS)
+def test_regressions_8bit(engine, code):
+    codec = get_codec(8, engine, code)
+    # Üst veri biti düşmemeli ve temiz kelimeler 'double' sayılmamalı
+    assert codec.detect_and_correct(codec.encode(0xFF))['original_data'] == 0xFF
+    assert all(codec.detect_and_correct(codec.encode(v))['error_type'] == 'none' for v in range(256))
+
+@pytest.mark.parametrize('engine,code', CODECS)
+@pytest.mark.parametrize('width', (8, 16))
+def test_every_single_bit_error(width, engine, code):
+    codec = get_codec(width, engine, code)
+    values = range(1 << width) if width == 8 else range(0, 1 << width, 97)
+    for value in values:
+        encoded = codec.encode(value)
+        for position in range(codec.total_bits):
+            result = codec.detect_and_correct(codec.inject_error(encoded, position))
+            assert result['error_type'] == 'single'
+            assert result['error_position'] == position
+            assert result['corrected_data'] == encoded
+            assert result['original_data'] == value
+
+@pytest.mark.parametrize('engine,code', CODECS)
+@pytest.mark.parametrize('width', (8, 16))
+def test_every_double_bit_error(width, engine, code):
+    codec = get_codec(width, engine, code)
+    values = range(1 << width) if width == 8 else SAMPLE_16
+    pairs = list(combinations(range(codec.total_bits), 2))
+    for value in values:
+        encoded = codec.encode(value)
+        for first, second in pairs:
+            corrupted = encoded ^ (1 << first) ^ (1 << second)
+            assert codec.detect_and_correct(corrupted)['error_type'] == 'double'
+            assert codec.check(corrupted) == ERROR_DOUBLE
+
+@pytest.mark.parametrize('width', (32, 64, 128))
+def test_wide_single_errors(width):
+    codec = get_codec(width)
+    value = (0x0123456789ABCDEF * 0x10001) & ((1 << width) - 1)
+    encoded = codec.encode(value)
+    for position in range(codec.total_bits):
+        status, found, corrected, data = codec.decode(encoded ^ (1 << position))
+        assert (status, found, corrected, data) == (ERROR_SINGLE, position, encoded, value)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Üretilmiş düz çizgi fonksiyonlarının skaler codec ile eşdeğerliği"""
+
+import random
+
+import pytest
+
+import hamming_codegen
+from hamming_codec import CODES, ENGINES, get_codec
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('width', (8, 16, 32, 64, 128))
+def test_compiled_matches_scalar(width, engine, code):
+    codec = get_codec(width, engine, code)
+    compiled = get_codec(width, engine, code, compiled=True)
+    assert compiled.compiled and compiled is not codec
+    
+    rng = random.Random(width)
+    for _ in range(100):
+        data = rng.getrandbits(width)
+        word = codec.encode(data)
+        assert compiled.encode(data) == word
+        for flips in (0, 1, 2, 3):
+            corrupted = word
+            for position in rng.sample(range(codec.total_bits), flips):
+                corrupted ^= 1 << position
+            assert compiled.decode(corrupted) == codec.decode(corrupted)
+            assert compiled.check(corrupted) == codec.check(corrupted)
+            assert compiled.detect_and_correct(corrupted) == codec.detect_and_correct(corrupted)
+
+def test_compiled_exhaustive_8bit():
+    codec = get_codec(8)
+    compiled = get_codec(8, compiled=True)
+    for data in range(256):
+        assert compiled.encode(data) == codec.encode(data)
+    for word in range(1 << codec.total_bits):
+        assert compiled.decode(word) == codec.decode(word)
+
+def test_compiled_oversized_data_rejected():
+    with pytest.raises(ValueError):
+        get_codec(16, compiled=True).encode(1 << 16)
+
+def test_disk_cache_round_trip(tmp_path, monkeypatch):
+    codec = get_codec(32, 'lut')
+    cls = type(codec)
+    
+    # Bellek önbelleği boşken kod nesnesi diske yazılır, ikinci derlemede oradan okunur
+    monkeypatch.setattr(hamming_codegen, '_COMPILED_CACHE', {})
+    fresh = cls(32, 'lut').prepare().compile(cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    monkeypatch.setattr(hamming_codegen, '_COMPILED_CACHE', {})
+    again = cls(32, 'lut').prepare().compile(cache_dir=str(tmp_path))
+    for data in (0, 1, 0xDEADBEEF, 0xFFFFFFFF):
+        assert fresh.encode(data) == again.encode(data) == codec.encode(data)
+        assert again.decode(codec.encode(data) ^ 8) == codec.decode(codec.encode(data) ^ 8)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Kapsama analizi testleri (codec.decode ile kaba kuvvet sayımına karşı)"""
+
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from hamming_campaign import (OUTCOMES, OUTCOME_CORRECTED, OUTCOME_DETECTED, OUTCOME_MISCORRECTED,
+                              OUTCOME_UNDETECTED)
+from hamming_codec import ERROR_NONE, ERROR_SINGLE, get_codec
+from hamming_coverage import analyze
+
+def brute_force(codec, data, max_weight):
+    """Her deseni gerçek bir kelimeye uygulayıp codec.decode ile sınıflandırır"""
+    n = codec.total_bits
+    original = codec.encode(data)
+    by_weight = {}
+    by_bit = {}
+    for weight in range(1, max_weight + 1):
+        counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+        per_bit = np.zeros((n, len(OUTCOMES)), dtype=np.int64)
+        for bits in combinations(range(n), weight):
+            mask = sum(1 << bit for bit in bits)
+            result = codec.decode(original ^ mask)
+            if result.status == ERROR_NONE:
+                outcome = OUTCOME_UNDETECTED
+            elif result.status != ERROR_SINGLE:
+                outcome = OUTCOME_DETECTED
+            elif result.corrected_data == original:
+                outcome = OUTCOME_CORRECTED
+            else:
+                outcome = OUTCOME_MISCORRECTED
+            counts[outcome] += 1
+            for bit in bits:
+                per_bit[bit, outcome] += 1
+        by_weight[weight] = counts
+        by_bit[weight] = per_bit
+    return by_weight, by_bit
+
+@pytest.mark.parametrize('code', ('hamming', 'hsiao'))
+@pytest.mark.parametrize('width', (8, 16))
+def test_analyze_matches_brute_force(width, code):
+    codec = get_codec(width, 'mask', code)
+    report = analyze(width, 3, 'lut', code)
+    by_weight, by_bit = brute_force(codec, (0xA5C3 * 0x9E37) & ((1 << width) - 1), 3)
+    
+    assert report.total_bits == codec.total_bits
+    for weight in (1, 2, 3):
+        assert list(report.by_weight[weight]) == list(by_weight[weight])
+        assert report.by_bit[weight].tolist() == by_bit[weight].tolist()
+    
+    # Tek hatalar daima düzeltilir, çift hatalar daima tespit edilir
+    assert report.count(1, OUTCOME_CORRECTED) == codec.total_bits
+    assert report.count(2, OUTCOME_DETECTED) == report.patterns(2)
+
+@pytest.mark.parametrize('code', ('hamming', 'hsiao'))
+def test_as_dict_per_bit(code):
+    report = analyze(8, 2, code=code)
+    summary = report.as_dict(per_bit=True)
+    _, by_bit = brute_force(get_codec(8, 'lut', code), 0x5A, 2)
+    assert summary['by_weight'][2]['patterns'] == report.total_bits * (report.total_bits - 1) // 2
+    for weight in (1, 2):
+        rows = [[row[name] for name in OUTCOMES[1:]] for row in summary['by_bit'][weight]]
+        assert rows == by_bit[weight][:, 1:].tolist()
+    with pytest.raises(ValueError):
+        analyze(8, 4)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Hata olay kaydı testleri"""
+
+import random
+from collections import Counter
+
+from hamming_events import EVENT_CORRECTED, EVENT_UNCORRECTABLE, EventLog
+from hamming_memory import MemoryBank
+from hamming_scrub import PatrolScrubber
+
+def test_persistent_uncorrectable_counted_once_over_passes():
+    bank = MemoryBank(32, 4096)
+    bank.fill(0, 4096, 'random', seed=11)
+    for address in (7, 2000):
+        bank.inject_error(address, 0)
+        bank.inject_error(address, 5)
+    bank.inject_error(300, 4)
+    
+    events = EventLog(page_words=512)
+    scrubber = PatrolScrubber(bank, chunk_words=1000, events=events)
+    for _ in range(10):
+        scrubber.run_pass()
+    
+    assert events.uncorrectable_count(7) == events.uncorrectable_count(2000) == 1
+    assert events.address_count(300) == 1
+    assert events.summary() == {'corrected': 1, 'uncorrectable': 2, 'buffered': 3,
+                                'dropped': 0, 'addresses': 3}
+    assert events.addresses_at_least(2) == []
+
+def test_indexes_match_brute_force_over_ring_buffer():
+    rng = random.Random(4)
+    events = EventLog(capacity=300, page_words=16)
+    recorded = []
+    for _ in range(1000):
+        address = rng.randrange(64)
+        if rng.random() < 0.2:
+            events.record(address, EVENT_UNCORRECTABLE)
+            recorded.append((address, EVENT_UNCORRECTABLE, None))
+        else:
+            position = rng.randrange(39)
+            events.record(address, EVENT_CORRECTED, position)
+            recorded.append((address, EVENT_CORRECTED, position))
+    
+    window = recorded[-300:]
+    addresses = Counter(address for address, _, _ in window)
+    pages = Counter(address // 16 for address, _, _ in window)
+    bits = Counter(position for _, kind, position in window if kind == EVENT_CORRECTED)
+    
+    assert [(e.address, e.type, e.position) for e in events.recent()] == window
+    assert events.bit_counts() == dict(sorted(bits.items()))
+    assert all(events.address_count(a) == addresses[a] for a in range(64))
+    assert all(events.uncorrectable_count(a) == sum(1 for x, kind, _ in window
+                                                    if x == a and kind == EVENT_UNCORRECTABLE)
+               for a in range(64))
+    assert [count for _, count in events.hot_addresses(5)] == sorted(addresses.values(), reverse=True)[:5]
+    assert [count for _, count in events.hot_pages(4)] == sorted(pages.values(), reverse=True)[:4]
+    assert all(events.page_count(p) == pages[p] for p in range(4))
+    assert sorted(events.addresses_at_least(20)) == sorted((a, c) for a, c in addresses.items() if c >= 20)
+    assert events.summary()['dropped'] == 700
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Serpiştirme katmanı testleri (skaler codec ile eşdeğerlik)"""
+
+import random
+
+import numpy as np
+import pytest
+
+from hamming_batch import int_to_limbs, limb_count, limbs_to_int
+from hamming_codec import ERROR_NONE, ERROR_SINGLE, get_codec
+from hamming_interleave import InterleavedCodec, inject_burst
+
+def make_data(width, count, seed):
+    rng = random.Random(seed)
+    values = [rng.getrandbits(width) for _ in range(count)]
+    limbs = limb_count(width)
+    if limbs == 1:
+        return values, np.array(values, dtype=np.uint64)
+    return values, np.array([int_to_limbs(v, limbs) for v in values], dtype=np.uint64)
+
+@pytest.mark.parametrize('width,depth', ((8, 1), (32, 4), (64, 8), (128, 3)))
+def test_interleave_round_trip_matches_scalar(width, depth):
+    layer = InterleavedCodec(width, depth)
+    values, data = make_data(width, depth * 5, width)
+    blocks = layer.encode(data)
+    assert blocks.shape == (5, layer.block_bytes)
+    
+    words = layer.deinterleave(blocks)
+    rows = words.tolist() if words.ndim == 1 else [limbs_to_int(row) for row in words]
+    assert [int(w) for w in rows] == [layer.codec.encode(v) for v in values]
+    
+    # Bloktaki i. bit, (i mod D). kelimenin (i div D). bitidir
+    column = depth - 1
+    word = layer.codec.encode(values[depth + column])
+    bits = np.unpackbits(blocks[1], bitorder='little')
+    assert [int(b) for b in bits[column:layer.block_bits:depth]] == \
+        [(word >> i) & 1 for i in range(layer.total_bits)]
+
+@pytest.mark.parametrize('width,depth', ((32, 4), (64, 8)))
+def test_burst_up_to_depth_is_corrected(width, depth):
+    layer = InterleavedCodec(width, depth)
+    _, data = make_data(width, depth * 3, 7)
+    blocks = layer.encode(data)
+    pristine = blocks.copy()
+    inject_burst(blocks, 1, 11, depth)
+    
+    status, _, _, decoded = layer.decode(blocks)
+    assert np.count_nonzero(status == ERROR_SINGLE) == depth
+    assert np.array_equal(decoded, data)
+    assert np.all(layer.scrub(blocks) <= ERROR_SINGLE)
+    assert np.array_equal(blocks, pristine)
+    assert np.all(layer.decode(blocks)[0] == ERROR_NONE)
+
+def test_word_count_must_fill_blocks():
+    layer = InterleavedCodec(32, 4)
+    with pytest.raises(ValueError):
+        layer.encode(np.zeros(6, dtype=np.uint64))
+
+@pytest.mark.parametrize('code', ('hamming', 'hsiao'))
+def test_code_passed_to_codec(code):
+    layer = InterleavedCodec(64, 4, 'mask', code)
+    assert layer.codec is get_codec(64, 'mask', code)
+    assert layer.code == code
+    values, data = make_data(64, 8, 3)
+    blocks = layer.encode(data)
+    words = layer.deinterleave(blocks)
+    assert [limbs_to_int(row) for row in words] == [layer.codec.encode(v) for v in values]
+    
+    inject_burst(blocks, 0, 5, 4)
+    status, _, _, decoded = layer.decode(blocks)
+    assert np.count_nonzero(status == ERROR_SINGLE) == 4
+    assert np.array_equal(decoded, data)
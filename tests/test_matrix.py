@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""G/H matris yolu testleri (skaler codec ile eşdeğerlik)"""
+
+import random
+
+import numpy as np
+import pytest
+
+from hamming_batch import int_to_limbs, limb_count, limbs_to_int
+from hamming_codec import CODES, MatrixCodec, get_codec
+from hamming_matrix import MatrixBatch, gf2_matmul
+
+def to_array(values, bits):
+    """Tam sayı listesini encode_batch düzenine çevirir"""
+    limbs = limb_count(bits)
+    return np.array([int_to_limbs(value, limbs) for value in values], dtype=np.uint64).reshape(len(values), limbs)
+
+def to_ints(array):
+    """encode_batch düzenindeki diziyi tam sayı listesine çevirir"""
+    return [limbs_to_int(row) for row in np.asarray(array).reshape(len(array), -1)]
+
+def test_gf2_matmul():
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 2, (20, 70), dtype=np.uint8)
+    b = rng.integers(0, 2, (70, 9), dtype=np.uint8)
+    assert np.array_equal(gf2_matmul(a, b), (a.astype(int) @ b.astype(int)) % 2)
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('width', (8, 32, 64, 128))
+def test_matrices_define_the_code(width, code):
+    codec = get_codec(width, code=code)
+    generator = codec.generator_matrix()
+    parity_check = codec.parity_check_matrix()
+    
+    # Her kod kelimesi H'nin tüm satırlarına diktir ve G satırları kodlamadır
+    for i, row in enumerate(generator):
+        assert row == codec.encode(1 << i)
+        assert all((row & check).bit_count() % 2 == 0 for check in parity_check)
+
+@pytest.mark.parametrize('code', CODES)
+@pytest.mark.parametrize('width', (8, 32, 64, 128))
+def test_matrix_batch_matches_scalar(width, code):
+    codec = get_codec(width, code=code)
+    batch = MatrixBatch(codec, chunk_rows=37)
+    rng = random.Random(width)
+    data = [rng.getrandbits(width) for _ in range(100)]
+    encoded = [codec.encode(x) for x in data]
+    assert to_ints(batch.encode(to_array(data, width))) == encoded
+    
+    words = [word ^ (1 << rng.randrange(codec.total_bits)) if i % 2 else word
+             for i, word in enumerate(encoded)]
+    status, position, corrected, original = batch.decode(to_array(words, codec.total_bits))
+    for i, word in enumerate(words):
+        result = codec.decode(word)
+        assert status[i] == result.status
+        assert position[i] == (-1 if result.error_position is None else result.error_position)
+        assert to_ints(corrected[i:i + 1]) == [result.corrected_data]
+        assert to_ints(original[i:i + 1]) == [data[i]]
+
+@pytest.mark.parametrize('code', CODES)
+def test_matrix_codec_rebuilds_code(code):
+    codec = get_codec(32, code=code)
+    rebuilt = MatrixCodec(codec.generator_matrix(), codec.parity_check_matrix()).prepare()
+    rng = random.Random(1)
+    for _ in range(200):
+        word = codec.encode(rng.getrandbits(32))
+        for position in rng.sample(range(codec.total_bits), rng.choice((0, 1, 2))):
+            word ^= 1 << position
+        assert rebuilt.decode(word).status == codec.decode(word).status
+        assert rebuilt.decode(word).corrected_data == codec.decode(word).corrected_data
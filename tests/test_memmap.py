@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Bellek eşlemeli görüntü testleri"""
+
+import numpy as np
+import pytest
+
+from hamming_codec import ERROR_NONE, ERROR_SINGLE, get_codec
+from hamming_memmap import MappedMemoryImage
+
+@pytest.mark.parametrize('width', (32, 128))
+def test_image_matches_scalar_codec(tmp_path, width):
+    codec = get_codec(width)
+    rng = np.random.default_rng(width)
+    values = [int.from_bytes(rng.bytes(width // 8), 'little') for _ in range(64)]
+    
+    with MappedMemoryImage.create(str(tmp_path / 'image.hmi'), width, 100) as image:
+        for address, value in enumerate(values):
+            image.write(address, value)
+        assert [image.read_raw(a) for a in range(64)] == [codec.encode(v) for v in values]
+        
+        image.inject_error(5, 3)
+        assert image.read(5) == (ERROR_SINGLE, 3, codec.encode(values[5]), values[5])
+        stats = image.scrub()
+        assert stats.corrected == 1 and stats.words == 100
+        assert image.read(5).status == ERROR_NONE
+
+def test_read_block_bounds(tmp_path):
+    with MappedMemoryImage.create(str(tmp_path / 'image.hmi'), 32, 100) as image:
+        status = image.read_block(90, 10)[0]
+        assert status.size == 10
+        with pytest.raises(IndexError):
+            image.read_block(95, 10)
+        with pytest.raises(IndexError):
+            image.read_block(-1, 2)
+        with pytest.raises(IndexError):
+            image.write_block(99, np.zeros(2, dtype=np.uint64))
+
+@pytest.mark.parametrize('mode', ('r', 'r+'))
+def test_truncated_image_rejected(tmp_path, mode):
+    path = tmp_path / 'image.hmi'
+    with MappedMemoryImage.create(str(path), 128, 10) as image:
+        image.write(9, 1)
+    size = path.stat().st_size
+    with open(path, 'r+b') as f:
+        f.truncate(size - 8)
+    with pytest.raises(ValueError, match="kısaltılmış"):
+        MappedMemoryImage(str(path), mode)
+    # Dosya değiştirilmeden bırakılır
+    assert path.stat().st_size == size - 8
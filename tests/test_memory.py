@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Bellek bankası testleri (skaler codec ile eşdeğerlik)"""
+
+import numpy as np
+import pytest
+
+from hamming_batch import limbs_to_int
+from hamming_codec import ERROR_SINGLE, get_codec
+from hamming_memory import MemoryBank
+from hamming_patterns import PATTERNS, pattern_data
+
+def test_default_engine_matches_codec_default():
+    bank = MemoryBank(16, 8)
+    assert bank.codec is get_codec(16)
+
+@pytest.mark.parametrize('width', (8, 32, 64, 128))
+def test_block_write_matches_scalar_codec(width):
+    codec = get_codec(width)
+    bank = MemoryBank(width, 300)
+    bank.fill(10, 250, 'random', seed=7)
+    
+    for address in (10, 11, 137, 259):
+        data = bank.read(address).original_data
+        assert bank.read_raw(address) == codec.encode(data)
+    
+    bank.inject_error(137, 3)
+    status, position, _, _ = bank.read_block(137, 1)
+    assert status[0] == ERROR_SINGLE and position[0] == 3
+    assert bank.read(137).error_position == 3
+    assert bank.verify_pattern(10, 250, 'random', seed=7).ok
+
+def test_scalar_write_visible_to_block_read():
+    codec = get_codec(128)
+    bank = MemoryBank(128, 4)
+    value = (1 << 127) | 0x1234
+    bank.write(2, value)
+    _, _, _, data = bank.read_block(0, 4)
+    assert limbs_to_int(data[2]) == value
+    assert list(bank.addresses()) == [2]
+    assert bank.read_raw(2) == codec.encode(value)
+
+def test_range_checks():
+    bank = MemoryBank(32, 16)
+    with pytest.raises(IndexError):
+        bank.read_block(10, 7)
+    with pytest.raises(IndexError):
+        bank.write_block(12, np.zeros(5, dtype=np.uint64))
+    with pytest.raises(KeyError):
+        bank.read_raw(0)
+
+def test_write_file_round_trip(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(bytes(range(256)) * 3 + b'\x01')
+    bank = MemoryBank(32, 256)
+    assert bank.write_file(str(path), 3) == 193
+    assert bank.read(3).original_data == 0x03020100
+    assert bank.read(195).original_data == 0x01
+    assert bank.verify_file(str(path), 3).ok
+
+def test_write_file_too_large_leaves_bank_untouched(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(bytes(4 * 100 + 1))
+    bank = MemoryBank(32, 200, 'mask')
+    with pytest.raises(ValueError):
+        bank.write_file(str(path), 100, chunk_words=16)
+    assert bank.valid_count() == 0
+    assert bank.write_file(str(path), 99, chunk_words=16) == 101
+
+@pytest.mark.parametrize('pattern', PATTERNS)
+@pytest.mark.parametrize('width', (12, 64, 100))
+def test_pattern_chunks_independent(width, pattern):
+    whole = pattern_data(pattern, width, 37, 200, seed=11)
+    parts = [pattern_data(pattern, width, 37 + begin, size, seed=11)
+             for begin, size in ((0, 1), (1, 63), (64, 100), (164, 36))]
+    assert np.array_equal(np.concatenate(parts), whole)
+    assert np.array_equal(pattern_data(pattern, width, 137, 1, seed=11), whole[100:101])
+    # Veri genişliğinin üstünde bit kalmaz
+    assert all(limbs_to_int(np.atleast_1d(word)) >> width == 0 for word in whole)
+
+def test_random_pattern_depends_on_seed():
+    first = pattern_data('random', 32, 0, 64, seed=1)
+    assert np.array_equal(first, pattern_data('random', 32, 0, 64, seed=1))
+    assert not np.array_equal(first, pattern_data('random', 32, 0, 64, seed=2))
+    with pytest.raises(ValueError):
+        pattern_data('stripes', 32, 0, 4)
+
+def test_pattern_values():
+    assert list(pattern_data('walking_ones', 8, 6, 4)) == [0x40, 0x80, 0x01, 0x02]
+    assert list(pattern_data('walking_zeros', 8, 7, 2)) == [0x7F, 0xFE]
+    assert list(pattern_data('checkerboard', 16, 0, 3)) == [0x5555, 0xAAAA, 0x5555]
+    assert list(pattern_data('address', 8, 254, 3)) == [254, 255, 0]
+    wide = pattern_data('walking_ones', 100, 99, 2)
+    assert [limbs_to_int(row) for row in wide] == [1 << 99, 1]
+    assert [limbs_to_int(row) for row in pattern_data('address', 100, 5, 1)] == [(5 << 64) | 5]
+    assert limbs_to_int(pattern_data('checkerboard', 100, 1, 1)[0]) == int('10' * 50, 2)
+
+@pytest.mark.parametrize('pattern', PATTERNS)
+def test_fill_verify_round_trip(pattern):
+    bank = MemoryBank(64, 1000)
+    bank.fill(100, 800, pattern, seed=5, chunk_words=128)
+    report = bank.verify_pattern(100, 800, pattern, seed=5, chunk_words=300)
+    assert report.ok and report.words == 800 and report.clean == 800
+    assert (report.mismatched, report.unwritten, report.mismatch_addresses) == (0, 0, [])
+
+def test_verify_pattern_counts_errors():
+    bank = MemoryBank(32, 100)
+    bank.fill(10, 80, 'random', seed=3)
+    bank.inject_error(20, 5)
+    bank.inject_error(30, 1)
+    bank.inject_error(30, 2)
+    
+    report = bank.verify_pattern(0, 100, 'random', seed=3, chunk_words=16)
+    assert report.corrected == 1
+    assert report.double == 1 and report.uncorrectable == 1
+    assert report.unwritten == 20
+    assert report.mismatched == 21
+    assert 20 not in report.mismatch_addresses
+    assert 30 in report.mismatch_addresses and 0 in report.mismatch_addresses
+    assert not report.ok
+    # Doğrulama geri yazmaz: hata bankada kalır
+    assert bank.read(20).error_position == 5
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Çok süreçli toplu işlem motorunun skaler codec ile eşdeğerliği"""
+
+import numpy as np
+import pytest
+
+from hamming_codec import ERROR_SINGLE, get_codec
+from hamming_memmap import MappedMemoryImage
+from hamming_parallel import ParallelCodec
+
+@pytest.mark.parametrize('code', ('hamming', 'hsiao'))
+def test_parallel_matches_scalar_codec(code):
+    codec = get_codec(32, 'lut', code)
+    data = np.random.default_rng(7).integers(0, 1 << 32, 5000, dtype=np.uint64)
+    with ParallelCodec(32, workers=2, chunk_words=1024, code=code) as parallel:
+        encoded = parallel.encode(data)
+        assert encoded.tolist() == [codec.encode(int(value)) for value in data]
+        
+        encoded[[3, 2000]] ^= np.uint64(1 << 5)
+        (status, position, corrected, decoded), stats = parallel.decode(encoded)
+        assert stats.corrected == 2 and stats.words == 5000
+        assert status[3] == ERROR_SINGLE and position[2000] == 5
+        assert np.array_equal(decoded, data)
+
+def test_parallel_scrub_image_uses_image_code(tmp_path):
+    path = str(tmp_path / 'image.hmi')
+    with MappedMemoryImage.create(path, 64, 4096, code='hsiao') as image:
+        image.write_block(0, np.arange(4096, dtype=np.uint64))
+        image.inject_error(100, 7)
+    
+    with ParallelCodec(64, workers=2, chunk_words=1024, code='hsiao') as parallel:
+        stats = parallel.scrub_image(path)
+    assert stats.corrected == 1
+    with MappedMemoryImage(path, 'r') as image:
+        assert image.code == 'hsiao'
+        assert image.read(100) == get_codec(64, 'lut', 'hsiao').decode(image.read_raw(100))
+        assert image.read(100).original_data == 100
+
+@pytest.mark.parametrize('width', (16, 64, 128))
+def test_uneven_shards_match_serial(width):
+    codec = get_codec(width, 'lut')
+    rng = np.random.default_rng(width)
+    limbs = (width + 63) // 64
+    data = rng.integers(0, 1 << 63, (3001, limbs), dtype=np.uint64)
+    if width < 64:
+        data = data.reshape(-1) & np.uint64((1 << width) - 1)
+    
+    with ParallelCodec(width, workers=3, chunk_words=700) as parallel:
+        encoded = parallel.encode(data)
+        assert np.array_equal(encoded, codec.encode_batch(data))
+        
+        flat = encoded.reshape(len(encoded), -1)
+        flat[::5, 0] ^= np.uint64(1)
+        flat[::7, 0] ^= np.uint64(6)
+        results, stats = parallel.decode(encoded)
+        serial = codec.decode_batch(encoded)
+        for got, expected in zip(results, serial):
+            assert np.array_equal(got, expected)
+        assert stats.words == 3001 and stats.corrected == np.count_nonzero(serial[0] == ERROR_SINGLE)
+
+def test_scrub_writes_back_corrected_words():
+    codec = get_codec(32, 'lut')
+    data = np.arange(5000, dtype=np.uint64)
+    encoded = codec.encode_batch(data)
+    pristine = encoded.copy()
+    encoded[[0, 1999, 4999]] ^= np.uint64(1 << 9)
+    
+    with ParallelCodec(32, workers=2, chunk_words=1000) as parallel:
+        assert parallel.scrub(encoded, write_back=False).corrected == 3
+        assert not np.array_equal(encoded, pristine)
+        assert parallel.scrub(encoded).corrected == 3
+    assert np.array_equal(encoded, pristine)
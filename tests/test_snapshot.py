@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Anlık görüntü testleri"""
+
+import numpy as np
+import pytest
+
+from hamming_codec import get_codec
+from hamming_memory import MemoryBank
+import hamming_snapshot
+from hamming_snapshot import load_snapshot, save_snapshot
+
+@pytest.mark.parametrize('compress', (False, True))
+@pytest.mark.parametrize('width,code', ((16, 'hamming'), (64, 'hsiao'), (128, 'hamming')))
+def test_round_trip_matches_scalar_codec(tmp_path, width, code, compress):
+    bank = MemoryBank(width, 777, code=code)
+    bank.fill(3, 700, 'random', seed=5)
+    bank.inject_error(100, 2)
+    history = [['Yazma', 'Başarılı', '12:00:00']]
+    path = tmp_path / 'bank.hms'
+    save_snapshot(str(path), bank, history, compress)
+    
+    loaded, rows = load_snapshot(str(path))
+    assert rows == history
+    assert loaded.codec is get_codec(width, bank.codec.engine, code)
+    assert np.array_equal(loaded.codewords, bank.codewords)
+    assert np.array_equal(loaded.valid, bank.valid)
+    
+    codec = get_codec(width, code=code)
+    for address in (3, 100, 702):
+        assert loaded.read(address) == codec.decode(bank.read_raw(address))
+    assert loaded.verify_pattern(3, 700, 'random', seed=5).mismatched == 0
+
+def test_save_writes_outside_bank_lock(tmp_path, monkeypatch):
+    bank = MemoryBank(32, 64)
+    bank.fill(0, 64, 'address')
+    held = []
+    
+    # Dosya açılıp yazılırken bankanın kilidi serbest olmalı
+    def fake_open(path, mode):
+        held.append(bank.lock.locked())
+        return open(path, mode)
+    
+    monkeypatch.setattr(hamming_snapshot, 'open', fake_open, raising=False)
+    path = str(tmp_path / 'bank.hms')
+    save_snapshot(path, bank)
+    assert held == [False]
+    assert np.array_equal(load_snapshot(path)[0].codewords, bank.codewords)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Parçalı akış kodlama testleri (tek geçişli çerçeve biçimi)"""
+
+import io
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from hamming_codec import get_codec
+from hamming_stream import FRAME, HEADER, decode_stream, encode_stream, main, read_header
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class PipeLike(io.RawIOBase):
+    """Uzunluğu bilinmeyen, geri sarılamayan ve kısa okumalar yapan akış"""
+    def __init__(self, data, step=1000):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.step = step
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        size = min(len(buffer), self.step, len(self.data) - self.offset)
+        buffer[:size] = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return size
+
+@pytest.mark.parametrize('width', (8, 32, 64, 128))
+@pytest.mark.parametrize('length', (0, 1, 4095, 10001))
+def test_round_trip_unknown_length(width, length):
+    data = os.urandom(length)
+    encoded = io.BytesIO()
+    info = encode_stream(PipeLike(data), encoded, width, chunk_size=1024)
+    assert info['bytes'] == length
+    
+    output = io.BytesIO()
+    stats = decode_stream(PipeLike(encoded.getvalue(), 333), output, chunk_size=700)
+    assert output.getvalue() == data
+    assert stats.words == info['words'] and stats.clean == stats.words
+
+def test_decode_matches_scalar_codec_and_corrects():
+    codec = get_codec(32)
+    data = bytes(range(256)) * 4
+    buffer = io.BytesIO()
+    encode_stream(io.BytesIO(data), buffer, 32)
+    encoded = bytearray(buffer.getvalue())
+    
+    # İlk kelime skaler codec ile aynı kodlanmalı
+    body = HEADER.size + FRAME.size
+    code_bytes = (codec.total_bits + 7) // 8
+    first = int.from_bytes(encoded[body:body + code_bytes], 'little')
+    assert first == codec.encode(int.from_bytes(data[:4], 'little'))
+    
+    encoded[body] ^= 0x04
+    output = io.BytesIO()
+    stats = decode_stream(io.BytesIO(bytes(encoded)), output)
+    assert output.getvalue() == data
+    assert stats.corrected == 1
+
+def test_truncated_stream_raises():
+    buffer = io.BytesIO()
+    encode_stream(io.BytesIO(os.urandom(5000)), buffer, 32)
+    with pytest.raises(ValueError):
+        decode_stream(io.BytesIO(buffer.getvalue()[:-20]), io.BytesIO())
+
+def test_pipe_to_pipe_cli():
+    data = os.urandom(300001)
+    command = [sys.executable, os.path.join(ROOT, 'hamming_stream.py')]
+    encoder = subprocess.Popen(command + ['encode', '-', '-', '--width', '64', '--chunk-size', '65536'],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    decoder = subprocess.Popen(command + ['decode', '-', '-'],
+                               stdin=encoder.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    encoder.stdout.close()
+    
+    # Boru tamponları dolmasın diye girdi ayrı bir iş parçacığından yazılır
+    def feed():
+        encoder.stdin.write(data)
+        encoder.stdin.close()
+    
+    writer = threading.Thread(target=feed)
+    writer.start()
+    output = decoder.stdout.read()
+    writer.join()
+    assert encoder.wait() == 0
+    assert decoder.wait() == 0
+    assert output == data
+
+def test_cli_errors_leave_output_untouched(tmp_path, capsys):
+    output = tmp_path / 'out.bin'
+    output.write_bytes(b'korunmali')
+    missing = str(tmp_path / 'yok.bin')
+    assert main(['encode', missing, str(output)]) == 2
+    assert main(['decode', missing, str(output)]) == 2
+    assert 'Hata' in capsys.readouterr().err
+    
+    # Geçersiz başlık veya genişlik çıktı açılmadan reddedilir
+    garbage = tmp_path / 'bozuk.hmd'
+    garbage.write_bytes(b'XXXX' + bytes(20))
+    assert main(['decode', str(garbage), str(output)]) == 2
+    assert main(['encode', str(garbage), str(output), '--width', '12']) == 2
+    assert output.read_bytes() == b'korunmali'
+    assert main(['decode', missing, str(tmp_path / 'yeni.bin')]) == 2
+    assert not (tmp_path / 'yeni.bin').exists()
+    
+    # Çıktı açılamazsa da (dizin) çıkış kodu 2'dir
+    assert main(['encode', str(garbage), str(tmp_path)]) == 2
+    assert main(['encode', str(garbage), str(output)]) == 0
+    decoded = tmp_path / 'geri.bin'
+    assert main(['decode', str(output), str(decoded)]) == 0
+    assert decoded.read_bytes() == garbage.read_bytes()
+
+@pytest.mark.parametrize('code', ('hamming', 'hsiao'))
+def test_code_stored_in_header(code, tmp_path):
+    data = os.urandom(3001)
+    encoded = io.BytesIO()
+    encode_stream(io.BytesIO(data), encoded, 64, code=code)
+    raw = bytearray(encoded.getvalue())
+    assert read_header(io.BytesIO(raw)) == {'code': code, 'data_bits': 64, 'code_bytes': 9}
+    
+    # Çözücü kodu başlıktan alır; tek hata her iki kodda da düzeltilir
+    raw[HEADER.size + FRAME.size + 9] ^= 0x10
+    output = io.BytesIO()
+    stats = decode_stream(io.BytesIO(bytes(raw)), output, 'mask')
+    assert output.getvalue() == data and stats.corrected == 1
+    
+    # Kod baytı değiştirilirse çözücü diğer kodu kullanır ve kelimeler bozuk görünür
+    raw[5] = 1 - raw[5]
+    stats = decode_stream(io.BytesIO(bytes(raw)), io.BytesIO())
+    assert stats.clean < stats.words
+    raw[5] = 7
+    with pytest.raises(ValueError, match="kod yapısı"):
+        read_header(io.BytesIO(bytes(raw)))
+    
+    source = tmp_path / 'girdi.bin'
+    source.write_bytes(data)
+    assert main(['encode', str(source), str(tmp_path / 'kod.hmd'), '--width', '64', '--code', code]) == 0
+    with open(tmp_path / 'kod.hmd', 'rb') as f:
+        assert read_header(f)['code'] == code
+    assert main(['decode', str(tmp_path / 'kod.hmd'), str(tmp_path / 'geri.bin')]) == 0
+    assert (tmp_path / 'geri.bin').read_bytes() == data
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Artımlı parite güncellemesi ve bayt şeridi yazma testleri"""
+
+import random
+
+import pytest
+
+from hamming_codec import CODES, ENGINES, get_codec
+
+CODECS = [(engine, code, compiled) for engine in ENGINES for code in CODES for compiled in (False, True)]
+WIDTHS = (8, 12, 32, 64, 128)
+
+@pytest.mark.parametrize('engine,code,compiled', CODECS)
+@pytest.mark.parametrize('width', WIDTHS)
+def test_update_matches_reencode(width, engine, code, compiled):
+    codec = get_codec(width, engine, code, compiled)
+    rng = random.Random(width)
+    full = (1 << width) - 1
+    masks = [0, 1, 1 << (width - 1), full, 0xFF & full] + [rng.getrandbits(width) for _ in range(20)]
+    for mask in masks:
+        data = rng.getrandbits(width)
+        assert codec.update(codec.encode(data), mask) == codec.encode(data ^ mask)
+    with pytest.raises(ValueError):
+        codec.update(codec.encode(0), 1 << width)
+
+@pytest.mark.parametrize('engine,code,compiled', CODECS)
+@pytest.mark.parametrize('width', WIDTHS)
+def test_write_bytes_matches_patched_data(width, engine, code, compiled):
+    codec = get_codec(width, engine, code, compiled)
+    rng = random.Random(width + 1)
+    lanes = (width + 7) // 8
+    for offset in range(lanes):
+        for length in range(1, lanes - offset + 1):
+            data = rng.getrandbits(width)
+            values = bytearray(rng.getrandbits(8) for _ in range(length))
+            if offset + length == lanes and width % 8:
+                # Kısmi son şerit: yazılan baytlar veri genişliğine sığmalı
+                values[-1] &= (1 << (width % 8)) - 1
+            raw = bytearray(data.to_bytes(lanes, 'little'))
+            raw[offset:offset + length] = values
+            expected = codec.encode(int.from_bytes(raw, 'little'))
+            assert codec.write_bytes(codec.encode(data), offset, values) == expected
+
+@pytest.mark.parametrize('engine,code,compiled', CODECS)
+@pytest.mark.parametrize('width', WIDTHS)
+def test_verify_corrects_single_error_first(width, engine, code, compiled):
+    codec = get_codec(width, engine, code, compiled)
+    data = ((0x0123456789ABCDEF << 64) | 0xFEDCBA9876543210) & ((1 << width) - 1)
+    mask = 0x5A & ((1 << width) - 1)
+    for position in (0, 3, codec.total_bits // 2, codec.total_bits - 1):
+        damaged = codec.inject_error(codec.encode(data), position)
+        assert codec.update(damaged, mask, verify=True) == codec.encode(data ^ mask)
+        assert codec.write_bytes(damaged, 0, b'\x42', verify=True) == codec.encode(data & ~0xFF | 0x42)
+        # verify kapalıyken hata değişiklikten sonra da korunur
+        assert codec.update(damaged, mask) == codec.inject_error(codec.encode(data ^ mask), position)
+
+@pytest.mark.parametrize('engine,code,compiled', CODECS)
+@pytest.mark.parametrize('width', WIDTHS)
+def test_verify_rejects_double_error(width, engine, code, compiled):
+    codec = get_codec(width, engine, code, compiled)
+    damaged = codec.encode(0x5 & ((1 << width) - 1)) ^ 0b101
+    word = damaged
+    with pytest.raises(ValueError):
+        word = codec.update(word, 1, verify=True)
+    with pytest.raises(ValueError):
+        word = codec.write_bytes(word, 0, b'\x01', verify=True)
+    assert word == damaged
+
+@pytest.mark.parametrize('engine,code,compiled', CODECS)
+@pytest.mark.parametrize('width', WIDTHS)
+def test_write_bytes_range_checks(width, engine, code, compiled):
+    codec = get_codec(width, engine, code, compiled)
+    word = codec.encode(0)
+    lanes = (width + 7) // 8
+    with pytest.raises(ValueError):
+        codec.write_bytes(word, lanes, b'\x01')
+    with pytest.raises(ValueError):
+        codec.write_bytes(word, 0, bytes(lanes + 1))
+    with pytest.raises(ValueError):
+        codec.write_bytes(word, lanes - 1, b'\x01\x02')
+    with pytest.raises(ValueError):
+        codec.write_bytes(word, -1, b'\x01')
+    if width % 8:
+        # Kısmi son şeritte veri genişliğini aşan bitler reddedilir
+        with pytest.raises(ValueError):
+            codec.write_bytes(word, lanes - 1, b'\xFF')
+    assert codec.write_bytes(word, lanes - 1, b'') == word
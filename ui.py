@@ -6,19 +6,45 @@ Hamming SEC-DED Simülatörü için PyQt5 tabanlı kullanıcı arayüzü
 
 import sys
 import math
+import time
+
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QComboBox, QLineEdit, QPushButton,
                              QTableWidget, QTableWidgetItem, QGroupBox, QGridLayout,
-                             QMessageBox, QSpinBox, QFrame, QScrollArea)
-from PyQt5.QtCore import Qt, QTimer
+                             QMessageBox, QSpinBox, QFrame, QScrollArea, QFileDialog)
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker
 from PyQt5.QtGui import QColor, QPalette, QFont
 
 # Hamming kodlayıcı modülünü içe aktar
-from hamming_codec import HammingCodec
+from hamming_codec import SUPPORTED_WIDTHS, get_codec
+from hamming_events import EVENT_CORRECTED, EVENT_UNCORRECTABLE, EventLog
+from hamming_memory import MemoryBank
+from hamming_patterns import PATTERNS
+from hamming_scrub import PatrolScrubber
+from hamming_snapshot import load_snapshot, save_snapshot
 
 # FAQ modülünü içe aktar
 from faq import FAQDialog
 
+# Simüle edilen bellekteki adres sayısı
+MEMORY_WORDS = 1 << 20
+
+# Bellek tablosunda sayfa başına satır
+MEMORY_PAGE_ROWS = 256
+
+# Devriye taramasında tam geçiş süresi (sn) ve durum yoklama aralığı (ms)
+SCRUB_PASS_SECONDS = 4
+SCRUB_POLL_MS = 500
+
+# Hata olay kaydında sayfa boyutu (kelime) ve raporda gösterilen en sık adres/sayfa
+EVENT_PAGE_WORDS = 512
+EVENT_REPORT_TOP = 10
+
+# Anlık görüntü dosya filtreleri (ikincisi sıkıştırılmış)
+SNAPSHOT_FILTER = "Bellek anlık görüntüsü (*.hms)"
+SNAPSHOT_ZLIB_FILTER = "Sıkıştırılmış bellek anlık görüntüsü (*.hmsz)"
+
 # Ana pencere sınıfı
 class HammingSimulatorUI(QMainWindow):
     def __init__(self):
@@ -35,7 +61,7 @@ class HammingSimulatorUI(QMainWindow):
         
         # Hamming kodlayıcı
         self.bit_length = 16  # Varsayılan 16 bit
-        self.codec = HammingCodec(self.bit_length)
+        self.codec = get_codec(self.bit_length)
         
         # Durum bilgisi
         self.current_data = {
@@ -45,8 +71,19 @@ class HammingSimulatorUI(QMainWindow):
             'error_position': None  # Hata pozisyonu
         }
         
-        # Bellek (simüle edilmiş)
-        self.memory = {}
+        # Bellek (simüle edilmiş, adres başına kodlanmış kelime)
+        self.memory = MemoryBank(self.bit_length, MEMORY_WORDS, self.codec.engine)
+        self.memory_page = 0
+        self.last_bulk = None  # Son toplu yazma (doğrulama için)
+        
+        # Hata olay kaydı (düzeltmeler ve tarama bulguları)
+        self.events = EventLog(page_words=EVENT_PAGE_WORDS)
+        
+        # Arka plan devriye taraması (durum QTimer ile yoklanır)
+        self.scrubber = PatrolScrubber(self.memory, pass_interval=SCRUB_PASS_SECONDS, events=self.events)
+        self.scrub_pass_seen = 0
+        self.scrub_timer = QTimer(self)
+        self.scrub_timer.timeout.connect(self.poll_scrubber)
         
         # Kontrol paneli
         self.create_control_panel()
@@ -69,9 +106,6 @@ class HammingSimulatorUI(QMainWindow):
         # Durum çubuğu
         self.statusBar().showMessage("Hazır")
         
-        # Bellek simülasyonu (adres:veri şeklinde sözlük)
-        self.memory = {}
-        
     def create_control_panel(self):
         """Kontrol panelini oluşturur: Bit seçimi ve veri girişi"""
         control_group = QGroupBox("Kontrol Paneli")
@@ -80,8 +114,8 @@ class HammingSimulatorUI(QMainWindow):
         # Bit uzunluğu seçimi
         bit_label = QLabel("Bit Uzunluğu:")
         self.bit_combo = QComboBox()
-        self.bit_combo.addItems(["8 bit", "16 bit", "32 bit"])
-        self.bit_combo.setCurrentIndex(1)  # Varsayılan 16 bit
+        self.bit_combo.addItems([f"{width} bit" for width in SUPPORTED_WIDTHS])
+        self.bit_combo.setCurrentIndex(SUPPORTED_WIDTHS.index(16))  # Varsayılan 16 bit
         
         # Veri girişi (ikili veya hex)
         data_label = QLabel("Veri Girişi:")
@@ -91,7 +125,7 @@ class HammingSimulatorUI(QMainWindow):
         # Adres alanı
         addr_label = QLabel("Bellek Adresi:")
         self.addr_input = QSpinBox()
-        self.addr_input.setRange(0, 1023)  # 0-1023 arası adresler
+        self.addr_input.setRange(0, self.memory.size - 1)
         
         # Butonlar
         self.encode_button = QPushButton("Kodla ve Belleğe Yaz")
@@ -99,6 +133,10 @@ class HammingSimulatorUI(QMainWindow):
         self.error_inject_button = QPushButton("Hata Oluştur")
         self.error_correct_button = QPushButton("Hata Tespit/Düzelt")
         
+        # Anlık görüntü butonları
+        self.save_button = QPushButton("Belleği Kaydet")
+        self.load_button = QPushButton("Bellek Yükle")
+        
         # FAQ butonu
         self.faq_button = QPushButton("Yardım ve S.S.S.")
         
@@ -113,7 +151,9 @@ class HammingSimulatorUI(QMainWindow):
         control_layout.addWidget(self.read_button, 3, 1)
         control_layout.addWidget(self.error_inject_button, 3, 2)
         control_layout.addWidget(self.error_correct_button, 3, 3)
-        control_layout.addWidget(self.faq_button, 4, 0, 1, 4)
+        control_layout.addWidget(self.save_button, 4, 0)
+        control_layout.addWidget(self.load_button, 4, 1)
+        control_layout.addWidget(self.faq_button, 4, 2, 1, 2)
         
         control_group.setLayout(control_layout)
         self.main_layout.addWidget(control_group)
@@ -184,14 +224,47 @@ class HammingSimulatorUI(QMainWindow):
         labels_layout.addWidget(encoded_label)
         labels_layout.addWidget(self.encoded_value_label)
         
+        # Devriye tarama kontrolü
+        scrub_layout = QHBoxLayout()
+        self.scrub_button = QPushButton("Devriye Taramayı Başlat")
+        self.scrub_label = QLabel("Devriye tarama kapalı")
+        self.event_log_button = QPushButton("Hata Kayıtları")
+        scrub_layout.addWidget(self.scrub_button)
+        scrub_layout.addWidget(self.scrub_label)
+        scrub_layout.addWidget(self.event_log_button)
+        scrub_layout.addStretch()
+        
+        # Toplu işlemler
+        bulk_layout = QHBoxLayout()
+        self.fill_button = QPushButton("Desen Doldur")
+        self.file_write_button = QPushButton("Dosyadan Yaz")
+        self.verify_button = QPushButton("Toplu Doğrula")
+        bulk_layout.addWidget(self.fill_button)
+        bulk_layout.addWidget(self.file_write_button)
+        bulk_layout.addWidget(self.verify_button)
+        bulk_layout.addStretch()
+        
         # Bellek tablosu
         self.memory_table = QTableWidget(0, 3)
         self.memory_table.setHorizontalHeaderLabels(["Adres", "Kodlanmış Veri", "Orijinal Veri"])
         self.memory_table.horizontalHeader().setStretchLastSection(True)
         self.memory_table.setSelectionBehavior(QTableWidget.SelectRows)
         
+        # Sayfa gezinme
+        page_layout = QHBoxLayout()
+        self.prev_page_button = QPushButton("◀ Önceki")
+        self.next_page_button = QPushButton("Sonraki ▶")
+        self.page_label = QLabel("Sayfa 1 / 1 (0 adres)")
+        page_layout.addWidget(self.prev_page_button)
+        page_layout.addWidget(self.page_label)
+        page_layout.addWidget(self.next_page_button)
+        page_layout.addStretch()
+        
         memory_layout.addLayout(labels_layout)
+        memory_layout.addLayout(scrub_layout)
+        memory_layout.addLayout(bulk_layout)
         memory_layout.addWidget(self.memory_table)
+        memory_layout.addLayout(page_layout)
         memory_group.setLayout(memory_layout)
         self.main_layout.addWidget(memory_group)
         
@@ -324,8 +397,8 @@ class HammingSimulatorUI(QMainWindow):
                         bit_box['value_frame'].setStyleSheet('background-color: #a0d0ff; border-radius: 6px; border: 1px solid #0080ff;')  # Açık mavi
                         bit_box['label'].setStyleSheet("font-size: 16px; font-weight: bold; color: black;")
     
-    def add_history_item(self, operation, status):
-        """Geçmiş tablosuna yeni bir giriş ekler"""
+    def add_history_item(self, operation, status, timestamp=None):
+        """Geçmiş tablosuna yeni bir giriş ekler (zaman verilmezse şimdiki saat)"""
         row = self.history_table.rowCount()
         self.history_table.insertRow(row)
         
@@ -339,20 +412,34 @@ class HammingSimulatorUI(QMainWindow):
         self.history_table.setItem(row, 2, QTableWidgetItem(status))
         
         # Zaman
-        import datetime
-        now = datetime.datetime.now().strftime("%H:%M:%S")
-        self.history_table.setItem(row, 3, QTableWidgetItem(now))
+        if timestamp is None:
+            import datetime
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        self.history_table.setItem(row, 3, QTableWidgetItem(timestamp))
         
         # Son eklenen satıra kaydır
         self.history_table.scrollToBottom()
     
-    def update_memory_table(self):
-        """Bellek tablosunu günceller"""
+    def update_memory_table(self, address=None):
+        """
+        Bellek tablosunun geçerli sayfasını günceller
+        
+        Yalnızca yazılmış adresler, sayfa başına MEMORY_PAGE_ROWS satır olarak
+        gösterilir; adres verilirse o adresi içeren sayfaya geçilir.
+        """
+        addresses = self.memory.addresses()
+        pages = max(1, -(-len(addresses) // MEMORY_PAGE_ROWS))
+        if address is not None:
+            self.memory_page = int(np.searchsorted(addresses, address)) // MEMORY_PAGE_ROWS
+        self.memory_page = min(max(0, self.memory_page), pages - 1)
+        first = self.memory_page * MEMORY_PAGE_ROWS
+        
         # Tabloyu temizle
         self.memory_table.setRowCount(0)
         
-        # Bellek içeriğini tabloya ekle
-        for addr, data in sorted(self.memory.items()):
+        # Sayfadaki adresleri tabloya ekle
+        for addr in addresses[first:first + MEMORY_PAGE_ROWS]:
+            addr = int(addr)
             row = self.memory_table.rowCount()
             self.memory_table.insertRow(row)
             
@@ -360,16 +447,26 @@ class HammingSimulatorUI(QMainWindow):
             self.memory_table.setItem(row, 0, QTableWidgetItem(str(addr)))
             
             # Kodlanmış veri
-            encoded_hex = hex(data['encoded'])
+            encoded_hex = hex(self.memory.read_raw(addr))
             self.memory_table.setItem(row, 1, QTableWidgetItem(encoded_hex))
             
-            # Orijinal veri
-            original_hex = hex(data['original'])
+            # Orijinal veri (kelimenin kod çözümünden)
+            original_hex = hex(self.memory.read(addr).original_data)
             self.memory_table.setItem(row, 2, QTableWidgetItem(original_hex))
         
-        # Son eklenen satıra kaydır
-        if self.memory_table.rowCount() > 0:
-            self.memory_table.scrollToBottom()
+        self.page_label.setText(f"Sayfa {self.memory_page + 1} / {pages} ({len(addresses)} adres)")
+        self.prev_page_button.setEnabled(self.memory_page > 0)
+        self.next_page_button.setEnabled(self.memory_page < pages - 1)
+        
+        # Son yazılan adresin satırına kaydır
+        if address is not None and address in self.memory:
+            row = int(np.searchsorted(addresses, address)) - first
+            self.memory_table.scrollToItem(self.memory_table.item(row, 0))
+    
+    def change_memory_page(self, step):
+        """Bellek tablosunda önceki (-1) veya sonraki (+1) sayfaya geçer"""
+        self.memory_page += step
+        self.update_memory_table()
             
     def connect_signals(self):
         """Buton ve diğer kontroller için sinyal bağlantılarını oluşturur"""
@@ -382,21 +479,28 @@ class HammingSimulatorUI(QMainWindow):
         self.error_inject_button.clicked.connect(self.inject_error)
         self.error_correct_button.clicked.connect(self.detect_and_correct_error)
         self.faq_button.clicked.connect(self.show_faq)
+        self.scrub_button.clicked.connect(self.toggle_scrubber)
+        self.event_log_button.clicked.connect(self.show_event_log)
+        self.save_button.clicked.connect(self.save_memory)
+        self.load_button.clicked.connect(self.load_memory)
+        self.fill_button.clicked.connect(self.fill_pattern)
+        self.file_write_button.clicked.connect(self.write_from_file)
+        self.verify_button.clicked.connect(self.verify_bulk)
+        self.prev_page_button.clicked.connect(lambda: self.change_memory_page(-1))
+        self.next_page_button.clicked.connect(lambda: self.change_memory_page(1))
     
     def bit_length_changed(self):
         """Bit uzunluğu değiştiğinde Hamming kodlayıcıyı günceller"""
         index = self.bit_combo.currentIndex()
         
         # Bit uzunluğunu ayarla
-        if index == 0:
-            self.bit_length = 8
-        elif index == 1:
-            self.bit_length = 16
-        else:
-            self.bit_length = 32
+        self.bit_length = SUPPORTED_WIDTHS[index]
         
-        # Codec'i yeniden oluştur
-        self.codec = HammingCodec(self.bit_length)
+        # Önbellekteki hazır codec'e geç (tablolar yeniden hesaplanmaz)
+        self.codec = get_codec(self.bit_length)
+        
+        # Kelime boyutu değiştiğinden bellek sıfırlanır
+        self.replace_memory(MemoryBank(self.bit_length, MEMORY_WORDS, self.codec.engine))
         
         # Bit kutularını yeniden oluştur
         self.create_bit_boxes(self.codec.total_bits)
@@ -405,6 +509,164 @@ class HammingSimulatorUI(QMainWindow):
         bit_values = [0] * self.codec.total_bits
         self.update_bit_display(bit_values)
             
+    def replace_memory(self, bank):
+        """Simüle belleği verilen bankayla değiştirir; tarayıcı yeni bellekte sürer"""
+        was_scrubbing = self.scrubber.running
+        self.scrubber.stop()
+        self.memory = bank
+        self.events.clear()
+        self.scrubber = PatrolScrubber(self.memory, pass_interval=SCRUB_PASS_SECONDS, events=self.events)
+        self.scrub_pass_seen = 0
+        if was_scrubbing:
+            self.scrubber.start()
+        
+        self.addr_input.setRange(0, bank.size - 1)
+        self.memory_page = 0
+        self.last_bulk = None
+        self.current_data = {
+            'original': None,
+            'encoded': None,
+            'address': None,
+            'error_position': None
+        }
+        self.update_memory_table()
+    
+    def history_rows(self):
+        """Geçmiş tablosunun satırlarını [işlem, durum, zaman] listesi olarak döndürür"""
+        return [[self.history_table.item(row, column).text() for column in (1, 2, 3)]
+                for row in range(self.history_table.rowCount())]
+    
+    def save_memory(self):
+        """Belleği ve işlem geçmişini ikili anlık görüntü dosyasına kaydeder"""
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Belleği Kaydet", "", f"{SNAPSHOT_FILTER};;{SNAPSHOT_ZLIB_FILTER}")
+        if not path:
+            return
+        compress = selected == SNAPSHOT_ZLIB_FILTER or path.endswith('.hmsz')
+        
+        try:
+            save_snapshot(path, self.memory, self.history_rows(), compress)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {str(e)}")
+            return
+        
+        self.add_history_item("Bellek Kaydedildi", f"{self.memory.valid_count()} adres: {path}")
+        self.statusBar().showMessage(f"Bellek kaydedildi: {path}")
+    
+    def load_memory(self):
+        """Anlık görüntü dosyasından belleği ve işlem geçmişini yükler"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Bellek Yükle", "", "Bellek anlık görüntüsü (*.hms *.hmsz);;Tüm dosyalar (*)")
+        if not path:
+            return
+        
+        try:
+            bank, history = load_snapshot(path)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Yükleme hatası: {str(e)}")
+            return
+        if bank.width not in SUPPORTED_WIDTHS:
+            QMessageBox.warning(self, "Uyarı", f"{bank.width} bitlik bellek arayüzde desteklenmiyor!")
+            return
+        
+        # Seçim kutusu sinyalsiz güncellenir: boş bir banka oluşturulmadan
+        # doğrudan yüklenen belleğe geçilir
+        blocker = QSignalBlocker(self.bit_combo)
+        self.bit_combo.setCurrentIndex(SUPPORTED_WIDTHS.index(bank.width))
+        blocker.unblock()
+        self.bit_length = bank.width
+        self.codec = bank.codec
+        self.replace_memory(bank)
+        self.create_bit_boxes(self.codec.total_bits)
+        self.update_bit_display([0] * self.codec.total_bits)
+        
+        self.history_table.setRowCount(0)
+        for operation, status, timestamp in history:
+            self.add_history_item(operation, status, timestamp)
+        self.add_history_item("Bellek Yüklendi", f"{bank.valid_count()} adres: {path}")
+        self.statusBar().showMessage(f"Bellek yüklendi: {path}")
+    
+    def fill_pattern(self):
+        """Bir adres aralığını bellek testi deseniyle toplu olarak doldurur"""
+        pattern, ok = QInputBox.getItem(self, "Desen Doldur", "Desen:", PATTERNS)
+        if not ok:
+            return
+        start, ok = QInputBox.getInt(self, "Desen Doldur", "Başlangıç adresi:",
+                                     self.addr_input.value(), 0, self.memory.size - 1, 1)
+        if not ok:
+            return
+        count, ok = QInputBox.getInt(self, "Desen Doldur", "Kelime sayısı:",
+                                     self.memory.size - start, 1, self.memory.size - start, 1)
+        if not ok:
+            return
+        seed = 0
+        if pattern == 'random':
+            seed, ok = QInputBox.getInt(self, "Desen Doldur", "Tohum:", 1, 0, 2**31 - 1, 1)
+            if not ok:
+                return
+        
+        started = time.perf_counter()
+        self.memory.fill(start, count, pattern, seed)
+        elapsed = time.perf_counter() - started
+        self.last_bulk = ('pattern', start, count, pattern, seed)
+        
+        self.update_memory_table(start)
+        self.add_history_item(
+            "Desen Doldurma",
+            f"{pattern}: {start}-{start + count - 1} ({count} kelime, {elapsed * 1000:.1f} ms)"
+        )
+        self.statusBar().showMessage(f"{count} adres '{pattern}' deseniyle dolduruldu")
+    
+    def write_from_file(self):
+        """Dosyanın ham içeriğini seçili adresten itibaren belleğe yazar"""
+        path, _ = QFileDialog.getOpenFileName(self, "Dosyadan Belleğe Yaz", "", "Tüm dosyalar (*)")
+        if not path:
+            return
+        start = self.addr_input.value()
+        
+        try:
+            started = time.perf_counter()
+            count = self.memory.write_file(path, start)
+            elapsed = time.perf_counter() - started
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Dosyadan yazma hatası: {str(e)}")
+            return
+        self.last_bulk = ('file', start, path)
+        
+        self.update_memory_table(start)
+        self.add_history_item(
+            "Dosyadan Yazma",
+            f"{path}: {start}-{start + count - 1} ({count} kelime, {elapsed * 1000:.1f} ms)"
+        )
+        self.statusBar().showMessage(f"{count} kelime dosyadan belleğe yazıldı")
+    
+    def verify_bulk(self):
+        """Son toplu yazmayı bellekten okuyup beklenen veriyle karşılaştırır"""
+        if self.last_bulk is None:
+            QMessageBox.warning(self, "Uyarı", "Önce desen doldurun veya dosyadan yazın!")
+            return
+        
+        try:
+            if self.last_bulk[0] == 'pattern':
+                _, start, count, pattern, seed = self.last_bulk
+                report = self.memory.verify_pattern(start, count, pattern, seed)
+            else:
+                _, start, path = self.last_bulk
+                report = self.memory.verify_file(path, start)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Doğrulama hatası: {str(e)}")
+            return
+        
+        summary = (f"{report.words} kelime: {report.mismatched} uyuşmayan, "
+                   f"{report.corrected} düzeltilebilir hata, {report.uncorrectable} düzeltilemez")
+        message = f"Toplu Doğrulama Sonucu:\n{summary}"
+        if report.mismatch_addresses:
+            message += "\nİlk uyuşmayan adresler: " + ", ".join(str(a) for a in report.mismatch_addresses[:16])
+        
+        self.add_history_item("Toplu Doğrulama", summary)
+        QMessageBox.information(self, "Toplu Doğrulama", message)
+        self.statusBar().showMessage("Doğrulama başarılı" if report.ok else "Doğrulama hatası: uyuşmayan adresler var")
+    
     def parse_data_input(self):
         """Kullanıcının girdiği veriyi işler"""
         data_str = self.data_input.text().strip()
@@ -458,17 +720,13 @@ class HammingSimulatorUI(QMainWindow):
             }
             
             # Bit kutularını güncelle
-            positions = self.codec.get_data_and_parity_positions()
             self.update_bit_display([int(b) for b in bin(encoded_data)[2:].zfill(self.codec.total_bits)])
             
             # Belleğe yaz
-            self.memory[address] = {
-                'original': data,
-                'encoded': encoded_data
-            }
+            self.memory.write_raw(address, encoded_data)
             
             # Tabloları güncelle
-            self.update_memory_table()
+            self.update_memory_table(address)
             
             # Değer etiketlerini güncelle
             self.data_value_label.setText(hex(data))
@@ -492,7 +750,10 @@ class HammingSimulatorUI(QMainWindow):
         
         if address in self.memory:
             # Bellekteki veriyi al
-            data = self.memory[address]
+            data = {
+                'original': self.memory.read(address).original_data,
+                'encoded': self.memory.read_raw(address)
+            }
             
             # Mevcut veriyi güncelle
             self.current_data = {
@@ -503,7 +764,6 @@ class HammingSimulatorUI(QMainWindow):
             }
             
             # Bit kutularını güncelle
-            positions = self.codec.get_data_and_parity_positions()
             self.update_bit_display([int(b) for b in bin(data['encoded'])[2:].zfill(self.codec.total_bits)])
             
             # Değer etiketlerini güncelle
@@ -553,7 +813,7 @@ class HammingSimulatorUI(QMainWindow):
             
             # Belleği güncelle
             if address in self.memory:
-                self.memory[address]['encoded'] = error_data
+                self.memory.write_raw(address, error_data)
             
             # Bit kutularını güncelle
             self.update_bit_display([int(b) for b in bin(error_data)[2:].zfill(self.codec.total_bits)], error_pos)
@@ -562,7 +822,7 @@ class HammingSimulatorUI(QMainWindow):
             self.encoded_value_label.setText(hex(error_data))
             
             # Tabloları güncelle
-            self.update_memory_table()
+            self.update_memory_table(address)
             
             # Geçmişe ekle
             self.add_history_item(
@@ -576,6 +836,73 @@ class HammingSimulatorUI(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Hata enjekte etme hatası: {str(e)}")
     
+    def toggle_scrubber(self):
+        """Arka plan devriye taramasını başlatır veya durdurur"""
+        if self.scrubber.running:
+            self.scrubber.stop()
+            self.scrub_timer.stop()
+            self.scrub_button.setText("Devriye Taramayı Başlat")
+            self.scrub_label.setText("Devriye tarama kapalı")
+            self.add_history_item("Devriye Tarama", "Durduruldu")
+        else:
+            self.scrubber.start()
+            self.scrub_timer.start(SCRUB_POLL_MS)
+            self.scrub_button.setText("Devriye Taramayı Durdur")
+            self.add_history_item("Devriye Tarama", f"Başlatıldı (tam geçiş {SCRUB_PASS_SECONDS} sn)")
+    
+    def poll_scrubber(self):
+        """Tarayıcı durumunu gösterir; tamamlanan geçişte yeni hata bulunduysa geçmişe ekler"""
+        snapshot = self.scrubber.snapshot()
+        percent = 100 * snapshot['position'] // snapshot['size']
+        total = snapshot['total']
+        self.scrub_label.setText(
+            f"Geçiş {snapshot['passes'] + 1}: %{percent} | "
+            f"Toplam düzeltilen: {total['written']}, düzeltilemez: {total['new_uncorrectable']}"
+        )
+        
+        last = snapshot['last_pass']
+        if last is None or last['pass'] == self.scrub_pass_seen:
+            return
+        self.scrub_pass_seen = last['pass']
+        
+        # Önceki geçişlerde raporlanmış düzeltilemez adresler yeniden eklenmez
+        if last['written'] or last['new_uncorrectable']:
+            self.add_history_item(
+                f"Devriye Tarama (geçiş {last['pass']})",
+                f"{last['written']} kelime düzeltildi, {last['new_uncorrectable']} yeni düzeltilemez"
+            )
+            self.update_memory_table()
+    
+    def show_event_log(self):
+        """Hata olay kaydının özetini gösterir (en sık hata veren adresler ve bitler)"""
+        summary = self.events.summary()
+        message = (f"Düzeltilen (CE): {summary['corrected']}, düzeltilemez (UE): {summary['uncorrectable']}\n"
+                   f"Tamponda {summary['buffered']} olay ({summary['dropped']} eski olay düştü), "
+                   f"{summary['addresses']} farklı adres\n")
+        
+        hot = self.events.hot_addresses(EVENT_REPORT_TOP)
+        if hot:
+            message += "\nEn sık hata veren adresler:\n"
+            message += "\n".join(
+                f"  {address}: {count} olay ({self.events.uncorrectable_count(address)} UE)"
+                for address, count in hot)
+            message += f"\n\nEn sık hata veren sayfalar ({EVENT_PAGE_WORDS} kelime):\n"
+            message += "\n".join(
+                f"  {page * EVENT_PAGE_WORDS}-{(page + 1) * EVENT_PAGE_WORDS - 1}: {count} olay"
+                for page, count in self.events.hot_pages(EVENT_REPORT_TOP))
+        
+        bits = self.events.bit_counts()
+        if bits:
+            message += "\n\nBit pozisyonu başına düzeltmeler:\n  "
+            message += ", ".join(f"{position}: {count}" for position, count in bits.items())
+        
+        QMessageBox.information(self, "Hata Kayıtları", message)
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken arka plan taramasını durdurur"""
+        self.scrubber.stop()
+        super().closeEvent(event)
+    
     def show_faq(self):
         """FAQ penceresini gösterir"""
         faq_dialog = FAQDialog(self)
@@ -612,8 +939,8 @@ class HammingSimulatorUI(QMainWindow):
                 self.current_data['error_position'] = None
                 
                 if address in self.memory:
-                    self.memory[address]['encoded'] = result['corrected_data']
-                    self.memory[address]['original'] = result['original_data']
+                    self.memory.write_raw(address, result['corrected_data'])
+                    self.events.record(address, EVENT_CORRECTED, result['error_position'])
                     
                 # Bit kutularını güncelle
                 self.update_bit_display([int(b) for b in bin(result['corrected_data'])[2:].zfill(self.codec.total_bits)])
@@ -623,7 +950,7 @@ class HammingSimulatorUI(QMainWindow):
                 self.encoded_value_label.setText(hex(result['corrected_data']))
                 
                 # Tabloları güncelle
-                self.update_memory_table()
+                self.update_memory_table(address)
                 
                 # Geçmişe ekle
                 self.add_history_item(
@@ -631,9 +958,12 @@ class HammingSimulatorUI(QMainWindow):
                     f"Pozisyon {result['error_position']}, Veri: {hex(result['original_data'])}"
                 )
                 
-            elif result['error_type'] == 'double':
+            elif result['error_type'] in ('double', 'unknown'):
                 message += "İki bitlik hata tespit edildi, düzeltilemiyor!"
                 
+                if address in self.memory:
+                    self.events.record(address, EVENT_UNCORRECTABLE)
+                
                 # Geçmişe ekle
                 self.add_history_item(
                     "Çift Hata Tespiti", 
@@ -671,6 +1001,12 @@ class QInputBox:
         value, ok = QInputDialog.getInt(parent, title, label, value, min_val, max_val, step)
         return value, ok
 
+    @staticmethod
+    def getItem(parent, title, label, items, current=0):
+        from PyQt5.QtWidgets import QInputDialog
+        item, ok = QInputDialog.getItem(parent, title, label, list(items), current, False)
+        return item, ok
+
 # Ana fonksiyon
 def main():
     app = QApplication(sys.argv)